@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Applicant, Job, Resume, Score
+from .models import (
+    Applicant, ExtractedResumeText, Job, RescoreRun, Resume, ResumeAnalysis, Score, Skill,
+    SkillAlias,
+)
 
 
 # ----------------- APPLICANT ADMIN -----------------
@@ -18,6 +21,22 @@ class JobAdmin(admin.ModelAdmin):
     # You already use job.title and job.required_skills in views/templates.
     list_display = ("id", "title", "required_skills")
     search_fields = ("title", "required_skills")
+    # derived from required_skills on save (core.signals), not edited directly
+    exclude = ("skill_tags",)
+
+
+# ----------------- SKILL TAXONOMY -----------------
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+@admin.register(Skill)
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ("id", "name")
+    search_fields = ("name", "aliases__name")
+    inlines = [SkillAliasInline]
 
 
 # ----------------- RESUME ADMIN -----------------
@@ -28,6 +47,7 @@ class ResumeAdmin(admin.ModelAdmin):
     # We know you have: user, file, skills
     list_display = ("id", "user", "file", "skills")
     search_fields = ("user__username", "user__email", "skills")
+    exclude = ("skill_tags",)   # derived from skills by the analysis pipeline
     # Remove uploaded_at from list_filter because it doesn't exist
     # list_filter = ("uploaded_at",)  # ❌ causing error
     # If you later add created_at field in Resume, you can enable:
@@ -38,12 +58,14 @@ class ResumeAdmin(admin.ModelAdmin):
 
 @admin.action(description="Mark selected scores as SHORTLISTED")
 def make_shortlisted(modeladmin, request, queryset):
-    queryset.update(is_shortlisted=True, status="SHORTLISTED")
+    updated = queryset.decide("SHORTLISTED")
+    modeladmin.message_user(request, f"{updated} application(s) shortlisted (drafts are skipped).")
 
 
 @admin.action(description="Mark selected scores as REJECTED")
 def make_rejected(modeladmin, request, queryset):
-    queryset.update(is_shortlisted=False, status="REJECTED")
+    updated = queryset.decide("REJECTED")
+    modeladmin.message_user(request, f"{updated} application(s) rejected (drafts are skipped).")
 
 
 @admin.register(Score)
@@ -60,7 +82,34 @@ class ScoreAdmin(admin.ModelAdmin):
     list_filter = ("job", "status", "is_shortlisted")
     search_fields = (
         "job__title",
-        "resume__user__username",
-        "resume__user__email",
+        "user__username",
+        "user__email",
     )
     actions = [make_shortlisted, make_rejected]
+
+
+# ----------------- RESCORE RUNS -----------------
+
+@admin.register(RescoreRun)
+class RescoreRunAdmin(admin.ModelAdmin):
+    list_display = ("id", "job", "status", "processed", "total", "attempts", "created_at", "finished_at")
+    list_filter = ("status",)
+    readonly_fields = ("job", "status", "total", "processed", "attempts", "error", "created_at", "finished_at")
+
+
+# ----------------- RESUME ANALYSIS QUEUE -----------------
+
+@admin.register(ResumeAnalysis)
+class ResumeAnalysisAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "file_name", "status", "attempts", "scores_created", "created_at", "finished_at")
+    list_filter = ("status",)
+    search_fields = ("user__username", "file_name")
+
+
+# ----------------- EXTRACTION CACHE -----------------
+
+@admin.register(ExtractedResumeText)
+class ExtractedResumeTextAdmin(admin.ModelAdmin):
+    list_display = ("sha256", "file_type", "extractor_version", "size", "hits", "last_used_at")
+    list_filter = ("file_type", "extractor_version")
+    search_fields = ("sha256",)
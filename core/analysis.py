@@ -0,0 +1,146 @@
+"""
+Resume analysis pipeline: text extraction → validation → skill
+extraction → scoring against every job.
+
+Used inline by upload_resume and by the background worker
+(manage.py run_worker).
+"""
+
+import hashlib
+
+from . import extraction, resume_cache, taxonomy
+from .scoring import create_draft_scores
+from .skills import extract_skills_from_text, get_extractor
+
+
+# bump whenever text or skill extraction changes, so cached results are recomputed
+EXTRACTOR_VERSION = "4"
+
+
+def extractor_version():
+    """Cache key version: EXTRACTOR_VERSION plus the configured skill engine."""
+    engine = get_extractor()
+    return f"{EXTRACTOR_VERSION}-{getattr(engine, 'name', type(engine).__name__)}"[:20]
+
+
+def extract_text_from_resume(uploaded_file):
+    """
+    Read text from an uploaded resume file (PDF/DOCX/others).
+    Returns plain text.
+    """
+    file_bytes = uploaded_file.read()
+    uploaded_file.seek(0)  # reset pointer so Django can save the file
+    return extract_text_from_bytes(uploaded_file.name, file_bytes)
+
+
+def extract_text_from_bytes(filename, file_bytes):
+    """
+    Same as extract_text_from_resume, for content already read into memory.
+    Parsing happens in the extraction process pool (see core.extraction).
+    """
+    return extraction.extract(filename, file_bytes).text
+
+
+RESUME_KEYWORDS = [
+    "education", "experience", "skills", "project",
+    "b.tech", "btech", "bachelor", "masters", "internship",
+    "curriculum vitae", "resume"
+]
+
+
+class ResumeRejected(Exception):
+    """
+    The file was read fine but is not usable (not a resume / no skills).
+    The message is shown to the applicant; retrying will not help.
+    """
+
+
+# =========================
+#        PIPELINE
+# =========================
+
+def extract_resume(filename, file_bytes):
+    """
+    (text, extracted skills) for a resume file. Identical uploads are
+    served from the content-hash cache without parsing the file again.
+    """
+    version = extractor_version()
+    cached = resume_cache.get(filename, file_bytes, version)
+    if cached is not None:
+        return cached
+
+    result = extraction.extract(filename, file_bytes)
+    if result.status == extraction.TOO_LARGE:
+        raise ResumeRejected(
+            f"The uploaded file is too large to analyse ({result.error}). "
+            "Please upload a shorter resume."
+        )
+    if result.status == extraction.TIMEOUT:
+        raise ResumeRejected(
+            "The uploaded file took too long to read. "
+            "Please upload a simpler PDF or a DOCX version of your resume."
+        )
+    if not result.ok:
+        # crashed extraction process: let the queue retry it
+        raise RuntimeError(f"Resume extraction failed: {result.error}")
+
+    text = result.text
+    skills = extract_skills_from_text(text.strip())
+    resume_cache.put(filename, file_bytes, version, text, skills)
+    return text, skills
+
+
+def content_hash(file_bytes):
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def read_resume_file(resume):
+    """(text, extracted skills) for the file stored on a Resume row; also sets resume.sha256."""
+    with resume.file.open("rb") as f:
+        file_bytes = f.read()
+    resume.sha256 = content_hash(file_bytes)
+    return extract_resume(resume.file.name, file_bytes)
+
+
+def validate_resume_text(text):
+    """Basic validation to ensure it looks like a resume."""
+    cleaned = (text or "").strip()
+    if len(cleaned) < 200 or not any(k in cleaned.lower() for k in RESUME_KEYWORDS):
+        raise ResumeRejected(
+            "The uploaded file does not look like a valid resume. "
+            "Please upload a proper resume (PDF/DOCX) with your details."
+        )
+    return cleaned
+
+
+def build_skills_text(extracted_skills, extra_skills=""):
+    """Auto-extracted skills plus the optional ones typed by the user."""
+    if not extracted_skills:
+        raise ResumeRejected(
+            "No technical skills were detected in your resume. "
+            "Please clearly list your skills (e.g. 'Python, Django, SQL') "
+            "in your resume and upload again."
+        )
+
+    all_skills = [extracted_skills]
+    extra_skills = (extra_skills or "").strip()
+    if extra_skills:
+        all_skills.append(extra_skills)
+    return ", ".join(all_skills)
+
+
+def analyse_resume(resume, extra_skills=""):
+    """
+    Run the full pipeline for a saved Resume: fill in resume.skills and
+    create DRAFT scores for jobs not applied yet. Returns the number of
+    Score rows created. Raises ResumeRejected for unusable files.
+    """
+    text, extracted_skills = read_resume_file(resume)
+    validate_resume_text(text)
+    skills_text = build_skills_text(extracted_skills, extra_skills)
+
+    resume.skills = skills_text
+    resume.save(update_fields=["skills", "sha256"])
+    taxonomy.sync_resume(resume)
+
+    return create_draft_scores(resume, skills_text)
@@ -0,0 +1,113 @@
+"""
+Packed skill bitsets: every row's Skill ids as a bitmask over the skill
+vocabulary, stored as one uint64 matrix.
+
+For one resume against the whole job catalog, coverage and missing skills
+are then a single vectorized pass:
+    missing   = jobs & ~resume        (one AND-NOT per 64 skills per job)
+    matched   = popcount(jobs & resume)
+    required  = popcount(jobs)         (precomputed)
+instead of building and diffing two Python sets per job.
+
+Imports numpy, so core.taxonomy loads this module on first use only.
+"""
+
+import numpy as np
+
+_WORD_BITS = 64
+
+
+class SkillMatrix:
+    """
+    Rows of Skill id sets (usually the skill_tags of every Job, in the
+    job index order) packed into an (n_rows, n_words) uint64 matrix.
+    """
+
+    def __init__(self, ids, skill_id_sets):
+        self.ids = list(ids)
+        skill_id_sets = [frozenset(s) for s in skill_id_sets]
+        # column of every skill id used by any row
+        self.skill_ids = np.array(sorted(set().union(*skill_id_sets)), dtype=np.int64)
+        self.columns = {int(skill_id): col for col, skill_id in enumerate(self.skill_ids)}
+        self.n_words = max(1, -(-len(self.skill_ids) // _WORD_BITS))
+
+        rows, cols = [], []
+        for row, skills in enumerate(skill_id_sets):
+            rows.extend([row] * len(skills))
+            cols.extend(self.columns[s] for s in skills)
+        self.bits = self._pack(np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64), len(self.ids))
+        self.required = np.bitwise_count(self.bits).sum(axis=1, dtype=np.int64)
+
+    def _pack(self, rows, cols, n_rows):
+        bits = np.zeros((n_rows, self.n_words), dtype=np.uint64)
+        # distinct (row, col) pairs, so adding the bit values is an OR
+        np.add.at(bits, (rows, cols // _WORD_BITS), np.left_shift(np.uint64(1), (cols % _WORD_BITS).astype(np.uint64)))
+        return bits
+
+    def __len__(self):
+        return len(self.ids)
+
+    def encode(self, skill_ids):
+        """(n_words,) bitmask of `skill_ids`; ids no row uses are dropped (they can't matter)."""
+        cols = np.asarray([self.columns[s] for s in skill_ids if s in self.columns], dtype=np.int64)
+        return self._pack(np.zeros(len(cols), dtype=np.int64), cols, 1)[0]
+
+    def coverage(self, skill_ids):
+        """(matched, required) int arrays: per row, how many of its skills `skill_ids` covers."""
+        query = self.encode(skill_ids)
+        matched = np.bitwise_count(self.bits & query).sum(axis=1, dtype=np.int64)
+        return matched, self.required
+
+    def missing_bits(self, skill_ids):
+        """(n_rows, n_words) bitmasks of every row's skills not in `skill_ids`."""
+        return self.bits & ~self.encode(skill_ids)
+
+    def missing_ids(self, skill_ids, rows=None):
+        """Per row (all, or the given row indices): tuple of its Skill ids not in `skill_ids`."""
+        missing = self.missing_bits(skill_ids) if rows is None else self.bits[rows] & ~self.encode(skill_ids)
+        return self.decode(missing)
+
+    def decode(self, bitmasks):
+        """
+        Tuples of the Skill ids set in each row of an (n, n_words) bitmask
+        array. Only the set bits are visited: every round peels the lowest
+        set bit off all non-zero words at once.
+        """
+        rows, words = np.nonzero(bitmasks)
+        values = bitmasks[rows, words]
+        offsets = words.astype(np.int64) * _WORD_BITS
+        found_rows, found_cols = [rows[:0]], [offsets[:0]]
+        while values.size:
+            lowest = values & (~values + np.uint64(1))
+            found_rows.append(rows)
+            # a power of two converts to float64 exactly
+            found_cols.append(offsets + np.log2(lowest.astype(np.float64)).astype(np.int64))
+            values = values ^ lowest
+            keep = values != 0
+            rows, offsets, values = rows[keep], offsets[keep], values[keep]
+
+        rows, cols = np.concatenate(found_rows), np.concatenate(found_cols)
+        order = np.lexsort((cols, rows))
+        ids = self.skill_ids[cols[order]].tolist()
+        result, start = [], 0
+        for count in np.bincount(rows, minlength=len(bitmasks)).tolist():
+            result.append(tuple(ids[start:start + count]))
+            start += count
+        return result
+
+    def missing_labels(self, skill_ids, row_labels, label):
+        """
+        Per row, label(ids of its skills not in `skill_ids`), where
+        row_labels[i] is label() of row i's full skill set. Rows the query
+        covers none of reuse row_labels, fully covered rows get label(());
+        only partially covered rows are decoded.
+        """
+        matched, required = self.coverage(skill_ids)
+        labels = list(row_labels)
+        covered = label(())
+        for row in np.flatnonzero(matched == required).tolist():
+            labels[row] = covered
+        partial = np.flatnonzero((matched > 0) & (matched < required))
+        for row, ids in zip(partial.tolist(), self.missing_ids(skill_ids, partial)):
+            labels[row] = label(ids)
+        return labels
@@ -0,0 +1,57 @@
+"""
+Versioned cache keys on top of django.core.cache.
+
+Every key lives in a namespace ("jobs", "scores", "applied:42", ...)
+whose current version is itself a cache entry. bump(namespace) moves the
+namespace to a new version, which orphans all of its old keys at once –
+they are never read again and age out by timeout / LRU – so dropping
+"everything derived from the job table" is one write on any backend.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "ns:{namespace}"
+
+
+def version(namespace):
+    """Current version number of `namespace`."""
+    key = VERSION_KEY.format(namespace=namespace)
+    current = cache.get(key)
+    if current is None:
+        # start from the clock, so a version entry that was evicted can't
+        # come back as a number whose keys are still cached
+        cache.add(key, time.time_ns() // 1000, None)
+        current = cache.get(key)
+    return current
+
+
+def make_key(namespace, *parts):
+    """'namespace:v<version>:part:part…' for the namespace's current version."""
+    return ":".join([namespace, f"v{version(namespace)}", *map(str, parts)])
+
+
+def bump(namespace):
+    key = VERSION_KEY.format(namespace=namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # no version stored yet: nothing under this namespace to orphan
+        version(namespace)
+
+
+def bump_on_commit(namespace):
+    """bump() once the current transaction commits (right away outside one)."""
+    transaction.on_commit(lambda: bump(namespace))
+
+
+def get_or_set(namespace, parts, default, timeout=None):
+    """Cached value of make_key(namespace, *parts), computing it with default() on a miss."""
+    key = make_key(namespace, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = default()
+        cache.set(key, value, timeout)
+    return value
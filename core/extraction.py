@@ -0,0 +1,265 @@
+"""
+Resume text extraction in a pool of pre-started child processes.
+
+PDF/DOCX parsing runs outside the web/worker process so a pathological
+file cannot pin it: every document gets a hard timeout (the child is
+killed and replaced), a page cap and an address-space limit per child.
+Each call returns an ExtractionResult with status "ok", "timeout",
+"too_large" or "error".
+
+This module deliberately does not touch Django models, so children only
+import the parsing libraries.
+"""
+
+import atexit
+import io
+import multiprocessing
+import os
+import queue
+import threading
+from dataclasses import dataclass
+
+
+OK = "ok"
+TIMEOUT = "timeout"
+TOO_LARGE = "too_large"
+ERROR = "error"
+
+
+@dataclass
+class ExtractionResult:
+    status: str
+    text: str = ""
+    pages: int = 0
+    error: str = ""
+
+    @property
+    def ok(self):
+        return self.status == OK
+
+
+# =========================
+#   PARSING (child side)
+# =========================
+
+def _extract_pdf(file_bytes, max_pages):
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(io.BytesIO(file_bytes))
+    n_pages = len(reader.pages)
+    if max_pages and n_pages > max_pages:
+        return ExtractionResult(TOO_LARGE, pages=n_pages, error=f"{n_pages} pages (limit {max_pages})")
+
+    text = ""
+    for page in reader.pages:
+        page_text = page.extract_text() or ""
+        text += page_text + "\n"
+    return ExtractionResult(OK, text=text, pages=n_pages)
+
+
+def _extract_docx(file_bytes):
+    from docx import Document
+
+    doc = Document(io.BytesIO(file_bytes))
+    return ExtractionResult(OK, text="\n".join(p.text for p in doc.paragraphs), pages=1)
+
+
+def extract_in_process(filename, file_bytes, max_pages=0):
+    """
+    Parse one document in the current process (no timeout / memory limit).
+    Parser failures give an "ok" result with empty text, like the original
+    extract_text_from_resume did.
+    """
+    filename = (filename or "").lower()
+    try:
+        if filename.endswith(".pdf"):
+            return _extract_pdf(file_bytes, max_pages)
+        if filename.endswith(".docx"):
+            return _extract_docx(file_bytes)
+        # fallback for txt-like files
+        return ExtractionResult(OK, text=file_bytes.decode(errors="ignore"), pages=1)
+    except MemoryError:
+        return ExtractionResult(TOO_LARGE, error="memory limit exceeded")
+    except Exception:
+        return ExtractionResult(OK, text="")
+
+
+def _child_main(conn, memory_limit):
+    import signal
+
+    # Ctrl+C / SIGTERM handling belongs to the parent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_limit:
+        import resource
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+    while True:
+        try:
+            filename, file_bytes, max_pages = conn.recv()
+        except (EOFError, OSError):
+            return
+        except MemoryError:
+            conn.send(ExtractionResult(TOO_LARGE, error="memory limit exceeded"))
+            continue
+        conn.send(extract_in_process(filename, file_bytes, max_pages))
+
+
+# =========================
+#     POOL (parent side)
+# =========================
+
+class _Child:
+    def __init__(self, ctx, memory_limit):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_child_main, args=(child_conn, memory_limit), daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class ExtractionPool:
+    """
+    Fixed set of extraction children. extract() checks out an idle child,
+    hands it one document and waits at most `timeout` seconds; a child
+    that overruns or dies is killed and replaced, so the other children
+    (and requests) are unaffected.
+    """
+
+    def __init__(self, size=2, timeout=20.0, max_pages=30, max_file_bytes=10 * 1024 * 1024,
+                 memory_limit=512 * 1024 * 1024, max_tasks_per_child=100, start_method=None):
+        self.size = size
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.max_file_bytes = max_file_bytes
+        self.memory_limit = memory_limit
+        self.max_tasks_per_child = max_tasks_per_child
+
+        if start_method is None:
+            methods = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in methods else "spawn"
+        self._ctx = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            self._ctx.set_forkserver_preload([__name__])
+
+        self._idle = queue.Queue()
+        self._children = []
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _start(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # first use, or we are a forked copy of the process that owned the children
+            self._children = []
+            self._idle = queue.Queue()
+            for _ in range(self.size):
+                self._add_child()
+            self._pid = os.getpid()
+
+    def _add_child(self):
+        child = _Child(self._ctx, self.memory_limit)
+        self._children.append(child)
+        self._idle.put(child)
+
+    def _replace(self, child):
+        child.kill()
+        with self._lock:
+            if child in self._children:
+                self._children.remove(child)
+            self._add_child()
+
+    def extract(self, filename, file_bytes):
+        if self.max_file_bytes and len(file_bytes) > self.max_file_bytes:
+            return ExtractionResult(
+                TOO_LARGE, error=f"{len(file_bytes)} bytes (limit {self.max_file_bytes})",
+            )
+
+        self._start()
+        child = self._idle.get()
+        try:
+            child.conn.send((filename, file_bytes, self.max_pages))
+            if not child.conn.poll(self.timeout):
+                self._replace(child)
+                return ExtractionResult(TIMEOUT, error=f"no result after {self.timeout}s")
+            result = child.conn.recv()
+        except (EOFError, OSError) as exc:
+            # the child died, most likely killed by the memory limit
+            self._replace(child)
+            return ExtractionResult(ERROR, error=f"extraction process died: {exc!r}")
+
+        child.tasks += 1
+        if self.max_tasks_per_child and child.tasks >= self.max_tasks_per_child:
+            self._replace(child)
+        else:
+            self._idle.put(child)
+        return result
+
+    def shutdown(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                for child in self._children:
+                    child.kill()
+            self._children = []
+            self._idle = queue.Queue()
+            self._pid = None
+
+
+# =========================
+#       SHARED POOL
+# =========================
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def make_pool(size=None):
+    """
+    A new pool configured from SKILLMATCH_EXTRACTION_* settings; `size`
+    overrides SKILLMATCH_EXTRACTION_WORKERS. Call shutdown() when done.
+    """
+    from django.conf import settings
+
+    return ExtractionPool(
+        size=size or getattr(settings, "SKILLMATCH_EXTRACTION_WORKERS", 2),
+        timeout=getattr(settings, "SKILLMATCH_EXTRACTION_TIMEOUT", 20.0),
+        max_pages=getattr(settings, "SKILLMATCH_EXTRACTION_MAX_PAGES", 30),
+        max_file_bytes=getattr(settings, "SKILLMATCH_EXTRACTION_MAX_FILE_BYTES", 10 * 1024 * 1024),
+        memory_limit=getattr(settings, "SKILLMATCH_EXTRACTION_MEMORY_LIMIT", 512 * 1024 * 1024),
+        max_tasks_per_child=getattr(settings, "SKILLMATCH_EXTRACTION_MAX_TASKS_PER_CHILD", 100),
+    )
+
+
+def get_pool():
+    """The process-wide pool, configured from SKILLMATCH_EXTRACTION_* settings."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = make_pool()
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def extract(filename, file_bytes):
+    """
+    Extract text from one resume file. With SKILLMATCH_EXTRACTION_WORKERS = 0
+    the document is parsed in-process (page and size caps still apply).
+    """
+    from django.conf import settings
+
+    if getattr(settings, "SKILLMATCH_EXTRACTION_WORKERS", 2) <= 0:
+        max_file_bytes = getattr(settings, "SKILLMATCH_EXTRACTION_MAX_FILE_BYTES", 10 * 1024 * 1024)
+        if max_file_bytes and len(file_bytes) > max_file_bytes:
+            return ExtractionResult(TOO_LARGE, error=f"{len(file_bytes)} bytes (limit {max_file_bytes})")
+        return extract_in_process(
+            filename, file_bytes, getattr(settings, "SKILLMATCH_EXTRACTION_MAX_PAGES", 30),
+        )
+    return get_pool().extract(filename, file_bytes)
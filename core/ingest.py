@@ -0,0 +1,195 @@
+"""
+Bulk import of resume files (manage.py ingest_resumes).
+
+Files are read and hashed in this process, parsed in parallel by an
+extraction pool (one feeding thread per child), and then written one
+batch at a time: skill extraction (one batched call), Resume rows, skill
+links and DRAFT scores, each with bulk inserts in a single transaction. Files whose
+content (SHA-256) or storage name is already on a Resume are skipped.
+While one batch is written the next one is already being parsed.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+
+from . import extraction, taxonomy
+from .analysis import ResumeRejected, build_skills_text, content_hash, validate_resume_text
+from .matching import get_job_index
+from .models import Resume
+from .scoring import BULK_CREATE_BATCH_SIZE, build_draft_scores, save_draft_scores
+from .skills import extract_skills_many
+
+RESUME_SUFFIXES = (".pdf", ".docx", ".txt")
+
+
+@dataclass
+class IngestStats:
+    files: int = 0          # parsed (duplicates and unreadable files excluded)
+    pages: int = 0          # of successfully parsed files
+    imported: int = 0
+    scores: int = 0
+    duplicates: list = field(default_factory=list)
+    errors: list = field(default_factory=list)      # (path, reason)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def rate(self, count):
+        return count / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class _Document:
+    path: Path
+    data: bytes
+    sha256: str
+    storage_name: str = ""    # set when the file already lives in MEDIA_ROOT
+
+
+def find_resume_files(directory):
+    """Resume files under `directory`, recursively, in path order."""
+    return sorted(
+        p for p in Path(directory).rglob("*")
+        if p.is_file() and p.suffix.lower() in RESUME_SUFFIXES
+    )
+
+
+def _storage_name(path):
+    try:
+        return path.resolve().relative_to(Path(settings.MEDIA_ROOT).resolve()).as_posix()
+    except ValueError:
+        return ""
+
+
+def _read(paths, seen, stats):
+    """Documents for `paths` minus unreadable files and content already imported."""
+    docs = []
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except OSError as exc:
+            stats.errors.append((str(path), f"unreadable: {exc}"))
+            continue
+        docs.append(_Document(path, data, content_hash(data), _storage_name(path)))
+
+    known = set(
+        Resume.objects.filter(sha256__in=[d.sha256 for d in docs]).values_list("sha256", flat=True)
+    ) | set(
+        # rows uploaded before content hashes were stored
+        Resume.objects.filter(file__in=[d.storage_name for d in docs if d.storage_name])
+        .values_list("file", flat=True)
+    )
+    fresh = []
+    for doc in docs:
+        if doc.sha256 in seen or doc.sha256 in known or doc.storage_name in known:
+            stats.duplicates.append(str(doc.path))
+            continue
+        seen.add(doc.sha256)
+        fresh.append(doc)
+    return fresh
+
+
+def _analyse(doc, result, stats, validate):
+    """Resume text of one parsed document, or None (recorded in stats.errors)."""
+    stats.files += 1
+    if not result.ok:
+        stats.errors.append((str(doc.path), f"{result.status}: {result.error}"))
+        return None
+    stats.pages += result.pages
+    text = result.text.strip()
+    try:
+        if validate:
+            validate_resume_text(text)
+        return text
+    except ResumeRejected as exc:
+        stats.errors.append((str(doc.path), str(exc)))
+        return None
+
+
+def _write(rows, status):
+    """Resume, skill link and Score rows for [(document, skills text)]; returns the scores created."""
+    if not rows:
+        return 0
+    resumes = []
+    for doc, skills_text in rows:
+        name = doc.storage_name or default_storage.save(f"resumes/{doc.path.name}", ContentFile(doc.data))
+        resumes.append(Resume(file=name, skills=skills_text, sha256=doc.sha256))
+
+    job_index = get_job_index()
+    with transaction.atomic():
+        if connection.features.can_return_rows_from_bulk_insert:
+            Resume.objects.bulk_create(resumes, batch_size=BULK_CREATE_BATCH_SIZE)
+        else:
+            for resume in resumes:
+                resume.save()
+
+        Through = Resume.skill_tags.through
+        Through.objects.bulk_create(
+            [
+                Through(resume_id=resume.id, skill_id=skill_id)
+                for resume, skill_ids in zip(resumes, taxonomy.parse_many([r.skills for r in resumes]))
+                for skill_id in skill_ids
+            ],
+            batch_size=BULK_CREATE_BATCH_SIZE,
+        )
+
+        drafts = []
+        for resume in resumes:
+            drafts += build_draft_scores(resume, resume.skills, job_index)
+        for draft in drafts:
+            draft.status = status
+        save_draft_scores(drafts)
+    return len(drafts)
+
+
+def ingest(paths, pool=None, batch_size=200, status="DRAFT", validate=True, progress=None):
+    """
+    Import resume files `paths`, parsed by extraction `pool` (default: the
+    shared one, or in-process with SKILLMATCH_EXTRACTION_WORKERS = 0).
+    Scores are created with `status` (DRAFT, or SUBMITTED to show them to
+    recruiters right away). progress(stats) is called after every parsed
+    file. Returns IngestStats.
+    """
+    extract = pool.extract if pool else extraction.extract
+    threads = pool.size if pool else max(1, getattr(settings, "SKILLMATCH_EXTRACTION_WORKERS", 2))
+    stats = IngestStats()
+    seen = set()
+
+    def finish(docs, futures):
+        parsed = []
+        for doc, future in zip(docs, futures):
+            text = _analyse(doc, future.result(), stats, validate)
+            if text is not None:
+                parsed.append((doc, text))
+            if progress:
+                progress(stats)
+        # one call per batch, so the spaCy engine can use nlp.pipe
+        rows = []
+        for (doc, _), skills in zip(parsed, extract_skills_many([text for _, text in parsed])):
+            try:
+                rows.append((doc, build_skills_text(skills)))
+            except ResumeRejected as exc:
+                stats.errors.append((str(doc.path), str(exc)))
+        stats.scores += _write(rows, status)
+        stats.imported += len(rows)
+
+    with ThreadPoolExecutor(threads) as executor:
+        pending = None
+        for start in range(0, len(paths), batch_size):
+            docs = _read(paths[start:start + batch_size], seen, stats)
+            futures = [executor.submit(extract, doc.path.name, doc.data) for doc in docs]
+            if pending:
+                finish(*pending)
+            pending = (docs, futures)
+        if pending:
+            finish(*pending)
+    return stats
@@ -0,0 +1,66 @@
+"""
+Cached reads for the public job list.
+
+The job catalog is the same for every visitor, so it is cached once; each
+applicant additionally gets a small cached set of the job ids they have
+applied to (SUBMITTED or later). Both live under versioned namespaces
+(core.cache) that the signals in core.signals bump when a Job is saved /
+deleted or a Score enters or leaves DRAFT; entries also expire after
+SKILLMATCH_JOB_CACHE_TIMEOUT seconds as a safety net for writes that
+bypass signals (bulk_create, queryset.update).
+"""
+
+from django.conf import settings
+
+from .cache import bump_on_commit, get_or_set, version
+from .models import Job, Score
+
+JOBS_NAMESPACE = "jobs"
+APPLIED_NAMESPACE = "applied:{user_id}"
+APPLIED_STATUSES = ["SUBMITTED", "SHORTLISTED", "REJECTED"]
+
+
+def _timeout():
+    return getattr(settings, "SKILLMATCH_JOB_CACHE_TIMEOUT", 600)
+
+
+def get_jobs():
+    """Every Job, in id order."""
+    return get_or_set(
+        JOBS_NAMESPACE, ["catalog"], lambda: list(Job.objects.order_by("id")), _timeout(),
+    )
+
+
+def get_applied_job_ids(user):
+    """Ids of the jobs `user` has an application past DRAFT for."""
+    if user is None or not user.is_authenticated:
+        return frozenset()
+    return get_or_set(
+        APPLIED_NAMESPACE.format(user_id=user.id),
+        ["job_ids"],
+        lambda: frozenset(
+            Score.objects
+            .filter(user=user, status__in=APPLIED_STATUSES)
+            .values_list("job_id", flat=True)
+        ),
+        _timeout(),
+    )
+
+
+def fragment_version():
+    """
+    Vary-on value for the cached job_list fragment: the catalog version only,
+    so every visitor shares it (the Applied badges are rendered outside it).
+    """
+    return version(JOBS_NAMESPACE)
+
+
+def invalidate_jobs():
+    # after commit, so a concurrent request can't re-cache the old rows
+    bump_on_commit(JOBS_NAMESPACE)
+
+
+def invalidate_applied(user_id):
+    if user_id is None:
+        return
+    bump_on_commit(APPLIED_NAMESPACE.format(user_id=user_id))
@@ -0,0 +1,254 @@
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from core import analysis, extraction, matching, resume_cache, scoring, taxonomy
+from core.cache import bump
+from core.job_catalog import JOBS_NAMESPACE
+from core.models import Job, Resume
+from core.skills import SKILL_KEYWORDS
+from core.tasks import enqueue_analysis, run_inline
+
+STAGES = [
+    "store", "analysis",
+    # inside analysis (core.analysis.analyse_resume); a cache hit skips extract_text … cache_store
+    "cache_lookup", "extract_text", "extract_skills", "cache_store", "tag_skills", "score", "persist",
+]
+
+# (module, function) the production pipeline calls through, timed as a stage
+TIMED_CALLS = [
+    (resume_cache, "get", "cache_lookup"),
+    (extraction, "extract", "extract_text"),
+    (analysis, "extract_skills_from_text", "extract_skills"),
+    (resume_cache, "put", "cache_store"),
+    (taxonomy, "sync_resume", "tag_skills"),
+    (scoring, "build_draft_scores", "score"),
+    (scoring, "save_draft_scores", "persist"),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(timings_s, queries):
+    ms = [t * 1000 for t in timings_s]
+    return {
+        "count": len(ms),
+        "total_ms": round(sum(ms), 3),
+        "mean_ms": round(sum(ms) / len(ms), 3) if ms else None,
+        "p50_ms": round(percentile(ms, 50), 3) if ms else None,
+        "p95_ms": round(percentile(ms, 95), 3) if ms else None,
+        "p99_ms": round(percentile(ms, 99), 3) if ms else None,
+        "queries_total": sum(queries),
+        "queries_per_resume": round(sum(queries) / len(queries), 2) if queries else None,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR,
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def synthetic_resume_text(rng, n_skills):
+    skills = rng.sample(SKILL_KEYWORDS, n_skills)
+    return (
+        "Curriculum Vitae\n"
+        f"Education: B.Tech in Computer Science, batch {rng.randint(2015, 2025)}\n"
+        "Experience: internship and projects building web services and data pipelines.\n"
+        f"Skills: {', '.join(skills)}\n"
+        "Project: " + " ".join(rng.choice(SKILL_KEYWORDS) for _ in range(30)) + "\n"
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "End-to-end benchmark of the upload pipeline: every upload is stored and "
+        "queued like upload_resume does, then analysed through the task queue "
+        "inline (core.tasks.run_inline), with each stage of core.analysis timed "
+        "(extraction cache → text extraction → skill extraction → skill tags → "
+        "scoring → persistence). Synthetic jobs, users and resumes; everything "
+        "runs in a transaction that is rolled back and files go to a temporary "
+        "MEDIA_ROOT. Prints JSON comparable across commits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, default=1000)
+        parser.add_argument(
+            "--resumes", type=int, default=100,
+            help="Uploads to push through the pipeline, each by a new user (so each scores every job).",
+        )
+        parser.add_argument("--skills-per-job", type=int, default=6)
+        parser.add_argument(
+            "--pdf-dir", default=None,
+            help="Cycle through real PDF/DOCX files from this directory instead of synthetic text resumes.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", default=None, help="Also write the JSON report to this file.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            try:
+                with transaction.atomic():
+                    report = self._run(rng, options)
+                    raise _Rollback
+            except _Rollback:
+                pass
+            finally:
+                # the synthetic jobs are gone again: drop every index built over them
+                bump(JOBS_NAMESPACE)
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            Path(options["output"]).write_text(output + "\n")
+        self.stdout.write(output)
+
+    def _documents(self, rng, options):
+        if options["pdf_dir"]:
+            paths = sorted(
+                p for p in Path(options["pdf_dir"]).iterdir()
+                if p.suffix.lower() in (".pdf", ".docx", ".txt")
+            )
+            files = [(p.name, p.read_bytes()) for p in paths]
+            return [files[i % len(files)] for i in range(options["resumes"])]
+        return [
+            (f"resume_{i}.txt", synthetic_resume_text(rng, rng.randint(3, 10)).encode())
+            for i in range(options["resumes"])
+        ]
+
+    def _run(self, rng, options):
+        # ---- seed data (not timed) ----
+        seed_start = time.perf_counter()
+        Job.objects.bulk_create(
+            [
+                Job(
+                    title=f"Bench job {i}",
+                    required_skills=", ".join(rng.sample(SKILL_KEYWORDS, options["skills_per_job"])),
+                    description="synthetic",
+                )
+                for i in range(options["jobs"])
+            ],
+            batch_size=500,
+        )
+        bump(JOBS_NAMESPACE)   # bulk_create sends no signals
+        stamp = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        User.objects.bulk_create(
+            [User(username=f"bench-{stamp}-{i}@example.com") for i in range(options["resumes"])],
+            batch_size=500,
+        )
+        # one applicant per upload: a second upload by the same user would only
+        # draft the jobs it has not applied to yet, i.e. none
+        users = list(User.objects.filter(username__startswith=f"bench-{stamp}-").order_by("id"))
+        documents = self._documents(rng, options)
+        seed_s = time.perf_counter() - seed_start
+
+        # job index build is a one-off per catalog change; measure it apart from uploads
+        index_start = time.perf_counter()
+        job_index = matching.get_job_index()
+        index_build_s = time.perf_counter() - index_start
+
+        timings = defaultdict(list)
+        queries = defaultdict(list)
+        end_to_end = []
+        end_to_end_queries = []
+        rejected = 0            # rejected files and failed analyses
+        scores_created = 0
+
+        def timed(name, fn):
+            def wrapper(*args, **kwargs):
+                with CaptureQueriesContext(connection) as ctx:
+                    start = time.perf_counter()
+                    result = fn(*args, **kwargs)
+                    timings[name].append(time.perf_counter() - start)
+                queries[name].append(len(ctx.captured_queries))
+                return result
+            return wrapper
+
+        def store(user, name, data):
+            resume = Resume.objects.create(user=user, file=ContentFile(data, name=name))
+            return enqueue_analysis(resume)
+
+        with ExitStack() as stack:
+            for module, attr, name in TIMED_CALLS:
+                original = getattr(module, attr)
+                setattr(module, attr, timed(name, original))
+                stack.callback(setattr, module, attr, original)
+
+            run_start = time.perf_counter()
+            for user, (name, data) in zip(users, documents):
+                with CaptureQueriesContext(connection) as upload_ctx:
+                    upload_start = time.perf_counter()
+                    task = timed("store", store)(user, name, data)
+                    task = timed("analysis", run_inline)(task)
+                    end_to_end.append(time.perf_counter() - upload_start)
+                end_to_end_queries.append(len(upload_ctx.captured_queries))
+                if task.status == "DONE":
+                    scores_created += task.scores_created
+                else:
+                    rejected += 1
+        run_s = time.perf_counter() - run_start
+        return {
+            "meta": {
+                "git_revision": git_revision(),
+                "timestamp": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+                "cpu_count": os.cpu_count(),
+            },
+            "params": {
+                "jobs": options["jobs"],
+                "resumes": options["resumes"],
+                "skills_per_job": options["skills_per_job"],
+                "source": options["pdf_dir"] or "synthetic-text",
+                "seed": options["seed"],
+            },
+            "setup": {
+                "seed_ms": round(seed_s * 1000, 3),
+                "job_index_build_ms": round(index_build_s * 1000, 3),
+                "job_index_size": len(job_index),
+            },
+            "stages": {name: summarize(timings[name], queries[name]) for name in STAGES},
+            "end_to_end": summarize(end_to_end, end_to_end_queries),
+            "throughput": {
+                "resumes_per_s": round(len(documents) / run_s, 3) if run_s else None,
+                "scores_per_s": round(scores_created / run_s, 3) if run_s else None,
+            },
+            "outcome": {
+                "resumes": len(documents),
+                "rejected": rejected,
+                "scores_created": scores_created,
+            },
+        }
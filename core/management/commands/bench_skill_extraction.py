@@ -0,0 +1,109 @@
+import json
+import random
+import string
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.skills import SKILL_KEYWORDS
+from core.skills.automaton import SkillAutomaton
+from core.skills.regex import SkillRegex
+
+
+def substring_loop(vocabulary, text):
+    """The original substring-per-skill loop (core.skills.substring) over an arbitrary vocabulary."""
+    text_lower = text.lower()
+    return {skill for skill in vocabulary if skill in text_lower}
+
+
+def synthetic_vocabulary(size, rng):
+    words = set(SKILL_KEYWORDS)
+    while len(words) < size:
+        n_words = rng.choice((1, 1, 1, 2))
+        words.add(" ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+            for _ in range(n_words)
+        ))
+    return sorted(words)
+
+
+def synthetic_resume(vocabulary, length, rng):
+    filler = ["experience", "project", "team", "built", "using", "with", "and", "the", "in"]
+    parts, size = [], 0
+    while size < length:
+        word = rng.choice(vocabulary) if rng.random() < 0.1 else rng.choice(filler)
+        parts.append(word)
+        size += len(word) + 1
+    return " ".join(parts)
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the Aho-Corasick and compiled-regex skill matchers against "
+        "the original substring loop for growing vocabularies and resume sizes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--vocab-sizes", default="39,1000,10000,30000")
+        parser.add_argument("--text-sizes", default="2000,20000")
+        parser.add_argument("--docs", type=int, default=20, help="Resumes per measurement.")
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        results = []
+
+        for vocab_size in [int(v) for v in options["vocab_sizes"].split(",")]:
+            vocabulary = synthetic_vocabulary(vocab_size, rng)
+
+            start = time.perf_counter()
+            automaton = SkillAutomaton(vocabulary)
+            build_s = time.perf_counter() - start
+            start = time.perf_counter()
+            regex = SkillRegex(vocabulary)
+            regex_build_s = time.perf_counter() - start
+
+            for text_size in [int(t) for t in options["text_sizes"].split(",")]:
+                docs = [synthetic_resume(vocabulary, text_size, rng) for _ in range(options["docs"])]
+
+                loop_s = best_of(options["repeat"], lambda: [substring_loop(vocabulary, d) for d in docs])
+                automaton_s = best_of(options["repeat"], lambda: [automaton.find_all(d) for d in docs])
+                regex_s = best_of(options["repeat"], lambda: [regex.find_all(d) for d in docs])
+
+                results.append({
+                    "vocab_size": len(vocabulary),
+                    "text_chars": text_size,
+                    "docs": len(docs),
+                    "automaton_build_ms": round(build_s * 1000, 2),
+                    "substring_ms_per_doc": round(loop_s / len(docs) * 1000, 3),
+                    "automaton_ms_per_doc": round(automaton_s / len(docs) * 1000, 3),
+                    "speedup": round(loop_s / automaton_s, 2) if automaton_s else None,
+                    "regex_build_ms": round(regex_build_s * 1000, 2),
+                    "regex_ms_per_doc": round(regex_s / len(docs) * 1000, 3),
+                })
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'vocab':>7} {'chars':>7} {'build ms':>9} {'loop ms/doc':>12} {'AC ms/doc':>10} {'speedup':>8}"
+            f" {'re build ms':>12} {'re ms/doc':>10}"
+        )
+        for r in results:
+            self.stdout.write(
+                f"{r['vocab_size']:>7} {r['text_chars']:>7} {r['automaton_build_ms']:>9} "
+                f"{r['substring_ms_per_doc']:>12} {r['automaton_ms_per_doc']:>10} {r['speedup']:>8}"
+                f" {r['regex_build_ms']:>12} {r['regex_ms_per_doc']:>10}"
+            )
@@ -0,0 +1,113 @@
+import json
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.bitsets import SkillMatrix
+from core.management.commands.bench_skill_extraction import best_of
+
+
+def synthetic_catalog(n_jobs, vocab_size, skills_per_job, rng):
+    """Job skill id sets drawn from a skewed vocabulary (a few skills are in most jobs)."""
+    weights = [1.0 / (rank + 1) for rank in range(vocab_size)]
+    skill_ids = list(range(1, vocab_size + 1))
+    return [
+        frozenset(rng.choices(skill_ids, weights, k=rng.randint(1, skills_per_job)))
+        for _ in range(n_jobs)
+    ]
+
+
+def join(names, ids):
+    return ", ".join(sorted(names[i] for i in ids))
+
+
+def sets_missing(jobs, resume, names):
+    """Per-job set difference in a Python loop (what upload scoring did before)."""
+    return [join(names, job - resume) for job in jobs]
+
+
+def bitset_missing(matrix, full_texts, resume, names):
+    """The same texts from SkillMatrix: one AND / popcount pass, only partly covered jobs decoded."""
+    return matrix.missing_labels(resume, full_texts, lambda ids: join(names, ids))
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark missing-skill / coverage computation for one resume against "
+        "the whole job catalog: per-job Python set differences vs. the packed "
+        "bitset matrix (core.bitsets), on synthetic catalogs of growing size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", default="1000,10000,50000", help="Catalog sizes.")
+        parser.add_argument("--vocab-size", type=int, default=500, help="Distinct skills.")
+        parser.add_argument("--skills-per-job", type=int, default=8)
+        parser.add_argument("--skills-per-resume", type=int, default=12)
+        parser.add_argument("--resumes", type=int, default=20, help="Resumes per measurement.")
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        vocab_size = options["vocab_size"]
+        names = {i: f"skill {i:05d}" for i in range(1, vocab_size + 1)}
+        results = []
+
+        for n_jobs in [int(n) for n in options["jobs"].split(",")]:
+            jobs = synthetic_catalog(n_jobs, vocab_size, options["skills_per_job"], rng)
+            resumes = [
+                frozenset(rng.sample(range(1, vocab_size + 1), options["skills_per_resume"]))
+                for _ in range(options["resumes"])
+            ]
+
+            start = time.perf_counter()
+            matrix = SkillMatrix(range(n_jobs), jobs)
+            full_texts = [join(names, job) for job in jobs]
+            build_s = time.perf_counter() - start
+
+            for resume in resumes[:3]:
+                assert bitset_missing(matrix, full_texts, resume, names) == sets_missing(jobs, resume, names)
+                matched, required = matrix.coverage(resume)
+                assert matched.tolist() == [len(job & resume) for job in jobs]
+
+            per_resume = options["resumes"]
+            sets_s = best_of(options["repeat"], lambda: [sets_missing(jobs, r, names) for r in resumes])
+            bitset_s = best_of(
+                options["repeat"], lambda: [bitset_missing(matrix, full_texts, r, names) for r in resumes],
+            )
+            sets_count_s = best_of(
+                options["repeat"], lambda: [[len(job & r) for job in jobs] for r in resumes],
+            )
+            coverage_s = best_of(options["repeat"], lambda: [matrix.coverage(r) for r in resumes])
+
+            results.append({
+                "jobs": n_jobs,
+                "vocab_size": vocab_size,
+                "words_per_row": matrix.n_words,
+                "matrix_mb": round(matrix.bits.nbytes / 2**20, 2),
+                "matrix_build_ms": round(build_s * 1000, 2),
+                "sets_missing_ms_per_resume": round(sets_s / per_resume * 1000, 3),
+                "bitset_missing_ms_per_resume": round(bitset_s / per_resume * 1000, 3),
+                "missing_speedup": round(sets_s / bitset_s, 2) if bitset_s else None,
+                "sets_coverage_ms_per_resume": round(sets_count_s / per_resume * 1000, 3),
+                "bitset_coverage_ms_per_resume": round(coverage_s / per_resume * 1000, 3),
+                "coverage_speedup": round(sets_count_s / coverage_s, 2) if coverage_s else None,
+            })
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(
+            f"{'jobs':>7} {'build ms':>9} {'missing: sets':>14} {'bitset':>8} {'speedup':>8}"
+            f" {'coverage: sets':>15} {'bitset':>8} {'speedup':>8}   (ms per resume)"
+        )
+        for r in results:
+            self.stdout.write(
+                f"{r['jobs']:>7} {r['matrix_build_ms']:>9} {r['sets_missing_ms_per_resume']:>14} "
+                f"{r['bitset_missing_ms_per_resume']:>8} {r['missing_speedup']:>8} "
+                f"{r['sets_coverage_ms_per_resume']:>15} {r['bitset_coverage_ms_per_resume']:>8} "
+                f"{r['coverage_speedup']:>8}"
+            )
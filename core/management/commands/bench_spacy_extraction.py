@@ -0,0 +1,102 @@
+import json
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core import extraction
+from core.management.commands.bench_skill_extraction import best_of
+from core.management.commands.compare_extractors import canonical
+from core.skills import SKILL_ALIASES, SKILL_KEYWORDS, build_extractor
+from core.skills.nlp import SpacyPhraseMatcher
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the spaCy PhraseMatcher engine on real resumes: docs/s one "
+        "document at a time and through nlp.pipe at several batch sizes, "
+        "against the substring and Aho-Corasick keyword engines."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir", default=str(Path(settings.MEDIA_ROOT) / "resumes"),
+            help="Directory of PDF / DOCX / TXT resumes (default: MEDIA_ROOT/resumes).",
+        )
+        parser.add_argument("--docs", type=int, default=500, help="Documents per run (the resumes repeated).")
+        parser.add_argument("--batch-sizes", default="1,8,32,128,512")
+        parser.add_argument("--model", default=None, help="spaCy pipeline (default: SKILLMATCH_SPACY_MODEL).")
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"])
+        if not directory.is_dir():
+            raise CommandError(f"No such directory: {directory}")
+        texts = []
+        for path in sorted(directory.iterdir()):
+            if path.suffix.lower() in (".pdf", ".docx", ".txt"):
+                result = extraction.extract(path.name, path.read_bytes())
+                if result.ok and result.text.strip():
+                    texts.append(result.text.strip())
+        if not texts:
+            raise CommandError(f"No readable resumes in {directory}")
+        docs = (texts * (options["docs"] // len(texts) + 1))[:options["docs"]]
+        n_docs = len(docs)
+
+        vocabulary = SKILL_KEYWORDS + list(SKILL_ALIASES)
+        start = time.perf_counter()
+        spacy_engine = SpacyPhraseMatcher(vocabulary, model=options["model"])
+        load_s = time.perf_counter() - start
+
+        def rate(seconds):
+            return round(n_docs / seconds, 1) if seconds else None
+
+        engines = {}
+        for name in ("substring", "automaton"):
+            engine = build_extractor(name)
+            engines[name] = rate(best_of(options["repeat"], lambda: [engine.find_all(d) for d in docs]))
+        engines["spacy (per doc)"] = rate(
+            best_of(options["repeat"], lambda: [spacy_engine.find_all(d) for d in docs])
+        )
+        batches = {}
+        for size in [int(b) for b in options["batch_sizes"].split(",")]:
+            batches[size] = rate(
+                best_of(options["repeat"], lambda: spacy_engine.find_all_many(docs, batch_size=size))
+            )
+
+        automaton = build_extractor("automaton")
+        agree = sum(
+            canonical(found) == canonical(automaton.find_all(text))
+            for text, found in zip(texts, spacy_engine.find_all_many(texts))
+        )
+
+        report = {
+            "directory": str(directory),
+            "resumes": len(texts),
+            "docs": n_docs,
+            "avg_chars": round(sum(len(d) for d in docs) / n_docs),
+            "spacy_model": options["model"] or settings.SKILLMATCH_SPACY_MODEL,
+            "spacy_pipes": spacy_engine.nlp.pipe_names,
+            "spacy_load_ms": round(load_s * 1000, 1),
+            "docs_per_s": engines,
+            "spacy_pipe_docs_per_s": batches,
+            "spacy_agrees_with_automaton": f"{agree}/{len(texts)}",
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"{n_docs} docs ({len(texts)} resumes, {report['avg_chars']} chars avg); spaCy model "
+            f"{report['spacy_model']} pipes={report['spacy_pipes']} loaded in {report['spacy_load_ms']} ms"
+        )
+        self.stdout.write(f"{'engine':<22} {'docs/s':>9}")
+        for name, docs_per_s in engines.items():
+            self.stdout.write(f"{name:<22} {docs_per_s:>9}")
+        for size, docs_per_s in batches.items():
+            self.stdout.write(f"{f'spacy pipe batch={size}':<22} {docs_per_s:>9}")
+        self.stdout.write(
+            f"spaCy finds the same skills as the automaton on {report['spacy_agrees_with_automaton']} resumes."
+        )
@@ -0,0 +1,222 @@
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.management.commands.bench_matching import git_revision
+
+# Runs in a fresh interpreter: boot Django the way a web worker does, then
+# optionally import more modules, and report wall time and resident memory.
+CHILD = r"""
+import importlib, json, os, sys, time
+start = time.perf_counter()
+os.environ["DJANGO_SETTINGS_MODULE"] = sys.argv[1]
+import django
+django.setup()
+import skillmatch.urls  # noqa: F401  (imports core.views and everything it uses)
+booted = time.perf_counter()
+for name in sys.argv[2:]:
+    importlib.import_module(name)
+end = time.perf_counter()
+
+rss_kb = None
+try:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                rss_kb = int(line.split()[1])
+except OSError:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "boot_ms": (booted - start) * 1000,
+    "total_ms": (end - start) * 1000,
+    "rss_kb": rss_kb,
+    "modules": len(sys.modules),
+    "heavy_loaded": sorted(m for m in ("numpy", "scipy", "sklearn", "PyPDF2", "docx") if m in sys.modules),
+}))
+"""
+
+# what a worker loads at boot now, and what it loaded before the TF-IDF engine
+# (numpy / scipy / scikit-learn) and the parsers were imported lazily
+SCENARIOS = {
+    "lazy (current)": [],
+    "eager (previous)": ["core.tfidf", "PyPDF2", "docx"],
+}
+
+
+# gunicorn with no config (the old Procfile) vs. the checked-in gunicorn.conf.py
+GUNICORN_SETUPS = {
+    "bare": ["gunicorn", "skillmatch.wsgi", "-c", "/dev/null"],
+    "gunicorn.conf.py": ["gunicorn", "-c", "gunicorn.conf.py"],
+}
+
+
+def run_child(extra_modules):
+    out = subprocess.check_output(
+        [sys.executable, "-c", CHILD, os.environ.get("DJANGO_SETTINGS_MODULE", "skillmatch.settings"),
+         *extra_modules],
+        cwd=settings.BASE_DIR, text=True,
+    )
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _proc_kb(pid, filename, fields):
+    """{field: kB} from /proc/<pid>/<filename> (status or smaps_rollup)."""
+    values = {}
+    with open(f"/proc/{pid}/{filename}") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in fields:
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                if int(f.read().rsplit(")", 1)[1].split()[1]) == pid:
+                    children.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return sorted(children)
+
+
+def _get(url):
+    start = time.perf_counter()
+    with urllib.request.urlopen(url, timeout=60) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_gunicorn(command, port, workers, paths):
+    """
+    Start gunicorn, time it until it answers, send one request per path
+    per worker (the first request each worker serves), then read the
+    workers' memory: RSS, PSS (shared pages split between sharers) and
+    private pages.
+    """
+    env = {**os.environ, "PORT": str(port), "WEB_CONCURRENCY": str(workers)}
+    argv = [*command, "-b", f"127.0.0.1:{port}", "-w", str(workers)]
+    start = time.perf_counter()
+    server = subprocess.Popen(argv, cwd=settings.BASE_DIR, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        base = f"http://127.0.0.1:{port}"
+        while True:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                    break
+            except OSError:
+                if server.poll() is not None or time.perf_counter() - start > 60:
+                    raise CommandError(f"gunicorn did not start: {' '.join(argv)}")
+                time.sleep(0.05)
+        ready_ms = (time.perf_counter() - start) * 1000
+
+        while len(_children(server.pid)) < workers:
+            time.sleep(0.05)
+        # sync workers serve one request at a time; with `workers` parallel
+        # requests in flight each worker gets its first one
+        first = {}
+        for path in paths:
+            with ThreadPoolExecutor(workers) as pool:
+                first[path] = list(pool.map(_get, [base + path] * workers))
+
+        memory = []
+        for pid in _children(server.pid):
+            rollup = _proc_kb(pid, "smaps_rollup", {"Rss", "Pss", "Private_Clean", "Private_Dirty"})
+            memory.append({
+                "rss_mb": rollup["Rss"] / 1024,
+                "pss_mb": rollup["Pss"] / 1024,
+                "private_mb": (rollup["Private_Clean"] + rollup["Private_Dirty"]) / 1024,
+            })
+        return {
+            "ready_ms": round(ready_ms, 1),
+            "first_request_ms": {p: round(statistics.median(t), 1) for p, t in first.items()},
+            "per_worker": {
+                k: round(statistics.mean(m[k] for m in memory), 1) for k in ("rss_mb", "pss_mb", "private_mb")
+            },
+        }
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold start of a web worker: time to boot Django and import "
+        "the URLconf / views in a fresh interpreter, and its resident memory, "
+        "with the matching engine and parsers loaded lazily (current) and "
+        "eagerly (as before). With --gunicorn, also compare real gunicorn "
+        "servers with and without the preload / warm-up config."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per scenario.")
+        parser.add_argument(
+            "--gunicorn", action="store_true",
+            help="Also start real gunicorn servers (bare vs. gunicorn.conf.py) and compare "
+                 "first-request latency and per-worker memory (Linux only).",
+        )
+        parser.add_argument("--workers", type=int, default=2)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--paths", default="/,/jobs/,/scores/", help="URLs for the first requests.")
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        results = {}
+        for name, modules in SCENARIOS.items():
+            runs = [run_child(modules) for _ in range(options["repeat"])]
+            results[name] = {
+                "extra_imports": modules,
+                "boot_ms": round(statistics.median(r["boot_ms"] for r in runs), 1),
+                "total_ms": round(statistics.median(r["total_ms"] for r in runs), 1),
+                "rss_mb": round(statistics.median(r["rss_kb"] for r in runs) / 1024, 1),
+                "modules": runs[-1]["modules"],
+                "heavy_loaded": runs[-1]["heavy_loaded"],
+            }
+
+        servers = {}
+        if options["gunicorn"]:
+            paths = [p for p in options["paths"].split(",") if p]
+            for offset, (name, command) in enumerate(GUNICORN_SETUPS.items()):
+                servers[name] = run_gunicorn(command, options["port"] + offset, options["workers"], paths)
+
+        report = {
+            "git_revision": git_revision(),
+            "python": sys.version.split()[0],
+            "repeat": options["repeat"],
+            "scenarios": results,
+            "gunicorn": servers,
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"{'scenario':<18} {'cold start ms':>14} {'RSS MB':>8} {'modules':>8}  heavy modules")
+        for name, r in results.items():
+            self.stdout.write(
+                f"{name:<18} {r['total_ms']:>14} {r['rss_mb']:>8} {r['modules']:>8}  "
+                f"{', '.join(r['heavy_loaded']) or '-'}"
+            )
+        for name, r in servers.items():
+            self.stdout.write(f"\ngunicorn {name}: ready in {r['ready_ms']} ms, {options['workers']} workers")
+            for path, ms in r["first_request_ms"].items():
+                self.stdout.write(f"  first {path:<12} {ms:>8} ms")
+            m = r["per_worker"]
+            self.stdout.write(
+                f"  per worker: RSS {m['rss_mb']} MB, PSS {m['pss_mb']} MB, private {m['private_mb']} MB"
+            )
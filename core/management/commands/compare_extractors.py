@@ -0,0 +1,157 @@
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+
+from core import extraction
+from core.management.commands.bench_skill_extraction import best_of
+from core.skills import EXTRACTORS, SKILL_ALIASES, build_extractor
+
+# small hand-labelled set of synthetic resumes (labels.json), the default input
+EVAL_CORPUS = Path(__file__).resolve().parents[2] / "skills" / "eval_corpus"
+
+
+def canonical(skills):
+    return {SKILL_ALIASES.get(s, s) for s in skills}
+
+
+def score(found, expected):
+    """Micro-averaged precision / recall / F1 over documents, plus per-skill misses."""
+    tp = fp = fn = 0
+    false_pos, false_neg = Counter(), Counter()
+    for name, skills in found.items():
+        truth = expected.get(name, set())
+        tp += len(skills & truth)
+        fp += len(skills - truth)
+        fn += len(truth - skills)
+        false_pos.update(skills - truth)
+        false_neg.update(truth - skills)
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4),
+        "false_positives": dict(false_pos.most_common(10)),
+        "false_negatives": dict(false_neg.most_common(10)),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the skill extraction engines (core.skills.EXTRACTORS) on a "
+        "directory of resumes: speed, and with hand labels precision / recall. "
+        "By default runs on the labelled set in core/skills/eval_corpus. "
+        "Without labels only speed and skills per document are reported; no "
+        "engine is a ground truth for the others."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir", default=str(EVAL_CORPUS),
+            help="Directory of PDF / DOCX / TXT resumes (default: core/skills/eval_corpus).",
+        )
+        parser.add_argument("--engines", default=",".join(EXTRACTORS))
+        parser.add_argument(
+            "--labels", default=None,
+            help='JSON file {"file name": ["skill", ...]} with the expected skills of each resume '
+                 "(default: labels.json in --dir, if there is one).",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"])
+        if not directory.is_dir():
+            raise CommandError(f"No such directory: {directory}")
+        engines = [e for e in options["engines"].split(",") if e]
+
+        texts, skipped = {}, {}
+        for path in sorted(directory.iterdir()):
+            if path.suffix.lower() not in (".pdf", ".docx", ".txt"):
+                continue
+            result = extraction.extract(path.name, path.read_bytes())
+            if result.ok and result.text.strip():
+                texts[path.name] = result.text.strip()
+            else:
+                skipped[path.name] = result.error or "no text"
+        if not texts:
+            raise CommandError(f"No readable resumes in {directory}")
+
+        expected = None
+        labels_path = options["labels"]
+        if labels_path is None and (directory / "labels.json").is_file():
+            labels_path = str(directory / "labels.json")
+        if labels_path:
+            labels = json.loads(Path(labels_path).read_text())
+            missing = sorted(set(texts) - set(labels))
+            if missing:
+                raise CommandError(f"No labels for {len(missing)} resumes, e.g. {missing[0]}")
+            expected = {name: canonical(s.strip().lower() for s in labels[name]) for name in texts}
+
+        chars = sum(len(t) for t in texts.values())
+        results, unavailable = {}, {}
+        for name in engines:
+            start = time.perf_counter()
+            try:
+                engine = build_extractor(name)
+            except ImproperlyConfigured as exc:
+                # e.g. spaCy or its model not installed
+                unavailable[name] = str(exc)
+                continue
+            build_s = time.perf_counter() - start
+
+            run_s = best_of(options["repeat"], lambda: [engine.find_all(t) for t in texts.values()])
+            found = {doc: canonical(engine.find_all(text)) for doc, text in texts.items()}
+            results[name] = {
+                "build_ms": round(build_s * 1000, 2),
+                "ms_per_doc": round(run_s / len(texts) * 1000, 3),
+                "mb_per_s": round(chars / run_s / 1e6, 2) if run_s else None,
+                "skills_per_doc": round(sum(len(s) for s in found.values()) / len(found), 2),
+                **(score(found, expected) if expected else {}),
+            }
+
+        report = {
+            "directory": str(directory),
+            "documents": len(texts),
+            "chars": chars,
+            "skipped": skipped,
+            "labels": labels_path,
+            "engines": results,
+            "unavailable": unavailable,
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"{len(texts)} resumes ({chars} chars) from {directory}, {len(skipped)} skipped"
+        )
+        header = f"{'engine':<11} {'build ms':>9} {'ms/doc':>8} {'MB/s':>7} {'skills/doc':>11}"
+        if expected:
+            header += f" {'precision':>10} {'recall':>7} {'F1':>7}"
+        self.stdout.write(header)
+        for name, reason in unavailable.items():
+            self.stdout.write(f"{name:<11} unavailable: {reason}")
+        for name, r in results.items():
+            line = f"{name:<11} {r['build_ms']:>9} {r['ms_per_doc']:>8} {r['mb_per_s']:>7} {r['skills_per_doc']:>11}"
+            if expected:
+                line += f" {r['precision']:>10} {r['recall']:>7} {r['f1']:>7}"
+            self.stdout.write(line)
+        if not expected:
+            self.stdout.write(
+                "\nNo precision / recall without hand labels: pass --labels "
+                '(JSON {"file name": ["skill", ...]} covering every resume).'
+            )
+            return
+        for name, r in results.items():
+            if r["false_positives"] or r["false_negatives"]:
+                self.stdout.write(f"\n{name}:")
+                if r["false_positives"]:
+                    self.stdout.write(f"  extra:  {r['false_positives']}")
+                if r["false_negatives"]:
+                    self.stdout.write(f"  missed: {r['false_negatives']}")
@@ -0,0 +1,207 @@
+import json
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.models import Job, Resume, Score
+
+# indexes / constraints added for the Score access paths (migrations 0009, 0010)
+SCORE_INDEXES = ["score_user_status_job_idx", "score_job_value_id_idx"]
+SCORE_UNIQUE = ["unique_score_resume_job", "unique_score_user_job"]
+STATUSES = ["DRAFT", "DRAFT", "SUBMITTED", "SHORTLISTED", "REJECTED"]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def view_queries(user, job_id, cursor):
+    """The hot Score queries of each view, as the views build them."""
+    return {
+        "job_list: applied job ids": (
+            Score.objects
+            .filter(user=user, status__in=["SUBMITTED", "SHORTLISTED", "REJECTED"])
+            .values_list("job_id", flat=True)
+            .distinct()
+        ),
+        "upload_resume: already applied": (
+            Score.objects.filter(user=user).values_list("job_id", flat=True)
+        ),
+        "my_applications": (
+            Score.objects
+            .filter(user=user)
+            .select_related("job", "resume")
+            .order_by("-id")
+        ),
+        "recruiter_dashboard: first page": (
+            Score.objects.submitted()
+            .select_related("resume", "job", "resume__user")
+            .dashboard_order()[:51]
+        ),
+        "recruiter_dashboard: next page": (
+            Score.objects.submitted()
+            .after(*cursor)
+            .select_related("resume", "job", "resume__user")
+            .dashboard_order()[:51]
+        ),
+        "recruiter_dashboard: one job": (
+            Score.objects.submitted()
+            .filter(job_id=job_id)
+            .select_related("resume", "job", "resume__user")
+            .dashboard_order()[:51]
+        ),
+        "recruiter_dashboard: top 25 per job": (
+            Score.objects.submitted()
+            .top_per_job(25)
+            .select_related("resume", "job", "resume__user")
+            .order_by("job__title", "job_id", "rank")
+        ),
+        "legacy dashboard sort (job__title, -value)": (
+            Score.objects
+            .select_related("resume", "job", "resume__user")
+            .order_by("job__title", "-value")[:50]
+        ),
+    }
+
+
+def explain(queryset):
+    # QuerySet.explain() puts the EXPLAIN prefix inside the subquery Django
+    # builds for window-function filters, so prefix the final SQL ourselves
+    sql, params = queryset.query.sql_with_params()
+    prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        rows = cursor.fetchall()
+    if connection.vendor == "sqlite":
+        return "\n".join(row[-1] for row in rows)
+    return "\n".join(row[0] for row in rows)
+
+
+def timed(queryset, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list(queryset.all())
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a large synthetic users × jobs score matrix (rolled back afterwards) "
+        "and show the query plan and median time of every view's Score query "
+        "with and without the composite Score indexes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--jobs", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            raise CommandError("Only SQLite and PostgreSQL are supported.")
+
+        try:
+            with transaction.atomic():
+                results = self._run(options)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        for name, r in results["queries"].items():
+            self.stdout.write(self.style.MIGRATE_HEADING(name))
+            self.stdout.write(f"  with indexes:    {r['after_ms']} ms")
+            self.stdout.write("    " + r["after_plan"].replace("\n", "\n    "))
+            self.stdout.write(f"  without indexes: {r['before_ms']} ms")
+            self.stdout.write("    " + r["before_plan"].replace("\n", "\n    "))
+        self.stdout.write(
+            f"\n{results['scores']} scores ({results['users']} users × {results['jobs']} jobs), "
+            f"seeded in {results['seed_s']} s"
+        )
+
+    def _seed(self, options, rng):
+        start = time.perf_counter()
+        stamp = timezone.now().strftime("%Y%m%d%H%M%S%f")
+        User.objects.bulk_create(
+            [User(username=f"explain-{stamp}-{i}") for i in range(options["users"])], batch_size=1000,
+        )
+        users = list(User.objects.filter(username__startswith=f"explain-{stamp}-"))
+        Resume.objects.bulk_create(
+            [Resume(user=u, file=f"resumes/explain_{u.id}.pdf", skills="python, sql") for u in users],
+            batch_size=1000,
+        )
+        resumes = list(Resume.objects.filter(user__in=users))
+        Job.objects.bulk_create(
+            [Job(title=f"Job {i:05d}", required_skills="python, sql", description="") for i in range(options["jobs"])],
+            batch_size=1000,
+        )
+        jobs = list(Job.objects.order_by("-id")[:options["jobs"]])
+
+        batch = []
+        for resume in resumes:
+            for job in jobs:
+                batch.append(Score(
+                    resume=resume, user_id=resume.user_id, job=job, value=round(rng.uniform(0, 100), 2),
+                    status=rng.choice(STATUSES), recommended_skills="",
+                ))
+                if len(batch) >= 5000:
+                    Score.objects.bulk_create(batch)
+                    batch = []
+        Score.objects.bulk_create(batch)
+        return users, jobs, time.perf_counter() - start
+
+    def _drop_indexes(self):
+        with connection.cursor() as cursor:
+            for name in SCORE_INDEXES:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            # SQLite keeps unique constraints inside CREATE TABLE; its
+            # autoindex cannot be dropped without rebuilding the table
+            if connection.vendor == "postgresql":
+                for name in SCORE_UNIQUE:
+                    cursor.execute(
+                        f"ALTER TABLE {Score._meta.db_table} DROP CONSTRAINT {connection.ops.quote_name(name)}"
+                    )
+
+    def _analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def _run(self, options):
+        rng = random.Random(options["seed"])
+        users, jobs, seed_s = self._seed(options, rng)
+        self._analyze()
+
+        user = users[len(users) // 2]
+        job_id = jobs[len(jobs) // 2].id
+        middle = Score.objects.submitted().dashboard_order()[200]
+        queries = view_queries(user, job_id, (middle.job_id, middle.value, middle.id))
+
+        results = {}
+        for name, qs in queries.items():
+            results[name] = {"after_plan": explain(qs), "after_ms": timed(qs, options["repeat"])}
+
+        self._drop_indexes()
+        self._analyze()
+        for name, qs in queries.items():
+            results[name]["before_plan"] = explain(qs)
+            results[name]["before_ms"] = timed(qs, options["repeat"])
+
+        return {
+            "users": len(users),
+            "jobs": len(jobs),
+            "scores": Score.objects.count(),
+            "seed_s": round(seed_s, 2),
+            "queries": results,
+        }
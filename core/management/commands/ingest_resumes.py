@@ -0,0 +1,105 @@
+import json
+import sys
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core import extraction
+from core.ingest import find_resume_files, ingest
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-import resume files (PDF / DOCX / TXT) from a directory: parse them "
+        "in a process pool, skip content already imported, and write Resume, "
+        "skill and Score rows in batches. Prints live files/s and pages/s and "
+        "a final error report."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "directory", nargs="?", default=str(Path(settings.MEDIA_ROOT) / "resumes"),
+            help="Directory to walk recursively (default: MEDIA_ROOT/resumes).",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="Extraction processes (default: SKILLMATCH_EXTRACTION_WORKERS).",
+        )
+        parser.add_argument("--batch-size", type=int, default=200, help="Files per write transaction.")
+        parser.add_argument("--limit", type=int, default=None, help="Only the first N files.")
+        parser.add_argument(
+            "--submit", action="store_true",
+            help="Create the scores as SUBMITTED (visible on the recruiter dashboard) instead of DRAFT.",
+        )
+        parser.add_argument(
+            "--no-validate", action="store_true",
+            help="Import files even if they don't look like a resume (length / keyword check).",
+        )
+        parser.add_argument("--json", action="store_true", help="Print the final report as JSON.")
+
+    def handle(self, *args, **options):
+        directory = Path(options["directory"])
+        if not directory.is_dir():
+            raise CommandError(f"No such directory: {directory}")
+        paths = find_resume_files(directory)[:options["limit"]]
+        if not paths:
+            raise CommandError(f"No resume files in {directory}")
+
+        live = sys.stderr.isatty()
+        last = [0.0]
+
+        def progress(stats):
+            now = time.perf_counter()
+            if now - last[0] < (0.2 if live else 5.0):
+                return
+            last[0] = now
+            line = (
+                f"{stats.files}/{len(paths)} files  {stats.rate(stats.files):.1f} files/s  "
+                f"{stats.rate(stats.pages):.1f} pages/s  {len(stats.errors)} errors"
+            )
+            self.stderr.write(line, ending="\r" if live else "\n")
+
+        pool = extraction.make_pool(options["workers"])
+        try:
+            stats = ingest(
+                paths, pool=pool,
+                batch_size=options["batch_size"],
+                status="SUBMITTED" if options["submit"] else "DRAFT",
+                validate=not options["no_validate"],
+                progress=progress,
+            )
+        finally:
+            pool.shutdown()
+        if live:
+            self.stderr.write("")
+
+        report = {
+            "directory": str(directory),
+            "found": len(paths),
+            "parsed": stats.files,
+            "pages": stats.pages,
+            "imported": stats.imported,
+            "scores_created": stats.scores,
+            "duplicates": len(stats.duplicates),
+            "seconds": round(stats.elapsed, 2),
+            "files_per_s": round(stats.rate(stats.files), 2),
+            "pages_per_s": round(stats.rate(stats.pages), 2),
+            "workers": pool.size,
+            "errors": [{"file": path, "reason": reason} for path, reason in stats.errors],
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"Imported {stats.imported} of {len(paths)} files ({stats.scores} scores) in "
+            f"{report['seconds']}s with {pool.size} workers: "
+            f"{report['files_per_s']} files/s, {report['pages_per_s']} pages/s."
+        )
+        self.stdout.write(f"Skipped {len(stats.duplicates)} duplicates (content already imported).")
+        if stats.errors:
+            self.stdout.write(f"\n{len(stats.errors)} files not imported:")
+            for path, reason in stats.errors:
+                self.stdout.write(f"  {path}: {reason}")
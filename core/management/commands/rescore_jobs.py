@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Job, RescoreRun
+from core.rescoring import claim_run, claimable_runs, run_rescore
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute scores for one job (--job) or finish every claimable rescore "
+        "run now: PENDING, FAILED past its retry delay, or RUNNING with a thread "
+        "that stopped reporting progress, while attempts remain (run_worker does "
+        "the same in the background). Runs still live elsewhere are left alone."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job", type=int, help="Job id to rescore.")
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        if options["job"]:
+            try:
+                job = Job.objects.get(id=options["job"])
+            except Job.DoesNotExist:
+                raise CommandError(f"Job {options['job']} does not exist.")
+            run_ids = [RescoreRun.objects.create(job=job).id]
+        else:
+            run_ids = claimable_runs()
+
+        for run_id in run_ids:
+            # claimed one at a time: a web worker may have picked it up meanwhile
+            run = claim_run(run_id)
+            if run is None:
+                self.stdout.write(f"Rescore run {run_id}: taken by another runner, skipped")
+                continue
+            run_rescore(run, batch_size=options["batch_size"])
+            self.stdout.write(
+                f"{run.job}: {run.processed}/{run.total} resumes rescored ({run.status})"
+            )
@@ -0,0 +1,38 @@
+import logging
+import signal
+
+from django.core.management.base import BaseCommand
+
+from core.tasks import work
+
+
+class Command(BaseCommand):
+    help = (
+        "Process queued resume analyses (the background half of upload_resume), "
+        "and retry rescore runs that failed or were abandoned."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit when the queue is empty instead of polling forever.",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=2.0,
+            help="Seconds to sleep when there is nothing to do.",
+        )
+
+    def handle(self, *args, **options):
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+        stopping = []
+        # finish the current analysis on SIGTERM/SIGINT, then exit
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda *_: stopping.append(True))
+
+        processed = work(
+            once=options["once"],
+            poll_interval=options["poll_interval"],
+            stop=lambda: bool(stopping),
+        )
+        self.stdout.write(f"Processed {processed} resume analyses and rescore runs.")
@@ -0,0 +1,80 @@
+"""
+Resume ↔ job matching.
+
+Scores come from the TF-IDF engine in core.tfidf (SkillIndex, one sparse
+product per resume against the whole job catalog). That module pulls in
+numpy, scipy and scikit-learn, so it is imported on first use rather than
+here: web workers and manage.py commands that never score a resume don't
+pay for loading it.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+from .cache import version
+
+# loaded from core.tfidf on first access (see __getattr__)
+_ENGINE_NAMES = {"SkillIndex", "legacy_similarity", "SCORE_TOLERANCE"}
+
+
+def __getattr__(name):
+    if name in _ENGINE_NAMES:
+        from . import tfidf
+        return getattr(tfidf, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def to_score_value(similarity):
+    """Similarity (0..1) → the percentage stored on Score.value."""
+    return round(float(similarity) * 100, 2)
+
+
+def split_skills(skills_text):
+    """'Python, django ,SQL' → {'python', 'django', 'sql'}"""
+    return {s.strip().lower() for s in (skills_text or "").split(",") if s.strip()}
+
+
+# =========================
+#      JOB INDEX CACHE
+# =========================
+
+_job_index = None
+_job_index_version = None
+_job_index_built = 0.0
+_job_index_lock = threading.Lock()
+
+
+def get_job_index():
+    """
+    Return the SkillIndex over all jobs, rebuilt only when the "jobs"
+    cache namespace has moved to a new version (every Job save / delete
+    bumps it, see core.signals), so an upload costs one cache read here
+    rather than a scan of the job table. Like the cached job catalog it
+    is also rebuilt after SKILLMATCH_JOB_CACHE_TIMEOUT seconds, for
+    writes that bypass signals and per-process (locmem) cache versions.
+    """
+    global _job_index, _job_index_version, _job_index_built
+
+    from .job_catalog import JOBS_NAMESPACE
+    from .models import Job
+
+    current = version(JOBS_NAMESPACE)
+    max_age = getattr(settings, "SKILLMATCH_JOB_CACHE_TIMEOUT", 600)
+    with _job_index_lock:
+        if (
+            _job_index is None
+            or _job_index_version != current
+            or time.monotonic() - _job_index_built > max_age
+        ):
+            from .tfidf import SkillIndex
+
+            rows = list(Job.objects.order_by("id").values_list("id", "required_skills"))
+            _job_index = SkillIndex(
+                [job_id for job_id, _ in rows],
+                [skills for _, skills in rows],
+            )
+            _job_index_version = current
+            _job_index_built = time.monotonic()
+        return _job_index
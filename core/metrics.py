@@ -0,0 +1,90 @@
+"""
+In-process per-view request metrics (wall time, DB time, query count),
+filled by core.middleware.ViewMetricsMiddleware and served as JSON to
+staff at /ops/metrics/. Each gunicorn worker keeps its own numbers.
+"""
+
+import bisect
+import threading
+
+# upper bounds of the histogram buckets; the last bucket is open-ended
+TIME_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+QUERY_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100, 200, 500]
+
+
+class Histogram:
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-quantile (max for the open bucket)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self):
+        labels = [f"le_{b}" for b in self.bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class ViewStats:
+    def __init__(self):
+        self.wall_ms = Histogram(TIME_BUCKETS_MS)
+        self.db_ms = Histogram(TIME_BUCKETS_MS)
+        self.queries = Histogram(QUERY_BUCKETS)
+
+
+_views = {}
+_lock = threading.Lock()
+
+
+def record(view, wall_ms, db_ms, queries):
+    with _lock:
+        stats = _views.get(view)
+        if stats is None:
+            stats = _views[view] = ViewStats()
+        stats.wall_ms.observe(wall_ms)
+        stats.db_ms.observe(db_ms)
+        stats.queries.observe(queries)
+
+
+def snapshot():
+    """{view: {"wall_ms": ..., "db_ms": ..., "queries": ...}} for this process."""
+    with _lock:
+        return {
+            view: {
+                "wall_ms": stats.wall_ms.as_dict(),
+                "db_ms": stats.db_ms.as_dict(),
+                "queries": stats.queries.as_dict(),
+            }
+            for view, stats in sorted(_views.items())
+        }
+
+
+def reset():
+    with _lock:
+        _views.clear()
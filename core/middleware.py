@@ -0,0 +1,106 @@
+import time
+from contextlib import ExitStack
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+
+
+class _QueryTimer:
+    """execute_wrapper that counts queries and sums the time spent in them."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+
+
+class _MeteredStream:
+    """
+    streaming_content wrapper that calls `finish` once the body has been
+    sent: when the iterator is exhausted or the response is closed,
+    whichever comes first.
+    """
+
+    def __init__(self, content, finish):
+        self.content = content
+        self.finish = finish
+
+    def __iter__(self):
+        try:
+            yield from self.content
+        finally:
+            self.close()
+
+    def close(self):
+        finish, self.finish = self.finish, None
+        if finish is not None:
+            finish()
+
+
+class ViewMetricsMiddleware:
+    """
+    Records wall time, DB time and query count of every request under its
+    URL name (job_list, recruiter_dashboard, ...) in core.metrics. For a
+    streaming response the numbers cover the whole body, since that is
+    where its queries run. Static files (served by WhiteNoise further down
+    the stack) are not recorded. Staff users, and everyone with DEBUG on,
+    also get the numbers in a Server-Timing header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "SKILLMATCH_VIEW_METRICS", True)
+        self.static_prefix = urlsplit(settings.STATIC_URL or "").path or None
+
+    def __call__(self, request):
+        if not self.enabled or (self.static_prefix and request.path_info.startswith(self.static_prefix)):
+            return self.get_response(request)
+
+        timer = _QueryTimer()
+        start = time.perf_counter()
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(timer))
+        try:
+            response = self.get_response(request)
+        except BaseException:
+            stack.close()
+            raise
+
+        def finish():
+            stack.close()
+            wall_ms = (time.perf_counter() - start) * 1000
+            db_ms = timer.seconds * 1000
+            match = getattr(request, "resolver_match", None)
+            view = (match.url_name or match.view_name) if match else "unresolved"
+            metrics.record(view, wall_ms, db_ms, timer.count)
+            return wall_ms, db_ms
+
+        if response.streaming and not response.is_async:
+            # the body (and its queries) runs after we return; measure until it's sent
+            response.streaming_content = _MeteredStream(response.streaming_content, finish)
+            return response
+
+        wall_ms, db_ms = finish()
+        if self._show_timing(request):
+            response["Server-Timing"] = (
+                f'total;dur={wall_ms:.1f}, db;dur={db_ms:.1f};desc="{timer.count} queries"'
+            )
+        return response
+
+    def _show_timing(self, request):
+        # DB timings tell an outsider too much about the backend
+        if settings.DEBUG:
+            return True
+        user = getattr(request, "user", None)
+        return bool(user is not None and user.is_staff)
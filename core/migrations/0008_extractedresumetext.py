@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-14 23:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_resumeanalysis'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractedResumeText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64)),
+                ('file_type', models.CharField(max_length=10)),
+                ('extractor_version', models.CharField(max_length=20)),
+                ('text', models.TextField(blank=True)),
+                ('skills', models.TextField(blank=True)),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('hits', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('sha256', 'file_type', 'extractor_version'), name='unique_extracted_resume_text')],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.6 on 2026-10-14 23:50
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+STATUS_RANK = {"SHORTLISTED": 3, "REJECTED": 2, "SUBMITTED": 1, "DRAFT": 0}
+DECISIONS = {"SHORTLISTED", "REJECTED"}
+
+
+def remove_duplicate_scores(apps, schema_editor):
+    """
+    Keep one Score per (resume, job) before the unique constraint is added:
+    the one furthest along the application flow (a recruiter decision, then
+    SUBMITTED, then DRAFT), then the oldest. Every removed row is logged.
+    Duplicates carrying different recruiter decisions are not resolved
+    here: the migration stops and lists them instead.
+    """
+    Score = apps.get_model("core", "Score")
+    duplicates = list(
+        Score.objects.values("resume_id", "job_id")
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+    )
+    groups = [
+        list(Score.objects.filter(resume_id=dup["resume_id"], job_id=dup["job_id"]).order_by("id"))
+        for dup in duplicates
+    ]
+    conflicts = [rows for rows in groups if len({s.status for s in rows} & DECISIONS) > 1]
+    if conflicts:
+        raise RuntimeError(
+            "Duplicate Score rows with conflicting recruiter decisions; keep one of each "
+            "group (resume, job: ids and statuses) by hand, then migrate again:\n" + "\n".join(
+                f"  resume {rows[0].resume_id}, job {rows[0].job_id}: "
+                + ", ".join(f"{s.id} {s.status}" for s in rows)
+                for rows in conflicts
+            )
+        )
+
+    for rows in groups:
+        rows.sort(key=lambda s: (-STATUS_RANK.get(s.status, 0), s.id))
+        kept, removed = rows[0], rows[1:]
+        for s in removed:
+            logger.warning(
+                "Removing duplicate Score %s (resume %s, job %s, %s, value %s); keeping %s (%s)",
+                s.id, s.resume_id, s.job_id, s.status, s.value, kept.id, kept.status,
+            )
+        Score.objects.filter(id__in=[s.id for s in removed]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_extractedresumetext'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='title',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['resume', 'status', 'job'], name='score_resume_status_job_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['job', '-value', 'id'], name='score_job_value_id_idx'),
+        ),
+        migrations.RunPython(remove_duplicate_scores, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='score',
+            constraint=models.UniqueConstraint(fields=('resume', 'job'), name='unique_score_resume_job'),
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.2.6 on 2026-10-14 23:53
+
+import logging
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 5000
+STATUS_RANK = {"SHORTLISTED": 3, "REJECTED": 2, "SUBMITTED": 1, "DRAFT": 0}
+DECISIONS = {"SHORTLISTED", "REJECTED"}
+
+
+def backfill_score_user(apps, schema_editor):
+    """
+    Copy resume.user onto every Score, one id range per UPDATE so a large
+    table is never rewritten in a single statement.
+    """
+    Score = apps.get_model("core", "Score")
+    Resume = apps.get_model("core", "Resume")
+    owner = Resume.objects.filter(id=OuterRef("resume_id")).values("user_id")[:1]
+
+    last_id = 0
+    while True:
+        ids = list(
+            Score.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:BACKFILL_BATCH_SIZE]
+        )
+        if not ids:
+            return
+        Score.objects.filter(id__gte=ids[0], id__lte=ids[-1]).update(user_id=Subquery(owner))
+        last_id = ids[-1]
+
+
+def remove_duplicate_user_scores(apps, schema_editor):
+    """
+    Keep one Score per (user, job) before the unique constraint is added:
+    the one furthest along the application flow (a recruiter decision, then
+    SUBMITTED, then DRAFT), then the oldest. Every removed row is logged.
+    Duplicates carrying different recruiter decisions are not resolved
+    here: the migration stops and lists them instead.
+    """
+    Score = apps.get_model("core", "Score")
+    duplicates = list(
+        Score.objects.filter(user__isnull=False)
+        .values("user_id", "job_id")
+        .annotate(n=Count("id"))
+        .filter(n__gt=1)
+    )
+    groups = [
+        list(Score.objects.filter(user_id=dup["user_id"], job_id=dup["job_id"]).order_by("id"))
+        for dup in duplicates
+    ]
+    conflicts = [rows for rows in groups if len({s.status for s in rows} & DECISIONS) > 1]
+    if conflicts:
+        raise RuntimeError(
+            "Duplicate Score rows with conflicting recruiter decisions; keep one of each "
+            "group (user, job: ids and statuses) by hand, then migrate again:\n" + "\n".join(
+                f"  user {rows[0].user_id}, job {rows[0].job_id}: "
+                + ", ".join(f"{s.id} {s.status}" for s in rows)
+                for rows in conflicts
+            )
+        )
+
+    for rows in groups:
+        rows.sort(key=lambda s: (-STATUS_RANK.get(s.status, 0), s.id))
+        kept, removed = rows[0], rows[1:]
+        for s in removed:
+            logger.warning(
+                "Removing duplicate Score %s (user %s, resume %s, job %s, %s, value %s); keeping %s (%s)",
+                s.id, s.user_id, s.resume_id, s.job_id, s.status, s.value, kept.id, kept.status,
+            )
+        Score.objects.filter(id__in=[s.id for s in removed]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_score_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='score',
+            name='score_resume_status_job_idx',
+        ),
+        migrations.AddField(
+            model_name='score',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(backfill_score_user, migrations.RunPython.noop),
+        migrations.RunPython(remove_duplicate_user_scores, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='score',
+            index=models.Index(fields=['user', 'status', 'job'], name='score_user_status_job_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='score',
+            constraint=models.UniqueConstraint(fields=('user', 'job'), name='unique_score_user_job'),
+        ),
+    ]
@@ -0,0 +1,123 @@
+# Generated by Django 5.2.6 on 2026-10-15 00:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+POPULATE_BATCH_SIZE = 500
+
+# frozen copy of core.skills.SKILL_ALIASES as of this migration
+SKILL_ALIASES = {
+    "c plus plus": "c++",
+    "ecmascript": "javascript",
+    "reactjs": "react",
+    "react.js": "react",
+    "angularjs": "angular",
+    "angular.js": "angular",
+    "nodejs": "node",
+    "node.js": "node",
+    "postgres": "postgresql",
+    "amazon web services": "aws",
+    "microsoft azure": "azure",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "ml": "machine learning",
+    "natural language processing": "nlp",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "powerbi": "power bi",
+}
+
+
+def _tokens(skills_text):
+    names = {" ".join(s.lower().split()) for s in (skills_text or "").split(",")}
+    return {SKILL_ALIASES.get(n, n) for n in names if n and len(n) <= 100}
+
+
+def populate_skills(apps, schema_editor):
+    """
+    Seed the aliases, then resolve Job.required_skills and Resume.skills
+    into Skill rows and skill_tags links, POPULATE_BATCH_SIZE owners at a
+    time (one keyset page, one Skill INSERT and one link INSERT per batch).
+    """
+    Skill = apps.get_model("core", "Skill")
+    SkillAlias = apps.get_model("core", "SkillAlias")
+    ids = {}
+
+    def skill_ids(names):
+        unknown = set(names) - ids.keys()
+        if unknown:
+            Skill.objects.bulk_create([Skill(name=n) for n in unknown], ignore_conflicts=True)
+            ids.update(Skill.objects.filter(name__in=unknown).values_list("name", "id"))
+        return {ids[n] for n in names}
+
+    skill_ids(set(SKILL_ALIASES.values()))
+    SkillAlias.objects.bulk_create(
+        [SkillAlias(name=alias, skill_id=ids[name]) for alias, name in SKILL_ALIASES.items()],
+        ignore_conflicts=True,
+    )
+
+    for model_name, text_field, owner_field in [
+        ("Job", "required_skills", "job_id"),
+        ("Resume", "skills", "resume_id"),
+    ]:
+        Model = apps.get_model("core", model_name)
+        Through = Model.skill_tags.through
+        last_id = 0
+        while True:
+            rows = list(
+                Model.objects.filter(id__gt=last_id).order_by("id")
+                .values_list("id", text_field)[:POPULATE_BATCH_SIZE]
+            )
+            if not rows:
+                break
+            tokens = {owner_id: _tokens(text) for owner_id, text in rows}
+            skill_ids(set().union(*tokens.values()))
+            Through.objects.bulk_create(
+                [
+                    Through(**{owner_field: owner_id, "skill_id": ids[name]})
+                    for owner_id, names in tokens.items()
+                    for name in names
+                ],
+                ignore_conflicts=True,
+            )
+            last_id = rows[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_score_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='jobs', to='core.skill'),
+        ),
+        migrations.AddField(
+            model_name='resume',
+            name='skill_tags',
+            field=models.ManyToManyField(blank=True, related_name='resumes', to='core.skill'),
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='core.skill')),
+            ],
+            options={
+                'verbose_name_plural': 'skill aliases',
+            },
+        ),
+        migrations.RunPython(populate_skills, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_skill_taxonomy'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='sha256',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
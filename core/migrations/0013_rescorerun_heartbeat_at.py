@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 00:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_resume_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rescorerun',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
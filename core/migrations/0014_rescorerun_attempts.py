@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 00:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_rescorerun_heartbeat_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rescorerun',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
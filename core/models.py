@@ -1,12 +1,56 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .skills import normalize_skill
+
+
+class Skill(models.Model):
+    """Canonical skill name ("postgresql"); other spellings are SkillAlias rows."""
+    name = models.CharField(max_length=100, unique=True)
+
+    def save(self, *args, **kwargs):
+        self.name = normalize_skill(self.name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name="aliases")
+    name = models.CharField(max_length=100, unique=True)   # normalized: "postgres"
+
+    class Meta:
+        verbose_name_plural = "skill aliases"
+
+    def save(self, *args, **kwargs):
+        self.name = normalize_skill(self.name)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.name} → {self.skill}"
 
 
 class Job(models.Model):
-    title = models.CharField(max_length=100)
+    title = models.CharField(max_length=100, db_index=True)
     required_skills = models.TextField()   # comma separated: python, django, sql
     description = models.TextField()
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    # canonical skills of required_skills, kept in sync by core.signals
+    skill_tags = models.ManyToManyField(Skill, blank=True, related_name="jobs")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember what was loaded so a save can tell if the skills changed
+        instance._loaded_required_skills = dict(zip(field_names, values)).get("required_skills")
+        return instance
+
+    def required_skills_changed(self):
+        return self.required_skills != getattr(self, "_loaded_required_skills", None)
 
     def __str__(self):
         return self.title
@@ -16,14 +60,86 @@ class Resume(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     file = models.FileField(upload_to='resumes/')
     skills = models.TextField(blank=True, null=True)  # we will auto-fill or type manually
+    # content hash of the file, for de-duplicating bulk imports (manage.py ingest_resumes)
+    sha256 = models.CharField(max_length=64, blank=True, db_index=True)
+    # canonical skills of `skills`, set by the analysis pipeline
+    skill_tags = models.ManyToManyField(Skill, blank=True, related_name="resumes")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember the owner loaded so a save can move the resume's scores along
+        instance._loaded_user_id = dict(zip(field_names, values)).get("user_id")
+        return instance
+
+    def user_changed(self):
+        """True if this loaded resume is being given to a different user."""
+        return hasattr(self, "_loaded_user_id") and self.user_id != self._loaded_user_id
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        moved = self.user_changed() and (update_fields is None or "user" in update_fields)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if moved:
+                # Score.user is a copy of resume.user. If the new owner already
+                # applied to one of these jobs, unique_score_user_job raises
+                # IntegrityError and the whole save is rolled back.
+                Score.objects.filter(resume=self).update(user_id=self.user_id)
+        self._loaded_user_id = self.user_id
+
     def __str__(self):
         if self.user:
             return f"{self.user.username} resume"
         return f"Resume {self.id}"
 
 
+class ScoreQuerySet(models.QuerySet):
+    def submitted(self):
+        """Applications the recruiter can see (anything past DRAFT)."""
+        return self.exclude(status="DRAFT")
+
+    def dashboard_order(self):
+        """Keyset order used by the recruiter dashboard: (job, -value, id)."""
+        return self.order_by("job_id", "-value", "id")
+
+    def after(self, job_id, value, score_id):
+        """
+        Rows strictly after (job_id, value, score_id) in dashboard_order().
+        The plain job_id >= bound comes first so the database can seek on
+        score_job_value_id_idx; the OR alone forces a scan and a sort.
+        """
+        return self.filter(job_id__gte=job_id).filter(
+            Q(job_id__gt=job_id)
+            | Q(value__lt=value)
+            | Q(value=value, id__gt=score_id)
+        )
+
+    def decide(self, status):
+        """
+        Recruiter decision (SHORTLISTED / REJECTED) for every submitted row
+        in this queryset, as one UPDATE; drafts are left alone. Returns the
+        number of rows changed.
+        """
+        if status not in ("SHORTLISTED", "REJECTED"):
+            raise ValueError(f"not a recruiter decision: {status!r}")
+        return self.submitted().update(status=status, is_shortlisted=status == "SHORTLISTED")
+
+    def top_per_job(self, k):
+        """
+        Best `k` rows of every job by value, ranked with a ROW_NUMBER()
+        window partitioned by job, so all jobs come back in one query.
+        """
+        return self.annotate(
+            rank=Window(
+                expression=RowNumber(),
+                partition_by=[F("job_id")],
+                order_by=[F("value").desc(), F("id").asc()],
+            )
+        ).filter(rank__lte=k)
+
+
 class Score(models.Model):
     STATUS_CHOICES = [
         ("DRAFT", "Draft (for applicant only)"),
@@ -33,6 +149,9 @@ class Score(models.Model):
     ]
 
     resume = models.ForeignKey(Resume, on_delete=models.CASCADE)
+    # copy of resume.user, so per-applicant lookups don't join core_resume;
+    # Resume.save moves it along (a queryset .update(user=...) does not)
+    user =models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
     value = models.FloatField()
     recommended_skills = models.TextField(blank=True, null=True)
@@ -44,10 +163,134 @@ class Score(models.Model):
         default="DRAFT",            # 🔥 important: start as DRAFT
     )
 
+    objects = ScoreQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # job_list / my_applications / upload: a user's scores, by status and job
+            models.Index(fields=["user", "status", "job"], name="score_user_status_job_idx"),
+            # recruiter_dashboard keyset order and top-K per job
+            models.Index(fields=["job", "-value", "id"], name="score_job_value_id_idx"),
+        ]
+        constraints = [
+            # one application per resume and job (also serves resume+job lookups)
+            models.UniqueConstraint(fields=["resume", "job"], name="unique_score_resume_job"),
+            # one application per applicant and job
+            models.UniqueConstraint(fields=["user", "job"], name="unique_score_user_job"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remember what was loaded so a save can tell if the status changed
+        instance._loaded_status = dict(zip(field_names, values)).get("status")
+        return instance
+
+    def submission_changed(self):
+        """True if this save moved the row into or out of DRAFT (or we can't tell)."""
+        loaded = getattr(self, "_loaded_status", None)
+        if loaded is None:
+            return True
+        return (loaded == "DRAFT") != (self.status == "DRAFT")
+
+    def save(self, *args, **kwargs):
+        if self.user_id is None and self.resume_id is not None:
+            self.user_id = self.resume.user_id
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.resume} - {self.job} - {self.value} ({self.status})"
 
 
+class RescoreRun(models.Model):
+    """
+    One background recompute of a single job's scores against the
+    existing resumes, created whenever the job's required skills change.
+    """
+    STATUS_CHOICES = [
+        ("PENDING", "Pending"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="rescore_runs")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="PENDING")
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)   # last claim / progress report
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Rescore {self.job} ({self.processed}/{self.total}, {self.status})"
+
+
+class ResumeAnalysis(models.Model):
+    """
+    One queued analysis of an uploaded resume (text extraction, skill
+    extraction and scoring), processed by `manage.py run_worker`.
+    """
+    STATUS_CHOICES = [
+        ("QUEUED", "Queued"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    # cleared when the file is rejected and the resume deleted
+    resume = models.ForeignKey(Resume, on_delete=models.SET_NULL, null=True, blank=True)
+    file_name = models.CharField(max_length=255, blank=True)
+    extra_skills = models.TextField(blank=True)
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="QUEUED")
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    scores_created = models.PositiveIntegerField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "run_after"])]
+
+    def __str__(self):
+        return f"Analysis of {self.file_name or self.resume_id} ({self.status})"
+
+
+class ExtractedResumeText(models.Model):
+    """
+    Content-hash cache of extract_text_from_resume / extract_skills_from_text
+    results, so byte-identical uploads are never parsed twice.
+    """
+    sha256 = models.CharField(max_length=64)
+    file_type = models.CharField(max_length=10)          # "pdf", "docx", "txt", ...
+    extractor_version = models.CharField(max_length=20)
+    text = models.TextField(blank=True)
+    skills = models.TextField(blank=True)
+    size = models.PositiveIntegerField(default=0)        # bytes of text + skills
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["sha256", "file_type", "extractor_version"],
+                name="unique_extracted_resume_text",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.sha256[:12]}… ({self.file_type}, v{self.extractor_version})"
+
+
 from django.contrib.auth.models import User
 from django.db import models
 
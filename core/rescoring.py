@@ -0,0 +1,236 @@
+"""
+Incremental rescoring: when a job is created or its required skills
+change, only that job's column of the users × jobs score matrix is
+recomputed, in bounded batches, outside the request that saved the job.
+"""
+
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+
+from . import taxonomy
+from .matching import to_score_value
+from .models import RescoreRun, Resume, Score
+from .scoring import invalidate_scores
+
+logger = logging.getLogger(__name__)
+
+
+def _batch_size():
+    return getattr(settings, "SKILLMATCH_RESCORE_BATCH_SIZE", 500)
+
+
+def _claimable(now):
+    # a RUNNING run that stopped reporting progress belongs to a thread that died;
+    # a FAILED one is retried after a delay, up to SKILLMATCH_RESCORE_MAX_ATTEMPTS claims
+    lease = timedelta(seconds=getattr(settings, "SKILLMATCH_RESCORE_LEASE_SECONDS", 300))
+    retry = timedelta(seconds=getattr(settings, "SKILLMATCH_RESCORE_RETRY_SECONDS", 60))
+    return Q(attempts__lt=getattr(settings, "SKILLMATCH_RESCORE_MAX_ATTEMPTS", 3)) & (
+        Q(status="PENDING")
+        | Q(status="FAILED", finished_at__lt=now - retry)
+        | Q(status="RUNNING", heartbeat_at__isnull=True)
+        | Q(status="RUNNING", heartbeat_at__lt=now - lease)
+    )
+
+
+def claimable_runs():
+    """Ids of runs nobody is working on, oldest first."""
+    return list(
+        RescoreRun.objects.filter(_claimable(timezone.now())).order_by("id").values_list("id", flat=True)
+    )
+
+
+def claim_run(run_id):
+    """
+    Take one rescore run with a conditional UPDATE, or return None when
+    it is finished, out of attempts or still live in another thread /
+    process.
+    """
+    now = timezone.now()
+    claimed = (
+        RescoreRun.objects
+        .filter(_claimable(now), id=run_id)
+        .update(status="RUNNING", heartbeat_at=now, attempts=F("attempts") + 1)
+    )
+    if not claimed:
+        return None
+    return RescoreRun.objects.select_related("job").get(id=run_id)
+
+
+def claim_next_run():
+    """The oldest claimable run, taken for this caller, or None."""
+    for run_id in claimable_runs()[:10]:
+        run = claim_run(run_id)
+        if run is not None:
+            return run
+    return None
+
+
+def _resumes_without_score(job):
+    """
+    Resumes with no application for `job` yet: the newest resume of
+    every user who has none (the resume a fresh upload would have used),
+    plus every resume imported without a user (manage.py ingest_resumes),
+    each of which stands for its own candidate.
+    """
+    users_with_score = (
+        Score.objects
+        .filter(job=job, user__isnull=False)
+        .values("user")
+    )
+    analysed = (
+        Resume.objects
+        .exclude(skills__isnull=True)
+        .exclude(skills="")             # upload still waiting for its analysis
+    )
+    latest_ids = (
+        analysed
+        .filter(user__isnull=False)
+        .exclude(user__in=users_with_score)
+        .values("user")
+        .annotate(latest_id=Max("id"))
+        .values("latest_id")
+    )
+    unowned_ids = (
+        analysed
+        .filter(user__isnull=True)
+        .exclude(id__in=Score.objects.filter(job=job).values("resume"))
+        .values("id")
+    )
+    return Resume.objects.filter(Q(id__in=latest_ids) | Q(id__in=unowned_ids))
+
+
+def _batches(queryset, batch_size):
+    """Yield lists of rows in id order, one keyset page per query."""
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id).order_by("id")[:batch_size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+
+
+def _score_batch(job_text, resumes):
+    from .tfidf import SkillIndex
+
+    index = SkillIndex([r.id for r in resumes], [r.skills for r in resumes])
+    return index.similarities(job_text)
+
+
+def _missing_skills(job_skills, resumes):
+    """recommended_skills for each resume: the job's skill ids it lacks."""
+    resume_skills = taxonomy.skill_ids_for_resumes(resumes)
+    return taxonomy.missing_names((job_skills, resume_skills[r.id]) for r in resumes)
+
+
+def run_rescore(run, batch_size=None):
+    """
+    Recompute `run.job` against existing resumes:
+      - refresh value / recommended_skills of its existing Score rows
+        (status is left untouched), and
+      - create DRAFT rows for candidates who have no application for it
+        yet (see _resumes_without_score).
+    Progress is saved on the RescoreRun after every batch. `run` should
+    have been taken with claim_run(), so no other runner works on it.
+    """
+    batch_size = batch_size or _batch_size()
+    job = run.job
+    job_text = job.required_skills or ""
+    job_skills = taxonomy.parse(job_text, create=True)
+
+    existing = Score.objects.filter(job=job).select_related("resume")
+    missing = _resumes_without_score(job)
+
+    run.status = "RUNNING"
+    run.total = existing.count() + missing.count()
+    run.processed = 0
+    run.heartbeat_at = timezone.now()
+    run.save(update_fields=["status", "total", "processed", "heartbeat_at"])
+
+    try:
+        for scores in _batches(existing, batch_size):
+            sims = _score_batch(job_text, [s.resume for s in scores])
+            recommendations = _missing_skills(job_skills, [s.resume for s in scores])
+            for score, sim, recommended in zip(scores, sims, recommendations):
+                score.value = to_score_value(sim)
+                score.recommended_skills = recommended
+            with transaction.atomic():
+                Score.objects.bulk_update(scores, ["value", "recommended_skills"])
+                invalidate_scores()
+            _report(run, len(scores))
+
+        for resumes in _batches(missing, batch_size):
+            sims = _score_batch(job_text, resumes)
+            recommendations = _missing_skills(job_skills, resumes)
+            drafts = [
+                Score(
+                    resume=resume,
+                    user_id=resume.user_id,
+                    job=job,
+                    value=to_score_value(sim),
+                    recommended_skills=recommended,
+                    status="DRAFT",
+                    is_shortlisted=False,
+                )
+                for resume, sim, recommended in zip(resumes, sims, recommendations)
+            ]
+            with transaction.atomic():
+                # an upload may have created some of these since the batch was read
+                Score.objects.bulk_create(drafts, ignore_conflicts=True)
+                invalidate_scores()
+            _report(run, len(drafts))
+
+    except Exception as exc:
+        logger.exception("Rescore of job %s failed", job.id)
+        run.status = "FAILED"
+        run.error = str(exc)
+    else:
+        run.status = "DONE"
+    run.finished_at = timezone.now()
+    run.save(update_fields=["status", "error", "finished_at"])
+    return run
+
+
+def _report(run, count):
+    run.processed += count
+    run.heartbeat_at = timezone.now()
+    run.save(update_fields=["processed", "heartbeat_at"])
+    logger.info(
+        "Rescore job %s: %s/%s resumes", run.job_id, run.processed, run.total
+    )
+
+
+def _run_in_thread(run_id):
+    close_old_connections()
+    try:
+        run = claim_run(run_id)
+        if run is not None:
+            run_rescore(run)
+    finally:
+        connection.close()
+
+
+def schedule_rescore(job):
+    """
+    Queue a RescoreRun for `job` once the surrounding transaction commits.
+    By default the run is executed in a background thread so the admin /
+    request that saved the job returns immediately; set
+    SKILLMATCH_RESCORE_ASYNC = False to run it inline instead.
+    """
+    def start():
+        run = RescoreRun.objects.create(job=job)
+        if getattr(settings, "SKILLMATCH_RESCORE_ASYNC", True):
+            threading.Thread(
+                target=_run_in_thread, args=(run.id,), daemon=True,
+                name=f"rescore-job-{job.id}",
+            ).start()
+        else:
+            run_rescore(claim_run(run.id))
+
+    transaction.on_commit(start)
@@ -0,0 +1,98 @@
+"""
+Content-hash cache for extracted resume text and skills.
+
+Entries are keyed by SHA-256 of the uploaded bytes, the file type and the
+extractor version, stored in the database (shared by every worker) and
+evicted least-recently-used once their total size exceeds
+SKILLMATCH_EXTRACTION_CACHE_MAX_BYTES.
+"""
+
+import hashlib
+import os
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import ExtractedResumeText
+
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name, n=1):
+    with _stats_lock:
+        _stats[name] += n
+
+
+def stats():
+    """Hit/miss/eviction counters of this process."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def _max_bytes():
+    return getattr(settings, "SKILLMATCH_EXTRACTION_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+
+
+def _key(filename, file_bytes, version):
+    file_type = os.path.splitext(filename or "")[1].lstrip(".").lower()[:10]
+    return {
+        "sha256": hashlib.sha256(file_bytes).hexdigest(),
+        "file_type": file_type,
+        "extractor_version": version,
+    }
+
+
+def get(filename, file_bytes, version):
+    """(text, skills) if this exact file was extracted before, else None."""
+    key = _key(filename, file_bytes, version)
+    entry = ExtractedResumeText.objects.filter(**key).only("id", "text", "skills").first()
+    if entry is None:
+        _count("misses")
+        return None
+
+    ExtractedResumeText.objects.filter(id=entry.id).update(
+        hits=F("hits") + 1, last_used_at=timezone.now(),
+    )
+    _count("hits")
+    return entry.text, entry.skills
+
+
+def put(filename, file_bytes, version, text, skills):
+    size = len(text.encode()) + len(skills.encode())
+    if size > _max_bytes():
+        return
+    try:
+        with transaction.atomic():
+            ExtractedResumeText.objects.create(
+                text=text, skills=skills, size=size, **_key(filename, file_bytes, version),
+            )
+    except IntegrityError:
+        # another worker cached the same file meanwhile
+        return
+    evict()
+
+
+def evict(max_bytes=None):
+    """Drop least-recently-used entries until the cache fits in max_bytes."""
+    max_bytes = _max_bytes() if max_bytes is None else max_bytes
+    total = ExtractedResumeText.objects.aggregate(total=Sum("size"))["total"] or 0
+    if total <= max_bytes:
+        return 0
+
+    doomed = []
+    for entry_id, size in (
+        ExtractedResumeText.objects.order_by("last_used_at", "id").values_list("id", "size").iterator()
+    ):
+        if total <= max_bytes:
+            break
+        doomed.append(entry_id)
+        total -= size
+
+    for start in range(0, len(doomed), 500):
+        ExtractedResumeText.objects.filter(id__in=doomed[start:start + 500]).delete()
+    _count("evictions", len(doomed))
+    return len(doomed)
@@ -0,0 +1,83 @@
+"""
+Write paths for Score rows.
+"""
+
+from django.db import transaction
+
+from . import taxonomy
+from .cache import bump_on_commit
+from .matching import get_job_index, to_score_value
+from .models import Score
+
+
+# rows per INSERT statement when fanning a resume out over the job catalog
+BULK_CREATE_BATCH_SIZE = 500
+
+# cache namespace of everything rendered from Score rows (score_list fragment)
+SCORES_NAMESPACE = "scores"
+
+
+def invalidate_scores():
+    bump_on_commit(SCORES_NAMESPACE)
+
+
+def applied_job_ids(user):
+    """
+    Ids of every job this user already has a Score for (any status),
+    loaded in one query.
+    """
+    if user is None:
+        return set()
+    return set(
+        Score.objects
+        .filter(user=user)
+        .values_list("job_id", flat=True)
+    )
+
+
+def build_draft_scores(resume, skills_text, job_index=None):
+    """
+    Unsaved DRAFT Score rows for `resume` against every job its owner has
+    not applied to yet. Bulk callers pass the job_index they already hold.
+    """
+    job_index = job_index or get_job_index()
+    already_applied = applied_job_ids(resume.user)
+    similarities = job_index.similarities(skills_text)
+    # missing skills of every job at once, as packed skill-id bitsets
+    missing = taxonomy.missing_names_for_jobs(job_index.ids, job_index.texts, taxonomy.parse(skills_text))
+
+    drafts = [
+        Score(
+            resume=resume,
+            user_id=resume.user_id,
+            job_id=job_id,
+            value=to_score_value(sim),
+            recommended_skills=recommended,
+            status="DRAFT",          # applicant still editing
+            is_shortlisted=False,
+        )
+        for job_id, recommended, sim in zip(job_index.ids, missing, similarities)
+        if job_id not in already_applied
+    ]
+    return drafts
+
+
+def save_draft_scores(drafts):
+    """
+    Insert `drafts`, skipping any (resume, job) / (user, job) pair that
+    already has a row: a rescore run of the same job may have inserted it
+    since the drafts were built.
+    """
+    with transaction.atomic():
+        Score.objects.bulk_create(drafts, batch_size=BULK_CREATE_BATCH_SIZE, ignore_conflicts=True)
+        invalidate_scores()
+
+
+def create_draft_scores(resume, skills_text):
+    """
+    Create DRAFT applications for `resume` against every job its owner
+    has not applied to yet. Returns the number of Score rows created.
+    """
+    drafts = build_draft_scores(resume, skills_text)
+    save_draft_scores(drafts)
+    return len(drafts)
@@ -0,0 +1,64 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .job_catalog import invalidate_applied, invalidate_jobs
+from . import taxonomy
+from .models import Job, Resume, Score, Skill, SkillAlias
+from .rescoring import schedule_rescore
+from .scoring import invalidate_scores
+
+
+@receiver(post_save, sender=Job)
+def rescore_changed_job(sender, instance, created, raw=False, **kwargs):
+    # loaddata (raw) saves should not fan out into score writes
+    if raw:
+        return
+    if created or instance.required_skills_changed():
+        instance._loaded_required_skills = instance.required_skills
+        taxonomy.sync_job(instance)
+        schedule_rescore(instance)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def drop_cached_jobs(sender, instance, **kwargs):
+    invalidate_jobs()
+
+
+@receiver(post_save, sender=Score)
+def drop_cached_applied_jobs(sender, instance, created, **kwargs):
+    # the applied set only holds non-DRAFT rows, so only DRAFT ↔ non-DRAFT matters
+    changed = instance.status != "DRAFT" if created else instance.submission_changed()
+    if changed:
+        invalidate_applied(instance.user_id)
+    instance._loaded_status = instance.status
+
+
+@receiver(post_save, sender=Resume)
+def drop_cached_scores_of_moved_resume(sender, instance, created, raw=False, **kwargs):
+    # Resume.save moves the scores to the new owner; both users' applied sets change
+    if raw or created or not instance.user_changed():
+        return
+    invalidate_applied(instance._loaded_user_id)
+    invalidate_applied(instance.user_id)
+    invalidate_scores()
+
+
+@receiver(post_delete, sender=Score)
+def drop_cached_applied_jobs_on_delete(sender, instance, **kwargs):
+    if instance.status != "DRAFT":
+        invalidate_applied(instance.user_id)
+
+
+@receiver(post_save, sender=Score)
+@receiver(post_delete, sender=Score)
+def drop_cached_score_list(sender, instance, **kwargs):
+    invalidate_scores()
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def drop_cached_skill_lookup(sender, instance, **kwargs):
+    taxonomy.invalidate()
@@ -0,0 +1,122 @@
+"""
+Skill vocabulary and extraction from resume text.
+"""
+
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+
+SKILL_KEYWORDS = [
+    "python", "java", "c++", "c", "html", "css", "javascript", "react",
+    "angular", "node", "django", "flask", "spring", "sql", "mysql",
+    "postgresql", "mongodb", "oracle", "git", "github", "docker", "aws",
+    "azure", "gcp", "pandas", "numpy", "matplotlib", "tensorflow", "keras",
+    "pytorch", "machine learning", "deep learning", "nlp", "data analysis",
+    "data science", "excel", "power bi", "tableau", "linux"
+]
+
+# other spellings → canonical name (a SKILL_KEYWORDS entry). Also matched in
+# resume text, so only unambiguous ones; more can be added as SkillAlias rows
+# in the admin (migration 0011 seeds these).
+SKILL_ALIASES = {
+    "c plus plus": "c++",
+    "ecmascript": "javascript",
+    "reactjs": "react",
+    "react.js": "react",
+    "angularjs": "angular",
+    "angular.js": "angular",
+    "nodejs": "node",
+    "node.js": "node",
+    "postgres": "postgresql",
+    "amazon web services": "aws",
+    "microsoft azure": "azure",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "ml": "machine learning",
+    "natural language processing": "nlp",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "powerbi": "power bi",
+}
+
+
+def normalize_skill(name):
+    """'  PostgreSQL ' → 'postgresql', 'Power\n BI' → 'power bi'"""
+    return " ".join((name or "").lower().split())
+
+
+def canonical_skill(name):
+    """Normalized name with built-in aliases resolved: 'Postgres' → 'postgresql'."""
+    name = normalize_skill(name)
+    return SKILL_ALIASES.get(name, name)
+
+
+# ----------------- EXTRACTION ENGINES -----------------
+# Any class taking the vocabulary and offering find_all(text) → set of
+# normalized skills, and optionally find_all_many(texts) for batches.
+# SKILLMATCH_SKILL_EXTRACTOR picks one by name or by dotted path.
+EXTRACTORS = {
+    "automaton": "core.skills.automaton.SkillAutomaton",
+    "regex": "core.skills.regex.SkillRegex",
+    "spacy": "core.skills.nlp.SpacyPhraseMatcher",
+    "substring": "core.skills.substring.SubstringMatcher",
+}
+DEFAULT_EXTRACTOR = "automaton"
+
+_extractors = {}
+_extractors_lock = threading.Lock()
+
+
+def extractor_name():
+    """Configured engine (SKILLMATCH_SKILL_EXTRACTOR)."""
+    return getattr(settings, "SKILLMATCH_SKILL_EXTRACTOR", DEFAULT_EXTRACTOR)
+
+
+def get_extractor(name=None):
+    """
+    Matcher of engine `name` (default: the configured one) over
+    SKILL_KEYWORDS and their aliases, compiled on first use.
+    """
+    name = name or extractor_name()
+    with _extractors_lock:
+        if name not in _extractors:
+            _extractors[name] = build_extractor(name)
+        return _extractors[name]
+
+
+def build_extractor(name):
+    """A freshly compiled engine `name` (see EXTRACTORS), not cached."""
+    try:
+        engine = import_string(EXTRACTORS.get(name, name))
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            f"Unknown skill extractor {name!r}: use one of {sorted(EXTRACTORS)} or a dotted path"
+        ) from exc
+    return engine(SKILL_KEYWORDS + list(SKILL_ALIASES))
+
+
+def extract_skills_from_text(text: str, engine=None) -> str:
+    """
+    Find known skill keywords in the resume text with the configured
+    engine (whole words only, see SkillAutomaton); aliases are reported
+    under their canonical name. Returns comma-separated skills.
+    """
+    found = get_extractor(engine).find_all(text or "")
+    return ", ".join(sorted({SKILL_ALIASES.get(skill, skill) for skill in found}))
+
+
+def extract_skills_many(texts, engine=None):
+    """
+    extract_skills_from_text() of every text, batched where the engine
+    supports it (the spaCy engine tokenizes through nlp.pipe).
+    """
+    extractor = get_extractor(engine)
+    texts = [text or "" for text in texts]
+    if hasattr(extractor, "find_all_many"):
+        found = extractor.find_all_many(texts)
+    else:
+        found = [extractor.find_all(text) for text in texts]
+    return [", ".join(sorted({SKILL_ALIASES.get(s, s) for s in skills})) for skills in found]
@@ -0,0 +1,136 @@
+"""
+Aho-Corasick multi-pattern matcher for skill extraction.
+
+The automaton is compiled once from the skill vocabulary and finds every
+vocabulary entry in a single left-to-right pass over the text, so the
+cost is O(len(text) + matches) however many skills there are.
+
+Matches are boundary-aware: a skill that starts (ends) with a word
+character must not be preceded (followed) by one. Word characters are
+letters, digits and "+#_", so "c" is not found inside "c++", "c#" or
+"magic", and "git" is not found inside "digital", while "node" still
+matches "node.js". A match inside a longer one is dropped: "c plus plus"
+reports "c plus plus" (→ c++), not also "c".
+"""
+
+import re
+from collections import deque
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def is_word_char(ch):
+    return ch.isalnum() or ch in "+#_"
+
+
+def normalize(text):
+    """Lowercase and collapse whitespace runs, so 'Power\\n BI' == 'power bi'."""
+    return _WHITESPACE.sub(" ", text.lower())
+
+
+def drop_contained(matches):
+    """
+    (start, end, skill) matches minus those lying inside a longer one, so
+    the alias "c plus plus" doesn't also report "c". Partial overlaps are
+    kept. Sorted by start.
+    """
+    reach = -1
+    for start, end, skill in sorted(matches, key=lambda m: (m[0], -m[1])):
+        if end <= reach:
+            continue
+        reach = end
+        yield start, end, skill
+
+
+class SkillAutomaton:
+    """
+    Compiled matcher over a fixed vocabulary.
+
+        automaton = SkillAutomaton(["python", "c++", "power bi"])
+        automaton.find_all("Python / C++ / Power BI")  → {"python", "c++", "power bi"}
+    """
+
+    name = "automaton"
+
+    def __init__(self, skills):
+        self.skills = []
+        self._goto = [{}]      # state → {char: next state}
+        self._fail = [0]
+        self._out = [()]       # state → indices of skills ending here
+
+        seen = set()
+        for skill in skills:
+            pattern = normalize(skill).strip()
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self._add(pattern, len(self.skills))
+            self.skills.append(pattern)
+
+        self._build_failure_links()
+
+        # boundary rules depend only on the pattern's first / last character
+        self._lengths = [len(p) for p in self.skills]
+        self._check_left = [is_word_char(p[0]) for p in self.skills]
+        self._check_right = [is_word_char(p[-1]) for p in self.skills]
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _add(self, pattern, index):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (index,)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # inherit matches of the longest proper suffix
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text):
+        """
+        Yield (start, end, skill) for every boundary-respecting match in
+        the *normalized* text (offsets refer to normalize(text)) that is
+        not inside a longer match, in text order.
+        """
+        return drop_contained(self._iter_all(text))
+
+    def _iter_all(self, text):
+        text = normalize(text)
+        n = len(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        lengths, check_left, check_right = self._lengths, self._check_left, self._check_right
+
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                start = i - lengths[index] + 1
+                if check_left[index] and start > 0 and is_word_char(text[start - 1]):
+                    continue
+                if check_right[index] and i + 1 < n and is_word_char(text[i + 1]):
+                    continue
+                yield start, i + 1, self.skills[index]
+
+    def find_all(self, text):
+        """Set of distinct skills found in `text`."""
+        return {skill for _, _, skill in self.iter_matches(text)}
@@ -0,0 +1,83 @@
+"""
+spaCy PhraseMatcher skill extraction.
+
+The vocabulary is tokenized once into phrase patterns matched on the
+lowercased token text (attr="LOWER"), so matches fall on token
+boundaries: "c" is not found inside "c++" or "magic". Texts are
+whitespace-normalized first, so "power bi" matches "Power\\n BI". Only
+the tokenizer is needed for that: the model (SKILLMATCH_SPACY_MODEL,
+en_core_web_sm by default) is loaded with its tagger, parser, NER etc.
+excluded, once per process.
+
+spaCy is imported when the engine is built, never by core.skills, so the
+other engines work without it. find_all_many() runs texts through
+nlp.pipe in batches of SKILLMATCH_SPACY_BATCH_SIZE for bulk imports.
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from .automaton import drop_contained, normalize
+
+DEFAULT_MODEL = "en_core_web_sm"
+DEFAULT_BATCH_SIZE = 64
+
+# every trained component of the en_core_web_* pipelines; PhraseMatcher on
+# LOWER only needs the tokenizer
+UNUSED_PIPES = ["tok2vec", "tagger", "morphologizer", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
+
+
+def load_model(name=None):
+    """spaCy pipeline `name` (default SKILLMATCH_SPACY_MODEL) reduced to its tokenizer."""
+    try:
+        import spacy
+    except ImportError as exc:
+        raise ImproperlyConfigured("The 'spacy' skill extractor needs spaCy: pip install spacy") from exc
+    name = name or getattr(settings, "SKILLMATCH_SPACY_MODEL", DEFAULT_MODEL)
+    try:
+        return spacy.load(name, exclude=UNUSED_PIPES)
+    except OSError as exc:
+        raise ImproperlyConfigured(
+            f"spaCy model {name!r} is not installed (python -m spacy download {name}, "
+            f"or SKILLMATCH_SPACY_MODEL = 'blank:en' for the bare English tokenizer)"
+        ) from exc
+
+
+class SpacyPhraseMatcher:
+    """
+    Compiled matcher over a fixed vocabulary.
+
+        matcher = SpacyPhraseMatcher(["python", "c++", "power bi"])
+        matcher.find_all("Python / C++ / Power BI")  → {"python", "c++", "power bi"}
+    """
+
+    name = "spacy"
+
+    def __init__(self, skills, model=None, batch_size=None):
+        from spacy.matcher import PhraseMatcher
+
+        self.nlp = load_model(model)
+        self.batch_size = batch_size or getattr(settings, "SKILLMATCH_SPACY_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+        self.skills = sorted({p for p in (normalize(s).strip() for s in skills) if p})
+        self.matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for skill, pattern in zip(self.skills, self.nlp.tokenizer.pipe(self.skills)):
+            self.matcher.add(skill, [pattern])
+
+    def __len__(self):
+        return len(self.skills)
+
+    def _found(self, doc):
+        strings = self.nlp.vocab.strings
+        matches = ((start, end, match_id) for match_id, start, end in self.matcher(doc))
+        return {strings[match_id] for _, _, match_id in drop_contained(matches)}
+
+    def find_all(self, text):
+        """Set of distinct skills occurring in `text`."""
+        return self._found(self.nlp(normalize(text)))
+
+    def find_all_many(self, texts, batch_size=None):
+        """find_all() of every text, tokenized through nlp.pipe in batches."""
+        return [
+            self._found(doc)
+            for doc in self.nlp.pipe(map(normalize, texts), batch_size=batch_size or self.batch_size)
+        ]
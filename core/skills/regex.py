@@ -0,0 +1,82 @@
+"""
+Compiled-regex skill matcher: the whole vocabulary as one alternation.
+
+Same interface and boundary rules as SkillAutomaton (see
+core.skills.automaton): a skill that starts (ends) with a word character
+must not be preceded (followed) by one, word characters being letters,
+digits and "+#_". Longer skills are preferred at any position, so "c++"
+wins over "c", and "c" is never found inside "c++", "c#" or "magic".
+
+The alternation is factored into a trie (c(?:ss|\+\+|…)) rather than
+listing every skill: the regex engine then tests one branch per
+character instead of every alternative at every position, which is what
+makes a plain "skill1|skill2|…" pattern slow.
+
+Matches don't overlap: the regex engine consumes the longest skill at a
+position and resumes after it. The automaton only drops matches lying
+inside a longer one, so where two skills partly overlap it reports both
+and this engine only the first; results can differ in that case.
+"""
+
+import re
+
+from .automaton import is_word_char, normalize
+
+_LEFT_AFTER = r"(?<![\w+#]{})"     # after the first character: nothing word-like before it
+_RIGHT = r"(?![\w+#])"
+
+
+def _trie(patterns):
+    root = {}
+    for pattern in patterns:
+        node = root
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[None] = True          # a pattern ends here
+    return root
+
+
+def _branches(node, last_char):
+    """Regex for everything below `node`, reached through `last_char`."""
+    alternatives = [re.escape(ch) + _branches(child, ch) for ch, child in sorted(node.items(), key=_edge) if ch]
+    if None in node:
+        # tried after every longer continuation
+        alternatives.append(_RIGHT if is_word_char(last_char) else "")
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+def _edge(item):
+    return item[0] or ""
+
+
+class SkillRegex:
+    """
+    Compiled matcher over a fixed vocabulary.
+
+        matcher = SkillRegex(["python", "c++", "power bi"])
+        matcher.find_all("Python / C++ / Power BI")  → {"python", "c++", "power bi"}
+    """
+
+    name = "regex"
+
+    def __init__(self, skills):
+        self.skills = sorted({p for p in (normalize(s).strip() for s in skills) if p})
+        root = _trie(self.skills)
+        # the left boundary is checked after the first character, as a
+        # two-character lookbehind, so every branch starts with a literal
+        # and the engine can skip positions that can't start any skill
+        alternatives = [
+            re.escape(ch) + (_LEFT_AFTER.format(re.escape(ch)) if is_word_char(ch) else "") + _branches(child, ch)
+            for ch, child in sorted(root.items())
+        ]
+        # (?!) never matches: an empty vocabulary finds nothing
+        self._regex = re.compile("|".join(alternatives) or "(?!)")
+
+    def __len__(self):
+        return len(self.skills)
+
+    def find_all(self, text):
+        """Set of distinct skills found in `text`."""
+        return set(self._regex.findall(normalize(text)))
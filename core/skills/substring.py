@@ -0,0 +1,22 @@
+"""
+The original skill matcher: one substring test per skill, no word
+boundaries ("c" is found in almost any text, "java" inside "javascript").
+Kept as the baseline engine for manage.py compare_extractors.
+"""
+
+from .automaton import normalize
+
+
+class SubstringMatcher:
+    name = "substring"
+
+    def __init__(self, skills):
+        self.skills = sorted({p for p in (normalize(s).strip() for s in skills) if p})
+
+    def __len__(self):
+        return len(self.skills)
+
+    def find_all(self, text):
+        """Set of distinct skills occurring anywhere in `text`."""
+        text = normalize(text)
+        return {skill for skill in self.skills if skill in text}
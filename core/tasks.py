@@ -0,0 +1,170 @@
+"""
+Database-backed queue for resume analyses.
+
+upload_resume stores the file and a QUEUED ResumeAnalysis row; the
+`manage.py run_worker` process claims rows with a conditional UPDATE (no
+broker, works on SQLite and Postgres alike), runs core.analysis on them
+and retries failures with exponential backoff. When no analysis is
+waiting it picks up rescore runs that failed or whose thread died (see
+core.rescoring.claim_next_run).
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .analysis import ResumeRejected, analyse_resume
+from .models import ResumeAnalysis
+from .rescoring import claim_next_run, run_rescore
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue_analysis(resume, extra_skills=""):
+    return ResumeAnalysis.objects.create(
+        user=resume.user,
+        resume=resume,
+        file_name=resume.file.name,
+        extra_skills=extra_skills or "",
+        max_attempts=_setting("SKILLMATCH_ANALYSIS_MAX_ATTEMPTS", 3),
+    )
+
+
+def _claimable(now):
+    # a RUNNING row whose lease expired belongs to a worker that died
+    lease = timedelta(seconds=_setting("SKILLMATCH_ANALYSIS_LEASE_SECONDS", 300))
+    return (
+        Q(status="QUEUED", run_after__lte=now)
+        | Q(status="RUNNING", locked_at__lt=now - lease)
+    )
+
+
+def claim_next():
+    """
+    Atomically take the oldest runnable analysis, or return None.
+    Several workers may race for the same row; only one UPDATE matches.
+    """
+    now = timezone.now()
+    candidates = (
+        ResumeAnalysis.objects
+        .filter(_claimable(now))
+        .order_by("run_after", "id")
+        .values_list("id", flat=True)[:10]
+    )
+    for task_id in candidates:
+        task = claim(task_id, now)
+        if task is not None:
+            return task
+    return None
+
+
+def claim(task_id, now=None):
+    """Take one specific analysis if it is runnable; None if someone else has it."""
+    now = now or timezone.now()
+    claimed = (
+        ResumeAnalysis.objects
+        .filter(_claimable(now), id=task_id)
+        .update(status="RUNNING", locked_at=now, attempts=F("attempts") + 1)
+    )
+    if not claimed:
+        return None
+    return ResumeAnalysis.objects.select_related("resume").get(id=task_id)
+
+
+def backoff_delay(attempts):
+    """Seconds to wait before retry number `attempts` (1, 2, ...)."""
+    base = _setting("SKILLMATCH_ANALYSIS_BACKOFF_SECONDS", 10)
+    cap = _setting("SKILLMATCH_ANALYSIS_BACKOFF_MAX_SECONDS", 600)
+    return min(cap, base * 2 ** (attempts - 1))
+
+
+def run_analysis(task):
+    """
+    Process a claimed task and record the outcome on it:
+    DONE, FAILED (rejected file or out of attempts) or QUEUED again
+    with a backed-off run_after.
+    """
+    try:
+        if task.resume is None:
+            raise ResumeRejected("The uploaded file no longer exists.")
+        task.scores_created = analyse_resume(task.resume, task.extra_skills)
+
+    except ResumeRejected as exc:
+        # keep the applicant's list clean: an unusable upload is not kept
+        resume = task.resume
+        task.resume = None
+        if resume is not None:
+            resume.file.delete(save=False)
+            resume.delete()
+        task.status = "FAILED"
+        task.error = str(exc)
+
+    except Exception as exc:
+        logger.exception("Resume analysis %s failed (attempt %s)", task.id, task.attempts)
+        task.error = f"{type(exc).__name__}: {exc}"
+        if task.attempts >= task.max_attempts:
+            task.status = "FAILED"
+        else:
+            task.status = "QUEUED"
+            task.run_after = timezone.now() + timedelta(seconds=backoff_delay(task.attempts))
+
+    else:
+        task.status = "DONE"
+        task.error = ""
+
+    task.locked_at = None
+    if task.status in ("DONE", "FAILED"):
+        task.finished_at = timezone.now()
+    task.save()
+    return task
+
+
+def run_inline(task):
+    """
+    Analyse a just-queued task within the current request, for setups
+    without a worker (SKILLMATCH_ANALYSIS_ASYNC = False): a failure is
+    retried right away instead of after a backoff, so the task always
+    ends DONE or FAILED and nothing is left QUEUED for nobody to pick up.
+    """
+    task = run_analysis(claim(task.id))
+    while task.status == "QUEUED":
+        ResumeAnalysis.objects.filter(id=task.id).update(run_after=timezone.now())
+        claimed = claim(task.id)
+        if claimed is None:
+            break
+        task = run_analysis(claimed)
+    return task
+
+
+def work(once=False, poll_interval=2.0, stop=lambda: False):
+    """
+    Worker loop: claim and run tasks until the queue is empty (once=True)
+    or forever, sleeping `poll_interval` seconds when idle. Analyses go
+    first; rescore runs are claimed only when none is runnable. Returns
+    the number of analyses and rescore runs processed.
+    """
+    processed = 0
+    while not stop():
+        task = claim_next()
+        if task is not None:
+            run_analysis(task)
+            logger.info("Resume analysis %s: %s", task.id, task.status)
+        else:
+            run = claim_next_run()
+            if run is None:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+            run_rescore(run)
+            logger.info("Rescore run %s of job %s: %s", run.id, run.job_id, run.status)
+        processed += 1
+    return processed
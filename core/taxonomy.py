@@ -0,0 +1,241 @@
+"""
+Skill taxonomy: canonical Skill rows, their aliases, and the job / resume
+skill_tags links.
+
+Comma-separated skill text ("Postgres, Django ,SQL") is resolved once to
+integer Skill ids, aliases included, and stored on the skill_tags
+many-to-many tables. Overlap and missing skills are then set operations
+on those ids – in Python for the scoring loops, or in SQL via the
+indexed link tables – instead of splitting and comparing strings for
+every job × resume pair.
+
+The name → id lookup is held per process and reloaded when the "skills"
+cache namespace is bumped (any Skill / SkillAlias write, see core.signals).
+"""
+
+import threading
+
+from django.conf import settings
+from django.db.models import Count, Q
+
+from .cache import bump_on_commit, get_or_set, version
+from .job_catalog import JOBS_NAMESPACE
+from .matching import split_skills
+from .models import Job, Resume, Skill, SkillAlias
+from .skills import SKILL_ALIASES, normalize_skill
+
+SKILLS_NAMESPACE = "skills"
+NAME_MAX_LENGTH = Skill._meta.get_field("name").max_length
+
+_lookup = None          # (namespace version, {name or alias: id}, {id: name})
+_lookup_lock = threading.Lock()
+
+
+def invalidate():
+    bump_on_commit(SKILLS_NAMESPACE)
+
+
+def _load():
+    ids = dict(Skill.objects.values_list("name", "id"))
+    names = {skill_id: name for name, skill_id in ids.items()}
+    for alias, skill_id in SkillAlias.objects.values_list("name", "skill_id"):
+        ids.setdefault(alias, skill_id)
+    return ids, names
+
+
+def _get_lookup():
+    global _lookup
+    current = version(SKILLS_NAMESPACE)
+    with _lookup_lock:
+        if _lookup is None or _lookup[0] != current:
+            _lookup = (current, *_load())
+        return _lookup
+
+
+# =========================
+#     NAMES → SKILL IDS
+# =========================
+
+def _ids_by_name(names, create=False):
+    """
+    {normalized name: Skill id} for `names`. Unknown names (after the
+    built-in aliases) are left out, or with create=True become new Skill
+    rows in one INSERT. Only job skills and the admin create Skills:
+    free text typed by applicants never grows the vocabulary.
+    """
+    _, ids, _ = _get_lookup()
+    resolved, unknown = {}, {}
+    for name in names:
+        name = normalize_skill(name)
+        if not name or len(name) > NAME_MAX_LENGTH:
+            continue
+        target = name if name in ids else SKILL_ALIASES.get(name, name)
+        if target in ids:
+            resolved[name] = ids[target]
+        else:
+            unknown[name] = target
+
+    if unknown and create:
+        canonical = set(unknown.values())
+        Skill.objects.bulk_create([Skill(name=n) for n in canonical], ignore_conflicts=True)
+        invalidate()
+        # read back rather than trusting bulk_create: another process may
+        # have inserted some of them first
+        created = dict(Skill.objects.filter(name__in=canonical).values_list("name", "id"))
+        resolved.update({name: created[target] for name, target in unknown.items()})
+    return resolved
+
+
+def resolve(names, create=False):
+    """Set of Skill ids for skill names / aliases in any case or spacing."""
+    return set(_ids_by_name(names, create).values())
+
+
+def parse(skills_text, create=False):
+    """'Postgres, django' → frozenset of Skill ids."""
+    return frozenset(resolve(split_skills(skills_text), create))
+
+
+def parse_many(texts, create=False):
+    """parse() for many texts; with create=True all of their unknown skills are created at once."""
+    tokens = [split_skills(text) for text in texts]
+    ids = _ids_by_name(set().union(*tokens), create)
+    return [frozenset(ids[t] for t in ts if t in ids) for ts in tokens]
+
+
+def _names_by_id(skill_ids):
+    _, _, names = _get_lookup()
+    found = {i: names[i] for i in skill_ids if i in names}
+    unknown = set(skill_ids) - found.keys()
+    if unknown:
+        # created since the lookup was loaded
+        found.update(Skill.objects.filter(id__in=unknown).values_list("id", "name"))
+    return found
+
+
+def join_names(id_sets):
+    """Comma-separated sorted names for each set of Skill ids, looked up once for all."""
+    id_sets = list(id_sets)
+    names = _names_by_id(set().union(*id_sets))
+    return [_join(names, ids) for ids in id_sets]
+
+
+def missing_names(pairs):
+    """
+    For each (required ids, have ids) pair, the comma-separated names of
+    the required skills not in `have`.
+    """
+    return join_names(set(required) - set(have) for required, have in pairs)
+
+
+# =========================
+#      SKILL_TAGS LINKS
+# =========================
+
+def sync_job(job):
+    """Point job.skill_tags at the skills of job.required_skills."""
+    job.skill_tags.set(parse(job.required_skills, create=True))
+
+
+def sync_resume(resume):
+    """Point resume.skill_tags at the known skills of resume.skills; unknown ones are not linked."""
+    resume.skill_tags.set(parse(resume.skills))
+
+
+def _link_map(through, owner_field, owner_ids=None):
+    rows = through.objects.all()
+    if owner_ids is not None:
+        rows = rows.filter(**{f"{owner_field}__in": owner_ids})
+    linked = {}
+    for owner_id, skill_id in rows.values_list(owner_field, "skill_id").iterator():
+        linked.setdefault(owner_id, set()).add(skill_id)
+    return {owner_id: frozenset(ids) for owner_id, ids in linked.items()}
+
+
+def job_skill_ids():
+    """
+    {job id: frozenset of Skill ids} for every tagged job, from the
+    job ↔ skill link table in one query; cached with the job catalog.
+    """
+    return get_or_set(
+        JOBS_NAMESPACE, ["skill_ids"],
+        lambda: _link_map(Job.skill_tags.through, "job_id"),
+        getattr(settings, "SKILLMATCH_JOB_CACHE_TIMEOUT", 600),
+    )
+
+
+def skill_ids_for_jobs(job_ids, texts):
+    """Skill id sets aligned with `job_ids`; untagged jobs are parsed from `texts`."""
+    tagged = job_skill_ids()
+    untagged = [i for i, job_id in enumerate(job_ids) if job_id not in tagged]
+    parsed = dict(zip(untagged, parse_many([texts[i] for i in untagged], create=True)))
+    return [tagged[job_id] if job_id in tagged else parsed[i] for i, job_id in enumerate(job_ids)]
+
+
+_job_matrix = None      # (key, SkillMatrix, {skill id: name}, full skill text per job)
+_job_matrix_lock = threading.Lock()
+
+
+def _job_matrix_for(job_ids, texts):
+    global _job_matrix
+    key = (version(JOBS_NAMESPACE), version(SKILLS_NAMESPACE), tuple(job_ids))
+    with _job_matrix_lock:
+        if _job_matrix is None or _job_matrix[0] != key:
+            from .bitsets import SkillMatrix
+
+            skill_sets = skill_ids_for_jobs(job_ids, texts)
+            matrix = SkillMatrix(job_ids, skill_sets)
+            names = _names_by_id(matrix.columns)
+            _job_matrix = (key, matrix, names, [_join(names, ids) for ids in skill_sets])
+        return _job_matrix
+
+
+def _join(names, skill_ids):
+    return ", ".join(sorted(names[i] for i in skill_ids))
+
+
+def job_skill_matrix(job_ids, texts):
+    """
+    core.bitsets.SkillMatrix of the jobs' skill ids, rows aligned with
+    `job_ids`. Kept per process and rebuilt when the job list or the
+    job / skills namespaces change.
+    """
+    return _job_matrix_for(job_ids, texts)[1]
+
+
+def missing_names_for_jobs(job_ids, texts, skill_ids):
+    """
+    recommended_skills text for every job: the job's skills not in
+    `skill_ids`, from one vectorized pass over job_skill_matrix().
+    """
+    _, matrix, names, full_texts = _job_matrix_for(job_ids, texts)
+    return matrix.missing_labels(skill_ids, full_texts, lambda ids: _join(names, ids))
+
+
+def skill_ids_for_resumes(resumes):
+    """{resume id: Skill id set} for Resume rows; untagged ones are parsed from .skills."""
+    tagged = _link_map(Resume.skill_tags.through, "resume_id", [r.id for r in resumes])
+    untagged = [r for r in resumes if r.id not in tagged]
+    tagged.update(zip((r.id for r in untagged), parse_many([r.skills for r in untagged])))
+    return tagged
+
+
+# =========================
+#        SQL QUERIES
+# =========================
+
+def jobs_with_overlap(resume):
+    """
+    Jobs annotated with `required_count` and `matched_count` (required
+    skills the resume has), counted in SQL over the link tables.
+    """
+    resume_skills = Resume.skill_tags.through.objects.filter(resume=resume).values("skill_id")
+    return Job.objects.annotate(
+        required_count=Count("skill_tags", distinct=True),
+        matched_count=Count("skill_tags", filter=Q(skill_tags__in=resume_skills), distinct=True),
+    )
+
+
+def missing_skills_sql(resume, job):
+    """Skills `job` requires that `resume` is not tagged with."""
+    return Skill.objects.filter(jobs=job).exclude(resumes=resume).order_by("name")
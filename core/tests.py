@@ -1,3 +1,1387 @@
-from django.test import TestCase
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, get_resolver, reverse
+from django.utils import timezone
+
+from . import analysis, extraction, job_catalog, matching, metrics, rescoring, resume_cache, tasks, taxonomy
+from .ingest import find_resume_files, ingest
+from .cache import VERSION_KEY, bump, get_or_set, make_key, version
+from .models import (
+    Applicant, ExtractedResumeText, Job, RescoreRun, Resume, ResumeAnalysis, Score, Skill, SkillAlias,
+)
+from .tests_support.redis_standin import RedisStandIn
+from .scoring import build_draft_scores, create_draft_scores, save_draft_scores
+from .analysis import extractor_version
+from .skills import EXTRACTORS, build_extractor, extract_skills_from_text, extract_skills_many
+from .skills.automaton import SkillAutomaton, drop_contained, normalize
+
+STATUSES = ["DRAFT", "SUBMITTED", "SHORTLISTED", "REJECTED"]
+SKILLS = ["python", "django", "sql", "docker", "aws", "react", "java", "git"]
+
+
+# everything inline and in-process, so tests see (and count) all the work
+inline_settings = override_settings(
+    SKILLMATCH_RESCORE_ASYNC=False,
+    SKILLMATCH_ANALYSIS_ASYNC=False,
+    SKILLMATCH_EXTRACTION_WORKERS=0,
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    },
+)
+
+
+@inline_settings
+class QueryBudgetTestCase(TestCase):
+    """
+    Query-count regression harness: every view is requested with the
+    database seeded at each of SIZES (users × jobs) and must issue the
+    same number of queries every time. A count that grows with the data
+    is an N+1.
+
+    Tests are named test_<url name>; test_every_url_is_covered fails when
+    a route in skillmatch/urls.py has no budget test.
+    """
+
+    SIZES = (3, 12)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._media_root = tempfile.mkdtemp()
+        cls._media_override = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._media_override.disable()
+        shutil.rmtree(cls._media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.applicant = self._make_user("applicant@example.com")
+        self.applicant_resume = Resume.objects.create(
+            user=self.applicant, file="resumes/applicant.pdf", skills="python, django, sql",
+        )
+        self.staff = User.objects.create_user("staff@example.com", "staff@example.com", "pw", is_staff=True)
+        self.seeded = 0
+        self.requests = 0
+
+    def _make_user(self, email, profile=True):
+        user = User.objects.create_user(email, email, "pw")
+        if profile:
+            Applicant.objects.create(user=user, full_name=email.split("@")[0].title(), phone=email)
+        return user
+
+    # ---------- seeding ----------
+
+    def seed(self, size):
+        """Grow the data set to `size` users × `size` jobs (plus the applicant's rows)."""
+        n = size - self.seeded
+        if n <= 0:
+            return
+        start = self.seeded
+        Job.objects.bulk_create([
+            Job(
+                title=f"Job {start + i}",
+                required_skills=", ".join(SKILLS[(start + i) % len(SKILLS):][:3] or SKILLS[:3]),
+                description="seeded",
+            )
+            for i in range(n)
+        ])
+        # every other user has no Applicant profile (the dashboard shows the username instead)
+        users = [self._make_user(f"user{start + i}@example.com", profile=i % 2 == 0) for i in range(n)]
+        resumes = Resume.objects.bulk_create([
+            Resume(user=u, file=f"resumes/user{u.id}.pdf", skills=", ".join(SKILLS[:4])) for u in users
+        ])
+        jobs = list(Job.objects.order_by("id"))
+        new_jobs = jobs[start:]
+        for job in new_jobs:
+            taxonomy.sync_job(job)   # what the Job post_save signal does
+
+        scores = [
+            Score(
+                resume=resume, user=resume.user, job=job,
+                value=float((i * 7 + j * 13) % 100), recommended_skills="aws",
+                status=STATUSES[(i + j) % len(STATUSES)],
+            )
+            for i, resume in enumerate(resumes)
+            for j, job in enumerate(jobs)
+        ]
+        scores += [
+            Score(
+                resume=self.applicant_resume, user=self.applicant, job=job,
+                value=50.0, recommended_skills="docker",
+                status="DRAFT" if (start + j) % 2 == 0 else "SUBMITTED",
+            )
+            for j, job in enumerate(new_jobs)
+        ]
+        Score.objects.bulk_create(scores)
+        self.seeded = size
+
+    # ---------- assertions ----------
+
+    def count_queries(self, request):
+        with CaptureQueriesContext(connection) as ctx:
+            response = request()
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 400, f"{response.status_code} from {response}")
+        return ctx.captured_queries
+
+    def assertQueriesDoNotGrow(self, request):
+        """
+        Call `request()` (which returns a test-client response) at every
+        seed size and require the same query count each time. One unmeasured
+        call first, so session creation and per-process state are warm; the
+        Django cache is emptied before each measured call.
+        """
+        self.seed(self.SIZES[0])
+        self.count_queries(request)
+
+        counts = {}
+        captured = {}
+        for size in self.SIZES:
+            self.seed(size)
+            # seeding sends no signals; render every size from an empty cache
+            cache.clear()
+            captured[size] = self.count_queries(request)
+            counts[size] = len(captured[size])
+
+        if len(set(counts.values())) > 1:
+            largest = self.SIZES[-1]
+            sql = "\n".join(q["sql"] for q in captured[largest])
+            self.fail(f"query count grows with the data: {counts}\nqueries at size {largest}:\n{sql}")
+
+    def as_applicant(self):
+        self.client.force_login(self.applicant)
+
+    def as_staff(self):
+        self.client.force_login(self.staff)
+
+    # ---------- coverage ----------
+
+    def test_every_url_is_covered(self):
+        names = [
+            p.name for p in get_resolver().url_patterns
+            if isinstance(p, URLPattern) and p.name
+        ]
+        missing = [name for name in names if not hasattr(self, f"test_{name}")]
+        self.assertEqual(missing, [], "views without a query-budget test")
+
+    # ---------- public pages ----------
+
+    def test_home(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("home")))
+
+    def test_job_list(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("job_list")))
+
+    def test_job_list_logged_in(self):
+        self.as_applicant()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("job_list")))
+
+    def test_score_list(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("score_list")))
+
+    # ---------- applicant flow ----------
+
+    def test_upload_resume(self):
+        self.as_applicant()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("upload_resume")))
+
+    def test_upload_resume_post(self):
+        def upload():
+            # a new applicant (drafts for every job) and new bytes (no extraction cache hit) each time
+            self.requests += 1
+            self.client.force_login(self._make_user(f"uploader{self.requests}@example.com"))
+            text = (
+                f"Resume {self.requests}\nEducation: B.Tech\n"
+                "Experience: built web services with python, django and sql on aws.\n"
+            ) * 5
+            return self.client.post(reverse("upload_resume"), {
+                "resume": SimpleUploadedFile(f"cv{self.requests}.txt", text.encode()),
+                "skills": "git",
+            })
+
+        self.assertQueriesDoNotGrow(upload)
+        self.assertEqual(
+            Score.objects.filter(resume__file__startswith="resumes/cv").count(),
+            # warm-up and first upload see SIZES[0] jobs, the last one all of them
+            2 * self.SIZES[0] + self.SIZES[-1],
+        )
+
+    def test_my_applications(self):
+        self.as_applicant()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("my_applications")))
+
+    def test_analysis_status(self):
+        self.as_applicant()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("analysis_status")))
+
+    def test_submit_application(self):
+        self.as_applicant()
+
+        def submit():
+            draft = Score.objects.filter(user=self.applicant, status="DRAFT").latest("id")
+            return self.client.post(reverse("submit_application", args=[draft.id]))
+
+        self.assertQueriesDoNotGrow(submit)
+
+    # ---------- recruiter ----------
+
+    def test_recruiter_dashboard(self):
+        self.as_staff()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("recruiter_dashboard")))
+
+    def test_recruiter_dashboard_top_per_job(self):
+        self.as_staff()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("recruiter_dashboard"), {"top": 5}))
+
+    def test_recruiter_dashboard_next_page(self):
+        self.as_staff()
+
+        def second_page():
+            first = Score.objects.submitted().dashboard_order()[1]
+            return self.client.get(reverse("recruiter_dashboard"), {
+                "cursor": f"{first.job_id}:{first.value!r}:{first.id}",
+            })
+
+        self.assertQueriesDoNotGrow(second_page)
+
+    def test_toggle_shortlist(self):
+        self.as_staff()
+
+        def toggle():
+            score = Score.objects.submitted().latest("id")
+            return self.client.post(reverse("toggle_shortlist", args=[score.id]))
+
+        self.assertQueriesDoNotGrow(toggle)
+
+    def test_decide_applications(self):
+        self.as_staff()
+
+        def decide():
+            ids = list(Score.objects.values_list("id", flat=True))
+            return self.client.post(reverse("decide_applications"), {"score_ids": ids, "action": "shortlist"})
+
+        self.assertQueriesDoNotGrow(decide)
+        self.assertFalse(Score.objects.submitted().exclude(status="SHORTLISTED").exists())
+        self.assertTrue(Score.objects.filter(status="DRAFT").exists())
+
+    def test_export_applications(self):
+        self.as_staff()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("export_applications")))
+
+    def test_export_applications_jsonl(self):
+        self.as_staff()
+        self.assertQueriesDoNotGrow(
+            lambda: self.client.get(reverse("export_applications"), {"format": "jsonl", "status": "SUBMITTED"})
+        )
+
+    def test_view_metrics(self):
+        self.as_staff()
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("view_metrics")))
+
+    # ---------- auth ----------
+
+    def test_register(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("register")))
+
+    def test_register_post(self):
+        def register():
+            self.requests += 1
+            email = f"new{self.requests}@example.com"
+            return self.client.post(reverse("register"), {
+                "full_name": "New Applicant", "email": email, "phone": email,
+                "password1": "pw", "password2": "pw",
+            })
+
+        self.assertQueriesDoNotGrow(register)
+
+    def test_login(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.get(reverse("login")))
+
+    def test_login_post(self):
+        self.assertQueriesDoNotGrow(lambda: self.client.post(reverse("login"), {
+            "email": "applicant@example.com", "password": "pw",
+        }))
+
+    def test_logout(self):
+        def logout():
+            self.as_applicant()
+            return self.client.get(reverse("logout"))
+
+        self.assertQueriesDoNotGrow(logout)
+
+
+@inline_settings
+class DashboardPaginationTests(TestCase):
+    """Recruiter dashboard: keyset pages cover every row exactly once; ?top=K ranks within each job."""
+
+    def setUp(self):
+        cache.clear()
+        jobs = Job.objects.bulk_create([Job(title=f"Job {i}", required_skills="python") for i in range(3)])
+        users = [User.objects.create_user(f"u{i}@example.com", f"u{i}@example.com", "pw") for i in range(45)]
+        resumes = Resume.objects.bulk_create([Resume(user=u, file=f"resumes/u{u.id}.pdf") for u in users])
+        Score.objects.bulk_create([
+            # few distinct values, so pages break inside runs of ties
+            Score(resume=r, user=r.user, job=job, value=float(10 * (i % 3)), status=STATUSES[1 + i % 3])
+            for job in jobs
+            for i, r in enumerate(resumes)
+        ])
+        self.client.force_login(User.objects.create_user("staff", "staff@example.com", "pw", is_staff=True))
+
+    def test_pages_cover_every_row_once(self):
+        seen, query, pages = [], "", 0
+        while query is not None:
+            response = self.client.get(f"{reverse('recruiter_dashboard')}?{query}")
+            seen += [score.id for score in response.context["scores"]]
+            query = response.context["next_query"]
+            pages += 1
+        self.assertEqual(pages, 3)
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen, list(Score.objects.submitted().dashboard_order().values_list("id", flat=True)))
+
+    def test_top_candidates_per_job(self):
+        response = self.client.get(f"{reverse('recruiter_dashboard')}?top=2")
+        self.assertIsNone(response.context["next_query"])
+        expected = []
+        for job in Job.objects.order_by("title", "id"):
+            expected += Score.objects.submitted().filter(job=job).dashboard_order().values_list("id", flat=True)[:2]
+        page = response.context["scores"]
+        self.assertEqual([score.id for score in page], expected)
+        self.assertEqual([score.rank for score in page], [1, 2] * 3)
+
+    def test_top_below_one_is_not_given(self):
+        first_page = self.client.get(reverse("recruiter_dashboard")).context["scores"]
+        for top in ("0", "-3"):
+            with self.subTest(top=top):
+                response = self.client.get(reverse("recruiter_dashboard"), {"top": top})
+                self.assertEqual(response.context["filters"]["top"], "")
+                self.assertEqual(list(response.context["scores"]), list(first_page))
+                self.assertIsNotNone(response.context["next_query"])
+
+    def test_out_of_range_parameters_are_ignored(self):
+        for query in (
+            "job=99999999999999999999999",
+            "cursor=99999999999999999999999:1.0:1",
+            "cursor=1:nan:1",
+            "min_score=nan",
+        ):
+            with self.subTest(query=query):
+                response = self.client.get(f"{reverse('recruiter_dashboard')}?{query}")
+                self.assertEqual(response.status_code, 200)
+
+
+@inline_settings
+class RecruiterDecisionTests(TestCase):
+    """decide_applications: bulk shortlist / reject from the dashboard."""
+
+    def setUp(self):
+        user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        job = Job.objects.bulk_create([Job(title="Backend", required_skills="python")])[0]
+        resume = Resume.objects.create(user=user, file="resumes/a.pdf")
+        self.score = Score.objects.create(resume=resume, user=user, job=job, value=50.0, status="SUBMITTED")
+        self.client.force_login(User.objects.create_user("staff", "staff@example.com", "pw", is_staff=True))
+
+    def test_malformed_ids_are_ignored(self):
+        response = self.client.post(reverse("decide_applications"), {
+            "action": "shortlist",
+            "score_ids": ["²", "-1", "1e3", "99999999999999999999999", str(self.score.id)],
+        })
+        self.assertEqual(response.status_code, 302)
+        self.score.refresh_from_db()
+        self.assertEqual(self.score.status, "SHORTLISTED")
+
+
+@inline_settings
+class ExportApplicationsTests(TestCase):
+    """export_applications: columns, row contents and spreadsheet-safe CSV cells."""
+
+    HEADER = [
+        "id", "job_id", "job_title", "applicant_name", "applicant_email", "username",
+        "score", "status", "recommended_skills", "resume_file",
+    ]
+
+    def setUp(self):
+        user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        Applicant.objects.create(user=user, full_name='=HYPERLINK("http://evil","x")', phone="1")
+        job = Job.objects.bulk_create([Job(title="Backend", required_skills="python")])[0]
+        resume = Resume.objects.create(user=user, file="resumes/a.pdf")
+        self.score = Score.objects.create(
+            resume=resume, user=user, job=job, value=42.5, status="SUBMITTED",
+            recommended_skills="+cmd|' /C calc'!A0",
+        )
+        Score.objects.create(resume=resume, user=user, job=Job.objects.create(title="Draft job"), value=1.0)
+        self.client.force_login(User.objects.create_user("staff", "staff@example.com", "pw", is_staff=True))
+
+    def export(self, **params):
+        response = self.client.get(reverse("export_applications"), params)
+        return b"".join(response.streaming_content).decode()
+
+    def test_csv(self):
+        header, row = csv.reader(io.StringIO(self.export()))
+        self.assertEqual(header, self.HEADER)
+        self.assertEqual(row, [
+            str(self.score.id), str(self.score.job_id), "Backend", '\'=HYPERLINK("http://evil","x")',
+            "a@example.com", "a@example.com", "42.5", "SUBMITTED", "'+cmd|' /C calc'!A0", "resumes/a.pdf",
+        ])
+
+    def test_jsonl_keeps_raw_values(self):
+        (line,) = self.export(format="jsonl").splitlines()
+        self.assertEqual(json.loads(line), {
+            "id": self.score.id, "job_id": self.score.job_id, "job_title": "Backend",
+            "applicant_name": '=HYPERLINK("http://evil","x")', "applicant_email": "a@example.com",
+            "username": "a@example.com", "score": 42.5, "status": "SUBMITTED",
+            "recommended_skills": "+cmd|' /C calc'!A0", "resume_file": "resumes/a.pdf",
+        })
+
+
+@inline_settings
+class ViewMetricsTests(TestCase):
+    """ViewMetricsMiddleware: per-view numbers, streamed bodies, static files, Server-Timing."""
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        self.addCleanup(metrics.reset)
+        self.staff = User.objects.create_user("staff", "staff@example.com", "pw", is_staff=True)
+
+    def test_records_per_view(self):
+        response = self.client.get(reverse("job_list"))
+        self.assertNotIn("Server-Timing", response)
+        self.client.get(reverse("job_list"))
+        stats = metrics.snapshot()["job_list"]
+        self.assertEqual((stats["wall_ms"]["count"], stats["queries"]["count"]), (2, 2))
+
+    def test_server_timing_is_for_staff_or_debug(self):
+        self.client.force_login(self.staff)
+        self.assertIn("db;dur=", self.client.get(reverse("job_list"))["Server-Timing"])
+        self.client.logout()
+        with override_settings(DEBUG=True):
+            self.assertIn("Server-Timing", self.client.get(reverse("job_list")))
+
+    def test_static_files_are_not_recorded(self):
+        self.client.get(f"{settings.STATIC_URL}css/missing.css")
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_streamed_body_is_measured(self):
+        user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        resume = Resume.objects.create(user=user, file="resumes/a.pdf")
+        job = Job.objects.bulk_create([Job(title="Backend", required_skills="python")])[0]
+        Score.objects.create(resume=resume, user=user, job=job, value=1.0, status="SUBMITTED")
+        self.client.force_login(self.staff)
+
+        response = self.client.get(reverse("export_applications"))
+        self.assertNotIn("export_applications", metrics.snapshot())
+        with CaptureQueriesContext(connection) as body:
+            b"".join(response.streaming_content)
+        self.assertGreater(len(body.captured_queries), 0)
+        stats = metrics.snapshot()["export_applications"]
+        self.assertEqual(stats["queries"]["count"], 1)
+        self.assertGreaterEqual(stats["queries"]["max"], len(body.captured_queries))
+
+        # a body that is never read is recorded when the response is closed
+        response = self.client.get(reverse("export_applications"))
+        response.close()
+        self.assertEqual(metrics.snapshot()["export_applications"]["queries"]["count"], 2)
+
+
+class DuplicateScoreMigrationTests(TransactionTestCase):
+    """Migrations that add the Score unique constraints resolve existing duplicates."""
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.migrate([("core", target)] if isinstance(target, str) else target)
+        return executor.loader.project_state([("core", target)] if isinstance(target, str) else target).apps
+
+    def setUp(self):
+        self.addCleanup(self.migrate, MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def seed(self, apps, statuses):
+        """One user, resume and job with a Score per status; returns their ids."""
+        user = apps.get_model("auth", "User").objects.create(username="a@example.com")
+        resume = apps.get_model("core", "Resume").objects.create(user=user, file="resumes/a.pdf")
+        job = apps.get_model("core", "Job").objects.create(title="Backend", required_skills="python")
+        Score = apps.get_model("core", "Score")
+        return [Score.objects.create(resume=resume, job=job, value=1.0, status=s).id for s in statuses]
+
+    def test_one_score_per_resume_and_job(self):
+        job = Job.objects.bulk_create([Job(title="Backend", required_skills="python")])[0]
+        resume = Resume.objects.create(file="resumes/a.pdf")
+        Score.objects.create(resume=resume, job=job, value=1.0)
+        with self.assertRaises(IntegrityError):
+            Score.objects.create(resume=resume, job=job, value=2.0, status="SUBMITTED")
+
+    def test_0009_keeps_the_recruiter_decision_and_logs_the_rest(self):
+        apps = self.migrate("0008_extractedresumetext")
+        draft, shortlisted, submitted = self.seed(apps, ["DRAFT", "SHORTLISTED", "SUBMITTED"])
+        with self.assertLogs("core.migrations.0009_score_indexes", "WARNING") as logs:
+            apps = self.migrate("0009_score_indexes")
+        self.assertEqual(list(apps.get_model("core", "Score").objects.values_list("id", flat=True)), [shortlisted])
+        removed = sorted(int(r.getMessage().split()[3]) for r in logs.records)
+        self.assertEqual(removed, [draft, submitted])
+
+    def test_0010_keeps_one_application_per_user_and_job(self):
+        apps = self.migrate("0009_score_indexes")
+        (first,) = self.seed(apps, ["DRAFT"])
+        Score = apps.get_model("core", "Score")
+        first = Score.objects.get(id=first)
+        # a second resume of the same user, submitted to the same job
+        second = apps.get_model("core", "Resume").objects.create(user=first.resume.user, file="resumes/b.pdf")
+        submitted = Score.objects.create(resume=second, job=first.job, value=2.0, status="SUBMITTED").id
+        with self.assertLogs("core.migrations.0010_score_user", "WARNING") as logs:
+            apps = self.migrate("0010_score_user")
+        self.assertEqual(
+            list(apps.get_model("core", "Score").objects.values_list("id", "user_id")),
+            [(submitted, first.resume.user_id)],
+        )
+        self.assertIn(f"Removing duplicate Score {first.id} ", logs.output[0])
+
+    def test_0009_stops_on_conflicting_decisions(self):
+        apps = self.migrate("0008_extractedresumetext")
+        shortlisted, rejected = self.seed(apps, ["SHORTLISTED", "REJECTED"])
+        with self.assertRaisesMessage(RuntimeError, f"{shortlisted} SHORTLISTED, {rejected} REJECTED"):
+            self.migrate("0009_score_indexes")
+        Score = apps.get_model("core", "Score")
+        self.assertEqual(Score.objects.count(), 2)
+        # resolved by hand, the migration goes through
+        Score.objects.filter(id=rejected).delete()
+        self.migrate("0009_score_indexes")
+
+
+@inline_settings
+class AnalysisQueueTests(TestCase):
+    """core.tasks: claiming, retry backoff, lease expiry and the inline (no worker) mode."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        self.resume = Resume.objects.create(user=self.user, file="resumes/a.pdf")
+        self.task = tasks.enqueue_analysis(self.resume)
+
+    def test_a_task_is_claimed_once(self):
+        self.assertEqual(tasks.claim(self.task.id).status, "RUNNING")
+        self.assertIsNone(tasks.claim(self.task.id))
+        self.assertIsNone(tasks.claim_next())
+
+    @override_settings(SKILLMATCH_ANALYSIS_BACKOFF_SECONDS=10, SKILLMATCH_ANALYSIS_BACKOFF_MAX_SECONDS=25)
+    def test_failures_back_off_then_fail(self):
+        self.assertEqual([tasks.backoff_delay(n) for n in (1, 2, 3)], [10, 20, 25])
+        with mock.patch("core.tasks.analyse_resume", side_effect=RuntimeError("boom")), \
+                self.assertLogs("core.tasks", "ERROR"):
+            before = timezone.now()
+            task = tasks.run_analysis(tasks.claim(self.task.id))
+            self.assertEqual((task.status, task.attempts, task.error), ("QUEUED", 1, "RuntimeError: boom"))
+            self.assertGreaterEqual(task.run_after, before + timedelta(seconds=10))
+            # not runnable before its backoff is over
+            self.assertIsNone(tasks.claim_next())
+
+            for attempt in (2, 3):
+                ResumeAnalysis.objects.filter(id=task.id).update(run_after=timezone.now())
+                task = tasks.run_analysis(tasks.claim_next())
+        self.assertEqual((task.status, task.attempts), ("FAILED", 3))
+        self.assertIsNotNone(task.finished_at)
+
+    @override_settings(SKILLMATCH_ANALYSIS_LEASE_SECONDS=60)
+    def test_expired_lease_is_reclaimed(self):
+        tasks.claim(self.task.id)
+        self.assertIsNone(tasks.claim_next())
+        ResumeAnalysis.objects.filter(id=self.task.id).update(locked_at=timezone.now() - timedelta(seconds=61))
+        task = tasks.claim_next()
+        self.assertEqual((task.id, task.status, task.attempts), (self.task.id, "RUNNING", 2))
+
+    def test_inline_mode_retries_and_never_leaves_the_task_queued(self):
+        with mock.patch("core.tasks.analyse_resume", side_effect=[RuntimeError("flaky"), 4]), \
+                self.assertLogs("core.tasks", "ERROR"):
+            task = tasks.run_inline(self.task)
+        self.assertEqual((task.status, task.attempts, task.scores_created), ("DONE", 2, 4))
+
+        other = tasks.enqueue_analysis(Resume.objects.create(user=self.user, file="resumes/b.pdf"))
+        with mock.patch("core.tasks.analyse_resume", side_effect=RuntimeError("down")), \
+                self.assertLogs("core.tasks", "ERROR"):
+            task = tasks.run_inline(other)
+        self.assertEqual((task.status, task.attempts), ("FAILED", 3))
+
+    def test_upload_in_inline_mode_reports_the_failure(self):
+        self.task.delete()
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        media_root = override_settings(MEDIA_ROOT=media)
+        media_root.enable()
+        self.addCleanup(media_root.disable)
+        self.client.force_login(self.user)
+        upload = SimpleUploadedFile("cv.txt", b"resume text")
+        with mock.patch("core.tasks.analyse_resume", side_effect=RuntimeError("down")), \
+                self.assertLogs("core.tasks", "ERROR"):
+            response = self.client.post(reverse("upload_resume"), {"resume": upload}, follow=True)
+        (message,) = [str(m) for m in response.context["messages"]]
+        self.assertIn("try uploading it again", message)
+        self.assertFalse(ResumeAnalysis.objects.filter(status__in=["QUEUED", "RUNNING"]).exists())
+        self.assertFalse(self.client.get(reverse("analysis_status")).json()["pending"])
+
+
+@inline_settings
+class ResumeCacheTests(TestCase):
+    """core.resume_cache: byte-identical uploads are extracted once; LRU eviction by size."""
+
+    TEXT = "Curriculum Vitae\nEducation: B.Tech\nExperience: python, django and sql services.\n" * 4
+
+    def extract(self, data=None):
+        return analysis.extract_resume("cv.txt", (data or self.TEXT).encode())
+
+    def test_identical_upload_skips_extraction(self):
+        before = resume_cache.stats()
+        with mock.patch("core.extraction.extract", wraps=extraction.extract) as extract:
+            first = self.extract()
+            self.assertEqual(self.extract(), first)
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(first[1], "django, python, sql")
+
+        after = resume_cache.stats()
+        self.assertEqual((after["hits"] - before["hits"], after["misses"] - before["misses"]), (1, 1))
+        self.assertEqual(ExtractedResumeText.objects.get().hits, 1)
+
+    def test_extractor_version_bump_misses(self):
+        self.extract()
+        with mock.patch("core.analysis.EXTRACTOR_VERSION", "next"), \
+                mock.patch("core.extraction.extract", wraps=extraction.extract) as extract:
+            self.extract()
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(ExtractedResumeText.objects.count(), 2)
+
+    def test_eviction_keeps_the_cache_under_its_byte_budget(self):
+        texts = [self.TEXT + f"Project {i}\n" for i in range(4)]
+        for i, text in enumerate(texts):
+            self.extract(text)
+            # distinct last_used_at, oldest first
+            ExtractedResumeText.objects.filter(text=text).update(
+                last_used_at=timezone.now() - timedelta(minutes=10 - i),
+            )
+        size = ExtractedResumeText.objects.first().size
+        self.extract(texts[0])          # a hit makes the oldest entry the most recent one
+
+        with override_settings(SKILLMATCH_EXTRACTION_CACHE_MAX_BYTES=3 * size + size // 2):
+            self.extract(self.TEXT + "Project 4\n")
+        total = sum(ExtractedResumeText.objects.values_list("size", flat=True))
+        self.assertLessEqual(total, 3 * size + size // 2)
+        kept = set(ExtractedResumeText.objects.values_list("text", flat=True))
+        self.assertEqual(kept, {texts[0], texts[3], self.TEXT + "Project 4\n"})
+
+
+def blank_pdf(pages):
+    from PyPDF2 import PdfWriter
+
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(100, 100)
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+class ExtractionPoolTests(SimpleTestCase):
+    """core.extraction.ExtractionPool with real child processes: caps, timeouts, replacement."""
+
+    def make_pool(self, **kwargs):
+        pool = extraction.ExtractionPool(size=1, timeout=30, max_pages=2, max_file_bytes=4096, **kwargs)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def child_pid(self, pool):
+        (child,) = pool._children
+        return child.process.pid
+
+    def test_caps(self):
+        pool = self.make_pool()
+        result = pool.extract("big.txt", b"x" * 4097)
+        self.assertEqual((result.status, result.error), ("too_large", "4097 bytes (limit 4096)"))
+        self.assertEqual(pool._children, [])          # rejected before any child is started
+
+        result = pool.extract("cv.pdf", blank_pdf(3))
+        self.assertEqual((result.status, result.pages), ("too_large", 3))
+        result = pool.extract("cv.pdf", blank_pdf(2))
+        self.assertEqual((result.status, result.pages), ("ok", 2))
+        self.assertEqual(pool.extract("cv.txt", b"python, django").text, "python, django")
+
+    def test_timed_out_child_is_replaced(self):
+        pool = self.make_pool()
+        pool.extract("warm.txt", b"warm up")
+        pid = self.child_pid(pool)
+
+        pool.timeout = 0           # no child answers before the parent gives up
+        self.assertEqual(pool.extract("cv.pdf", blank_pdf(1)).status, "timeout")
+        self.assertNotEqual(self.child_pid(pool), pid)
+
+        pool.timeout = 30
+        self.assertEqual(pool.extract("cv.txt", b"python").text, "python")
+
+    def test_crashed_child_is_replaced(self):
+        pool = self.make_pool()
+        pool.extract("warm.txt", b"warm up")
+        (child,) = pool._children
+        child.process.kill()
+        child.process.join()
+
+        result = pool.extract("cv.txt", b"python")
+        self.assertEqual(result.status, "error")
+        self.assertIn("extraction process died", result.error)
+        self.assertNotEqual(self.child_pid(pool), child.process.pid)
+        self.assertEqual(pool.extract("cv.txt", b"python").text, "python")
+
+    def test_children_are_recycled_after_max_tasks(self):
+        pool = self.make_pool(max_tasks_per_child=2)
+        pool.extract("a.txt", b"a")
+        pid = self.child_pid(pool)
+        pool.extract("b.txt", b"b")
+        self.assertNotEqual(self.child_pid(pool), pid)
+
+    @override_settings(SKILLMATCH_EXTRACTION_WORKERS=1, SKILLMATCH_EXTRACTION_MAX_PAGES=2)
+    def test_extract_uses_the_shared_pool(self):
+        with mock.patch.object(extraction, "_pool", None):
+            try:
+                self.assertEqual(extraction.extract("cv.pdf", blank_pdf(3)).status, "too_large")
+                self.assertEqual(len(extraction._pool._children), 1)
+            finally:
+                if extraction._pool is not None:
+                    extraction._pool.shutdown()
+
+
+@inline_settings
+class MatchingEngineTests(TestCase):
+    """The job index gives the legacy per-pair TF-IDF scores and follows job changes."""
+
+    RESUMES = [
+        "python, django, sql",
+        "Python, PYTHON, python, Django REST Framework",
+        "machine learning, deep learning, data science, numpy, pandas",
+        "c++, c, java and the spring framework",
+        "docker",
+        "excel, power bi, tableau, excel",
+        "react",
+    ]
+    JOBS = [
+        "python, django",
+        "Django, Python, PostgreSQL, AWS, Docker, Git",
+        "machine learning, nlp, python",
+        "java, spring, sql, oracle",
+        "react, javascript, html, css",
+        "excel",
+        "go, rust",
+        "the and of",      # stop words only: scores 0 against everything
+    ]
+
+    def test_index_matches_legacy_similarity(self):
+        from .tfidf import SCORE_TOLERANCE, SkillIndex, legacy_similarity
+
+        index = SkillIndex(range(len(self.JOBS)), self.JOBS)
+        for resume in self.RESUMES:
+            for job, similarity in zip(self.JOBS, index.similarities(resume)):
+                with self.subTest(resume=resume, job=job):
+                    self.assertAlmostEqual(similarity, legacy_similarity(resume, job), delta=SCORE_TOLERANCE)
+
+    def test_index_follows_the_jobs_namespace(self):
+        cache.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            job = Job.objects.create(title="Backend", required_skills="python", description="")
+        index = matching.get_job_index()
+        self.assertEqual(index.ids, [job.id])
+        with self.assertNumQueries(0):
+            self.assertIs(matching.get_job_index(), index)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.create(title="Frontend", required_skills="react", description="")
+        self.assertEqual(len(matching.get_job_index().ids), 2)
+
+
+@inline_settings
+class DraftScoreTests(TestCase):
+    """core.scoring: one upload drafts every job not applied to, in a fixed number of queries."""
+
+    def setUp(self):
+        cache.clear()
+        self.add_jobs(3)
+
+    def add_jobs(self, n):
+        start = Job.objects.count()
+        Job.objects.bulk_create([
+            Job(title=f"Job {start + i}", required_skills=", ".join(SKILLS[i % 4:][:2])) for i in range(n)
+        ])
+        bump(job_catalog.JOBS_NAMESPACE)     # bulk_create sends no signals
+
+    def upload(self, email):
+        user = User.objects.create_user(email, email, "pw")
+        resume = Resume.objects.create(user=user, file=f"resumes/{email}.pdf", skills="python, django")
+        return user, resume
+
+    def test_applied_jobs_are_skipped(self):
+        user, resume = self.upload("a@example.com")
+        jobs = list(Job.objects.order_by("id"))
+        Score.objects.create(resume=resume, job=jobs[0], value=1.0, status="SUBMITTED")
+        Score.objects.create(resume=resume, job=jobs[1], value=1.0, status="DRAFT")
+
+        again = Resume.objects.create(user=user, file="resumes/a2.pdf", skills="python")
+        self.assertEqual(create_draft_scores(again, again.skills), 1)
+        self.assertEqual(
+            list(Score.objects.filter(resume=again).values_list("job_id", "status")), [(jobs[2].id, "DRAFT")],
+        )
+
+    def test_queries_do_not_grow_with_the_catalog(self):
+        counts = []
+        for size, extra in ((3, 0), (12, 9)):
+            self.add_jobs(extra)
+            _, warm = self.upload(f"warm{size}@example.com")
+            create_draft_scores(warm, warm.skills)   # builds the job index and skill matrix for this catalog
+            _, resume = self.upload(f"u{size}@example.com")
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertEqual(create_draft_scores(resume, resume.skills), size)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
+
+
+@inline_settings
+class BenchMatchingTests(TestCase):
+    """manage.py bench_matching runs the real upload path and rolls everything back."""
+
+    def test_report(self):
+        out = StringIO()
+        call_command("bench_matching", "--jobs", "4", "--resumes", "3", stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["outcome"], {"resumes": 3, "rejected": 0, "scores_created": 12})
+        for stage in ("store", "analysis", "cache_lookup", "extract_text", "tag_skills", "score", "persist"):
+            with self.subTest(stage=stage):
+                self.assertEqual(report["stages"][stage]["count"], 3)
+        self.assertEqual(report["end_to_end"]["count"], 3)
+        self.assertFalse(Job.objects.exists() or Resume.objects.exists() or ResumeAnalysis.objects.exists())
+
+
+@inline_settings
+class JobCatalogCacheTests(TestCase):
+    """core.job_catalog entries are dropped exactly when their rows change."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        self.resume = Resume.objects.create(user=self.user, file="resumes/a.pdf", skills="python")
+        self.job = Job.objects.create(title="Backend", required_skills="python", description="")
+
+    def test_catalog_is_served_from_cache_until_a_job_changes(self):
+        self.assertEqual(job_catalog.get_jobs(), [self.job])
+        with self.assertNumQueries(0):
+            job_catalog.get_jobs()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Job.objects.create(title="Frontend", required_skills="react", description="")
+        with self.assertNumQueries(1):
+            self.assertEqual(len(job_catalog.get_jobs()), 2)
+
+    def test_applied_ids_follow_draft_to_submitted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            score = Score.objects.create(resume=self.resume, job=self.job, value=10.0)
+        self.assertEqual(job_catalog.get_applied_job_ids(self.user), frozenset())
+
+        # a value-only change keeps the cached set
+        applied_namespace = job_catalog.APPLIED_NAMESPACE.format(user_id=self.user.id)
+        before = version(applied_namespace)
+        score = Score.objects.get(id=score.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            score.value = 20.0
+            score.save()
+        self.assertEqual(version(applied_namespace), before)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            score.status = "SUBMITTED"
+            score.save()
+        self.assertEqual(job_catalog.get_applied_job_ids(self.user), frozenset([self.job.id]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            score.delete()
+        self.assertEqual(job_catalog.get_applied_job_ids(self.user), frozenset())
+
+    def test_job_list_fragment_is_shared_by_every_visitor(self):
+        Score.objects.create(resume=self.resume, job=self.job, value=10.0, status="SUBMITTED")
+        badge = f"#job-{self.job.id} .applied-badge"
+        self.client.force_login(self.user)
+        self.assertContains(self.client.get(reverse("job_list")), badge)
+
+        # no signal: only a re-rendered fragment would show the new title
+        Job.objects.filter(id=self.job.id).update(title="Renamed")
+        other = User.objects.create_user("b@example.com", "b@example.com", "pw")
+        self.client.force_login(other)
+        response = self.client.get(reverse("job_list"))
+        self.assertContains(response, "Backend")
+        self.assertNotContains(response, "Renamed")
+        self.assertNotContains(response, badge)
+
+    def test_scores_follow_a_resume_to_its_new_owner(self):
+        other = User.objects.create_user("b@example.com", "b@example.com", "pw")
+        with self.captureOnCommitCallbacks(execute=True):
+            Score.objects.create(resume=self.resume, job=self.job, value=10.0, status="SUBMITTED")
+        self.assertEqual(job_catalog.get_applied_job_ids(self.user), frozenset([self.job.id]))
+        self.assertEqual(job_catalog.get_applied_job_ids(other), frozenset())
+
+        resume = Resume.objects.get(id=self.resume.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            resume.user = other
+            resume.save()
+        self.assertEqual(list(Score.objects.values_list("user_id", flat=True)), [other.id])
+        self.assertEqual(job_catalog.get_applied_job_ids(self.user), frozenset())
+        self.assertEqual(job_catalog.get_applied_job_ids(other), frozenset([self.job.id]))
+
+        # the new owner already applied to the job: the move is refused as a whole
+        taken = Resume.objects.create(user=self.user, file="resumes/a2.pdf", skills="python")
+        Score.objects.create(resume=taken, job=self.job, value=5.0)
+        taken.user = other
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            taken.save()
+        self.assertEqual(Resume.objects.get(id=taken.id).user_id, self.user.id)
+
+
+@inline_settings
+class RescoringTests(TestCase):
+    """core.rescoring: a job's score column follows its required skills."""
+
+    def setUp(self):
+        cache.clear()
+        self.users = [User.objects.create_user(f"u{i}@example.com", f"u{i}@example.com", "pw") for i in range(3)]
+        self.resumes = [
+            Resume.objects.create(user=user, file=f"resumes/u{i}.pdf", skills=skills)
+            for i, (user, skills) in enumerate(zip(self.users, ["python, django", "java, sql", "python, sql"]))
+        ]
+        for resume in self.resumes:
+            taxonomy.sync_resume(resume)
+
+    def create_job(self, required_skills):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Job.objects.create(title="Backend", required_skills=required_skills, description="")
+
+    def test_new_job_fans_out_drafts(self):
+        job = self.create_job("python, django")
+        scores = {s.user_id: s for s in Score.objects.filter(job=job)}
+        self.assertEqual(set(scores), {u.id for u in self.users})
+        self.assertEqual({s.status for s in scores.values()}, {"DRAFT"})
+        self.assertEqual(scores[self.users[0].id].recommended_skills, "")
+        self.assertEqual(scores[self.users[1].id].recommended_skills, "django, python")
+        self.assertGreater(scores[self.users[0].id].value, scores[self.users[2].id].value)
+        self.assertEqual(scores[self.users[1].id].value, 0.0)
+
+    def test_new_job_scores_imported_resumes(self):
+        # ingest_resumes leaves Resume.user empty; each such resume is its own candidate
+        imported = [
+            Resume.objects.create(file=f"resumes/imported{i}.pdf", skills="python") for i in range(2)
+        ]
+        job = self.create_job("python, django")
+        for resume in imported:
+            score = Score.objects.get(job=job, resume=resume)
+            self.assertEqual((score.user, score.status, score.recommended_skills), (None, "DRAFT", "django"))
+        self.assertEqual(Score.objects.filter(job=job).count(), 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.required_skills = "python"
+            job.save()
+        self.assertEqual(Score.objects.filter(job=job).count(), 5)
+
+    def test_edit_refreshes_values_and_keeps_status(self):
+        job = self.create_job("python, django")
+        submitted = Score.objects.get(job=job, user=self.users[1])
+        submitted.status = "SHORTLISTED"
+        submitted.save()
+        before = submitted.value
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job.required_skills = "java, sql"
+            job.save()
+        submitted.refresh_from_db()
+        self.assertEqual(submitted.status, "SHORTLISTED")
+        self.assertGreater(submitted.value, before)
+        self.assertEqual(submitted.recommended_skills, "")
+        self.assertEqual(Score.objects.filter(job=job).count(), 3)
+
+    def test_progress_is_reported_per_batch(self):
+        job = self.create_job("python")
+        run = RescoreRun.objects.create(job=job)
+        with mock.patch("core.rescoring._report", wraps=rescoring._report) as report:
+            rescoring.run_rescore(rescoring.claim_run(run.id), batch_size=2)
+        run.refresh_from_db()
+        self.assertEqual([c.args[1] for c in report.call_args_list], [2, 1])
+        self.assertEqual((run.status, run.processed, run.total), ("DONE", 3, 3))
+        self.assertIsNotNone(run.finished_at)
+
+    def test_only_stale_running_runs_are_claimed(self):
+        job = self.create_job("python")
+        live = RescoreRun.objects.create(job=job, status="RUNNING", heartbeat_at=timezone.now())
+        stale = RescoreRun.objects.create(
+            job=job, status="RUNNING", heartbeat_at=timezone.now() - timedelta(hours=1),
+        )
+        done = RescoreRun.objects.create(job=job, status="DONE")
+        self.assertNotIn(live.id, rescoring.claimable_runs())
+        self.assertNotIn(done.id, rescoring.claimable_runs())
+        self.assertIsNone(rescoring.claim_run(live.id))
+
+        out = StringIO()
+        call_command("rescore_jobs", stdout=out)
+        live.refresh_from_db()
+        stale.refresh_from_db()
+        self.assertEqual(live.status, "RUNNING")
+        self.assertEqual((stale.status, stale.processed), ("DONE", 3))
+        # a claimed run can't be claimed a second time
+        self.assertIsNone(rescoring.claim_run(stale.id))
+
+    @override_settings(SKILLMATCH_RESCORE_RETRY_SECONDS=60, SKILLMATCH_RESCORE_MAX_ATTEMPTS=3)
+    def test_worker_retries_failed_runs(self):
+        job = self.create_job("python")
+        long_ago = timezone.now() - timedelta(minutes=5)
+        failed = RescoreRun.objects.create(job=job, status="FAILED", attempts=1, finished_at=long_ago)
+        just_failed = RescoreRun.objects.create(job=job, status="FAILED", attempts=1, finished_at=timezone.now())
+        exhausted = RescoreRun.objects.create(job=job, status="FAILED", attempts=3, finished_at=long_ago)
+
+        self.assertEqual(tasks.work(once=True), 1)
+        failed.refresh_from_db()
+        self.assertEqual((failed.status, failed.attempts, failed.processed), ("DONE", 2, 3))
+        self.assertEqual(
+            list(RescoreRun.objects.filter(id__in=[just_failed.id, exhausted.id]).values_list("status", flat=True)),
+            ["FAILED", "FAILED"],
+        )
+
+    def test_editing_a_job_with_scores_refreshes_them(self):
+        job = self.create_job("python, django")
+        # uploaded after the job: no Score for it yet
+        late = User.objects.create_user("late@example.com", "late@example.com", "pw")
+        Resume.objects.create(user=late, file="resumes/late.pdf", skills="docker")
+        with self.captureOnCommitCallbacks(execute=True):
+            job.required_skills = "python, docker"
+            job.save()
+
+        run = RescoreRun.objects.filter(job=job).latest("id")
+        self.assertEqual((run.status, run.error), ("DONE", ""))
+        self.assertEqual((run.processed, run.total), (4, 4))
+        self.assertEqual(
+            Score.objects.get(job=job, resume=self.resumes[0]).recommended_skills, "docker",
+        )
+        self.assertEqual(Score.objects.get(job=job, user=late).status, "DRAFT")
+
+    def test_upload_racing_a_rescore_is_not_an_error(self):
+        job = self.create_job("python")
+        late = User.objects.create_user("late@example.com", "late@example.com", "pw")
+        resume = Resume.objects.create(user=late, file="resumes/late.pdf", skills="python")
+        drafts = build_draft_scores(resume, resume.skills)
+
+        # the upload commits its drafts while the run is scoring the same resume
+        score_batch = rescoring._score_batch
+
+        def upload_first(job_text, resumes):
+            save_draft_scores(build_draft_scores(resume, resume.skills))
+            return score_batch(job_text, resumes)
+
+        run = RescoreRun.objects.create(job=job)
+        with mock.patch("core.rescoring._score_batch", side_effect=upload_first):
+            run = rescoring.run_rescore(rescoring.claim_run(run.id))
+        self.assertEqual(run.status, "DONE")
+        # ... and an upload finishing after the run had inserted its row
+        save_draft_scores(drafts)
+        self.assertEqual(Score.objects.filter(job=job, user=late).count(), 1)
+
+
+@inline_settings
+class SkillTaxonomyTests(TestCase):
+    """Skill text resolves to canonical Skill ids; overlap / missing work on ids."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user("a@example.com", "a@example.com", "pw")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job = Job.objects.create(
+                title="Backend", required_skills="PostgreSQL, Django, AWS", description="",
+            )
+        self.resume = Resume.objects.create(user=self.user, file="resumes/a.pdf", skills="postgres, django")
+        taxonomy.sync_resume(self.resume)
+
+    def tag_names(self, owner):
+        return sorted(owner.skill_tags.values_list("name", flat=True))
+
+    def test_aliases_resolve_to_one_skill(self):
+        self.assertEqual(taxonomy.parse("Postgres"), taxonomy.parse(" postgresql "))
+        self.assertEqual(self.tag_names(self.resume), ["django", "postgresql"])
+        self.assertEqual(
+            extract_skills_from_text("Built services on Node.js and Postgres."), "node, postgresql",
+        )
+
+    def test_job_tags_follow_required_skills(self):
+        self.assertEqual(self.tag_names(self.job), ["aws", "django", "postgresql"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job.required_skills = "Django, Docker"
+            self.job.save()
+        self.assertEqual(self.tag_names(self.job), ["django", "docker"])
+
+    def test_missing_skills_are_id_set_differences(self):
+        (draft,) = build_draft_scores(self.resume, self.resume.skills)
+        self.assertEqual(draft.recommended_skills, "aws")
+
+        self.assertEqual(list(taxonomy.missing_skills_sql(self.resume, self.job).values_list("name", flat=True)), ["aws"])
+        job = taxonomy.jobs_with_overlap(self.resume).get(id=self.job.id)
+        self.assertEqual((job.required_count, job.matched_count), (3, 2))
+
+    def test_new_alias_is_picked_up(self):
+        postgresql = Skill.objects.get(name="postgresql")
+        with self.captureOnCommitCallbacks(execute=True):
+            SkillAlias.objects.create(skill=postgresql, name=" PG ")
+        self.assertEqual(taxonomy.parse("pg"), {postgresql.id})
+
+    def test_applicant_skills_never_create_skills(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media, ignore_errors=True)
+        media_root = override_settings(MEDIA_ROOT=media)
+        media_root.enable()
+        self.addCleanup(media_root.disable)
+        skills = Skill.objects.count()
+
+        self.client.force_login(self.user)
+        text = "Education: B.Tech\nExperience: built web services with python, django and sql.\n" * 5
+        self.client.post(reverse("upload_resume"), {
+            "resume": SimpleUploadedFile("cv.txt", text.encode()),
+            "skills": "my secret hobby, asdfqwer, zzz lorem ipsum, Postgres",
+        })
+        resume = Resume.objects.exclude(id=self.resume.id).get()
+        self.assertIn("asdfqwer", resume.skills)
+        self.assertEqual(Skill.objects.count(), skills)
+        self.assertEqual(self.tag_names(resume), ["django", "postgresql"])
+
+
+class SkillAutomatonTests(SimpleTestCase):
+    """core.skills.automaton.SkillAutomaton on its own: offsets, shared suffixes, boundaries."""
+
+    def setUp(self):
+        self.automaton = SkillAutomaton(["java", "javascript", "script", "c", "c++", "power bi", "node", " Java "])
+
+    def test_vocabulary_is_normalized_and_deduplicated(self):
+        self.assertEqual(len(self.automaton), 7)
+
+    def test_matches_and_offsets(self):
+        text = "JavaScript,  Java and\nPower   BI on Node.js"
+        matches = list(self.automaton.iter_matches(text))
+        normalized = normalize(text)
+        self.assertEqual([normalized[start:end] for start, end, _ in matches], ["javascript", "java", "power bi", "node"])
+        self.assertEqual([skill for _, _, skill in matches], ["javascript", "java", "power bi", "node"])
+
+    def test_word_boundaries(self):
+        self.assertEqual(self.automaton.find_all("c++ and c, not magic or javas"), {"c", "c++"})
+        self.assertEqual(self.automaton.find_all("postscript nodes"), set())
+
+    def test_contained_matches_are_dropped_partial_overlaps_kept(self):
+        self.assertEqual(
+            list(drop_contained([(0, 10, "javascript"), (4, 10, "script"), (8, 14, "tail"), (0, 4, "java")])),
+            [(0, 10, "javascript"), (8, 14, "tail")],
+        )
+
+
+class SkillExtractorTests(TestCase):
+    """Every boundary-aware engine finds the same skills; settings pick the engine."""
+
+    CASES = {
+        "C++ and C, a bit of C# magic": "c, c++",
+        "Dashboards in Power\n BI and Excel": "excel, power bi",
+        "APIs on Node.js / NodeJS, deployed with Git from a digital agency": "git, node",
+        "Java, JavaScript and MySQL (not SQL Server)": "java, javascript, mysql, sql",
+        "Postgres + AWS": "aws, postgresql",
+        "C plus plus and Microsoft Excel": "c++, excel",
+    }
+
+    def test_engines_agree_on_boundaries(self):
+        for engine in set(EXTRACTORS) - {"substring", "spacy"}:
+            for text, expected in self.CASES.items():
+                with self.subTest(engine=engine, text=text):
+                    self.assertEqual(extract_skills_from_text(text, engine), expected)
+
+    def test_engine_comes_from_settings(self):
+        with override_settings(SKILLMATCH_SKILL_EXTRACTOR="regex"):
+            self.assertEqual(extractor_version()[-5:], "regex")
+            self.assertEqual(extract_skills_from_text("c++ / c"), "c, c++")
+        with override_settings(SKILLMATCH_SKILL_EXTRACTOR="core.skills.substring.SubstringMatcher"):
+            self.assertIn("c", extract_skills_from_text("c++").split(", "))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ImproperlyConfigured):
+            build_extractor("nope")
+
+    @override_settings(SKILLMATCH_SPACY_MODEL="blank:en")
+    def test_spacy_engine(self):
+        try:
+            import spacy  # noqa: F401
+        except ImportError:
+            self.skipTest("spacy package not installed")
+        for text, expected in self.CASES.items():
+            with self.subTest(text=text):
+                self.assertEqual(extract_skills_from_text(text, "spacy"), expected)
+        # nlp.pipe batches give the same results as one document at a time
+        self.assertEqual(extract_skills_many(list(self.CASES), "spacy"), list(self.CASES.values()))
+        with override_settings(SKILLMATCH_SPACY_MODEL="no_such_model"):
+            with self.assertRaises(ImproperlyConfigured):
+                build_extractor("spacy")
+
+    def test_compare_extractors_scores_the_labelled_corpus(self):
+        out = StringIO()
+        call_command("compare_extractors", "--engines", "regex,automaton", "--repeat", "1", "--json", stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["documents"], 8)
+        self.assertTrue(report["labels"].endswith("labels.json"))
+        for engine in ("regex", "automaton"):
+            with self.subTest(engine=engine):
+                self.assertEqual(report["engines"][engine]["recall"], 1.0)
+                self.assertGreater(report["engines"][engine]["precision"], 0.9)
+
+
+@inline_settings
+class IngestResumesTests(TestCase):
+    """core.ingest: bulk import with content de-duplication and an error report."""
+
+    RESUME = (
+        "Curriculum Vitae\nEducation: B.Tech in Computer Science\n"
+        "Experience: internship building web services with Python, Django and SQL.\n"
+        "Project: data pipelines on AWS with Docker. " * 3
+    )
+
+    def setUp(self):
+        cache.clear()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+        media.enable()
+        self.addCleanup(media.disable)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.job = Job.objects.create(title="Backend", required_skills="python, django, react", description="")
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(text)
+
+    def test_ingest_dedupes_and_reports_errors(self):
+        self.write("a.txt", self.RESUME)
+        self.write("nested/a-copy.txt", self.RESUME)
+        self.write("b.txt", self.RESUME.replace("Docker", "Java"))
+        self.write("short.txt", "hello")
+        self.write("notes.md", self.RESUME)
+
+        paths = find_resume_files(self.directory)
+        self.assertEqual(len(paths), 4)
+        stats = ingest(paths, batch_size=2)
+
+        self.assertEqual((stats.imported, stats.scores, len(stats.duplicates)), (2, 2, 1))
+        self.assertEqual([os.path.basename(p) for p, _ in stats.errors], ["short.txt"])
+        resume = Resume.objects.get(file__endswith="a.txt")
+        self.assertEqual(resume.sha256, hashlib.sha256(self.RESUME.encode()).hexdigest())
+        self.assertIn("python", sorted(resume.skill_tags.values_list("name", flat=True)))
+        # resume skills only link to existing Skills
+        self.assertFalse(Skill.objects.filter(name="docker").exists())
+        self.assertEqual(Score.objects.get(resume=resume).recommended_skills, "react")
+
+        # a second run finds everything already imported
+        again = ingest(find_resume_files(self.directory))
+        self.assertEqual((again.imported, len(again.duplicates)), (0, 3))
+
+
+class CacheTierTestsMixin:
+    """
+    core.cache and the cached score_list fragment against one CACHES
+    backend; subclasses pick the backend.
+    """
+
+    def cache_settings(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        override = override_settings(CACHES={"default": {**self.cache_settings(), "KEY_PREFIX": "skillmatch-test"}})
+        override.enable()
+        self.addCleanup(override.disable)
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_bump_orphans_old_keys(self):
+        first = make_key("things", 1)
+        self.assertEqual(get_or_set("things", [1], lambda: "old"), "old")
+        bump("things")
+        self.assertNotEqual(make_key("things", 1), first)
+        self.assertEqual(get_or_set("things", [1], lambda: "new"), "new")
+
+    def test_lost_version_does_not_revive_old_keys(self):
+        get_or_set("things", [1], lambda: "old")
+        cache.delete(VERSION_KEY.format(namespace="things"))
+        self.assertEqual(get_or_set("things", [1], lambda: "new"), "new")
+
+    def test_score_list_fragment(self):
+        user = User.objects.create_user("a@example.com")
+        resume = Resume.objects.create(user=user, file="resumes/a.pdf", skills="python")
+        job = Job.objects.create(title="Backend", required_skills="python", description="")
+        score = Score.objects.create(resume=resume, user=user, job=job, value=12.5)
+
+        self.client.get(reverse("score_list"))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("score_list"))
+        self.assertContains(response, "12.5%")
+        self.assertFalse([q for q in ctx.captured_queries if "core_score" in q["sql"]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            score.value = 87.5
+            score.save()
+        self.assertContains(self.client.get(reverse("score_list")), "87.5%")
+
+
+@inline_settings
+class LocMemCacheTierTests(CacheTierTestsMixin, TestCase):
+    def cache_settings(self):
+        return {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tier-tests"}
+
+
+@inline_settings
+class FileCacheTierTests(CacheTierTestsMixin, TestCase):
+    def cache_settings(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        return {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": directory}
+
+
+@inline_settings
+class RedisCacheTierTests(CacheTierTestsMixin, TestCase):
+    """
+    Runs against the Redis server given as SKILLMATCH_TEST_REDIS_URL, or
+    else against an in-process stand-in (core.tests_support.redis_standin).
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.url = os.environ.get("SKILLMATCH_TEST_REDIS_URL")
+        if not cls.url:
+            cls.standin = RedisStandIn().start()
+            cls.addClassCleanup(cls.standin.stop)
+            cls.url = cls.standin.url
+
+    def cache_settings(self):
+        try:
+            import redis  # noqa: F401
+        except ImportError:
+            self.skipTest("redis package not installed")
+        return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": self.url}
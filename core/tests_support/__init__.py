@@ -0,0 +1 @@
+"""Helpers used only by core.tests; nothing here is imported by the app."""
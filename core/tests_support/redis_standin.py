@@ -0,0 +1,211 @@
+"""
+In-process Redis-protocol stand-in for the cache tier tests.
+
+Speaks enough RESP2 for django.core.cache.backends.redis.RedisCache
+(GET / SET NX EX / MGET / MSET / DEL / EXISTS / INCRBY / EXPIRE / PERSIST
+/ FLUSHDB, MULTI / EXEC pipelines), keeps one in-memory keyspace and
+serves every connection on its own thread. Not a Redis replacement: no
+persistence, no eviction, no other data types.
+
+    with RedisStandIn() as server:
+        CACHES = {"default": {..., "LOCATION": server.url}}
+
+or `python -m core.tests_support.redis_standin 6399` to run one in the foreground.
+"""
+
+import socketserver
+import sys
+import threading
+import time
+
+
+class _Error(Exception):
+    pass
+
+
+class _Keyspace:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.data = {}          # key → (value, expires_at or None)
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry
+
+    def run(self, name, args):
+        handler = getattr(self, f"cmd_{name}", None)
+        if handler is None:
+            raise _Error(f"ERR unknown command '{name}'")
+        with self.lock:
+            return handler(*args)
+
+    def cmd_ping(self, *args):
+        return args[0] if args else "PONG"
+
+    def cmd_select(self, db):
+        return "OK"
+
+    def cmd_client(self, *args):
+        return "OK"
+
+    def cmd_get(self, key):
+        entry = self._live(key)
+        return entry[0] if entry else None
+
+    def cmd_mget(self, *keys):
+        return [self.cmd_get(key) for key in keys]
+
+    def cmd_set(self, key, value, *options):
+        options = [o.upper() for o in options]
+        expires_at = None
+        if b"EX" in options:
+            expires_at = time.monotonic() + int(options[options.index(b"EX") + 1])
+        if b"PX" in options:
+            expires_at = time.monotonic() + int(options[options.index(b"PX") + 1]) / 1000
+        if b"NX" in options and self._live(key):
+            return None
+        self.data[key] = (value, expires_at)
+        return "OK"
+
+    def cmd_mset(self, *pairs):
+        for key, value in zip(pairs[::2], pairs[1::2]):
+            self.data[key] = (value, None)
+        return "OK"
+
+    def cmd_del(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._live(key):
+                del self.data[key]
+                removed += 1
+        return removed
+
+    def cmd_exists(self, *keys):
+        return sum(1 for key in keys if self._live(key))
+
+    def cmd_incrby(self, key, delta):
+        entry = self._live(key)
+        try:
+            value = int(entry[0] if entry else 0) + int(delta)
+        except ValueError:
+            raise _Error("ERR value is not an integer or out of range")
+        self.data[key] = (str(value).encode(), entry[1] if entry else None)
+        return value
+
+    def cmd_incr(self, key):
+        return self.cmd_incrby(key, 1)
+
+    def cmd_expire(self, key, seconds):
+        entry = self._live(key)
+        if not entry:
+            return 0
+        self.data[key] = (entry[0], time.monotonic() + int(seconds))
+        return 1
+
+    def cmd_persist(self, key):
+        entry = self._live(key)
+        if not entry or entry[1] is None:
+            return 0
+        self.data[key] = (entry[0], None)
+        return 1
+
+    def cmd_flushdb(self, *args):
+        self.data.clear()
+        return "OK"
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):          # inline command (telnet / redis-cli)
+            return line.split()
+        args = []
+        for _ in range(int(line[1:])):
+            size = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def encode(self, reply):
+        if isinstance(reply, _Error):
+            return b"-" + str(reply).encode() + b"\r\n"
+        if reply is None:
+            return b"$-1\r\n"
+        if isinstance(reply, str):
+            return b"+" + reply.encode() + b"\r\n"
+        if isinstance(reply, int):
+            return b":%d\r\n" % reply
+        if isinstance(reply, list):
+            return b"*%d\r\n" % len(reply) + b"".join(self.encode(r) for r in reply)
+        return b"$%d\r\n" % len(reply) + reply + b"\r\n"
+
+    def execute(self, args):
+        try:
+            return self.server.keyspace.run(args[0].decode().lower(), args[1:])
+        except _Error as exc:
+            return exc
+        except (TypeError, ValueError, IndexError):
+            return _Error(f"ERR wrong arguments for '{args[0].decode()}' command")
+
+    def handle(self):
+        queued = None                          # commands between MULTI and EXEC
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            if not args:
+                continue
+            name = args[0].decode().lower()
+            if name == "multi":
+                queued, reply = [], "OK"
+            elif name == "exec":
+                reply = [self.execute(a) for a in queued or []]
+                queued = None
+            elif name == "discard":
+                queued, reply = None, "OK"
+            elif queued is not None:
+                queued.append(args)
+                reply = "QUEUED"
+            else:
+                reply = self.execute(args)
+            self.wfile.write(self.encode(reply))
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class RedisStandIn:
+    """A stand-in server on 127.0.0.1 (a free port unless given), serving from a thread."""
+
+    def __init__(self, port=0):
+        self.server = _Server(("127.0.0.1", port), _Handler)
+        self.server.keyspace = _Keyspace()
+        self.url = f"redis://127.0.0.1:{self.server.server_address[1]}/0"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="redis-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    standin = RedisStandIn(int(sys.argv[1]) if len(sys.argv) > 1 else 6379)
+    print(f"Redis stand-in on {standin.url}")
+    standin.server.serve_forever()
@@ -0,0 +1,124 @@
+"""
+TF-IDF engine behind core.matching: numpy / scipy / scikit-learn.
+
+The original scoring fitted a fresh TfidfVectorizer on the two-document
+corpus [resume skills, job skills] for every job and took the cosine of
+the two rows. That number only depends on the raw term counts of the pair:
+with smooth_idf and n=2, a term present in both documents gets idf 1 and a
+term present in only one of them gets 1 + ln(3/2). So the whole job catalog
+can be vectorized once and a resume scored against every job with a single
+sparse product, giving the same similarities as the per-pair version
+(within SCORE_TOLERANCE, i.e. float rounding only).
+
+Importing this module loads scipy and scikit-learn, so only core.matching
+imports it, on first use.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+
+# idf of a term that occurs in only one document of a two-document corpus
+_UNSHARED_IDF = 1.0 + math.log(3.0 / 2.0)
+_K2 = _UNSHARED_IDF ** 2
+
+# max absolute difference between SkillIndex and legacy_similarity()
+SCORE_TOLERANCE = 1e-9
+
+# same tokenisation as the legacy TfidfVectorizer(stop_words="english")
+_analyze = CountVectorizer(stop_words="english").build_analyzer()
+
+
+def legacy_similarity(skills_text, job_text):
+    """
+    Reference implementation: the per-pair TF-IDF + cosine similarity
+    that upload_resume used before the job index existed.
+    """
+    vectorizer = TfidfVectorizer(stop_words="english")
+    tfidf = vectorizer.fit_transform([skills_text, job_text])
+    return float(cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0])
+
+
+class SkillIndex:
+    """
+    Term-count matrix over a fixed list of documents (usually the
+    required_skills of every Job), scored against one query at a time.
+
+    For every row b and query a we need:
+        dot       = Σ a_t·b_t              (terms shared by both)
+        a_shared  = Σ a_t²  over t ∈ b
+        b_shared  = Σ b_t²  over t ∈ a
+    which are the three columns of  [B | B>0 | B²] @ blockdiag(a, a², a>0),
+    computed in one sparse matmul.
+    """
+
+    def __init__(self, ids, texts):
+        self.ids = list(ids)
+        self.texts = [text or "" for text in texts]
+        self.vocabulary = {}
+
+        indptr, indices, data = [0], [], []
+        for text in self.texts:
+            counts = Counter(_analyze(text))
+            for term, count in counts.items():
+                indices.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+
+        n_terms = len(self.vocabulary)
+        counts = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), indices, indptr),
+            shape=(len(self.ids), n_terms),
+        )
+        present = counts.copy()
+        present.data[:] = 1.0
+
+        self._matrix = sparse.hstack(
+            [counts, present, counts.multiply(counts)], format="csr"
+        )
+        self._row_norm2 = np.asarray(counts.multiply(counts).sum(axis=1)).ravel()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def similarities(self, text):
+        """
+        Cosine similarity of `text` against every indexed document,
+        as an array aligned with self.ids.
+        """
+        if not self.ids:
+            return np.zeros(0)
+
+        counts = Counter(_analyze(text or ""))
+        query_norm2 = float(sum(c * c for c in counts.values()))
+
+        n_terms = len(self.vocabulary)
+        rows, cols, vals = [], [], []
+        for term, count in counts.items():
+            col = self.vocabulary.get(term)
+            if col is None:
+                continue
+            rows += [col, n_terms + col, 2 * n_terms + col]
+            cols += [0, 1, 2]
+            vals += [count, count * count, 1.0]
+
+        query = sparse.csr_matrix(
+            (np.asarray(vals, dtype=np.float64), (rows, cols)),
+            shape=(3 * n_terms, 3),
+        )
+        result = (self._matrix @ query).toarray()
+        dot, query_shared, row_shared = result[:, 0], result[:, 1], result[:, 2]
+
+        # terms present in only one of the two documents are weighted by _UNSHARED_IDF
+        query_weighted = _K2 * query_norm2 - (_K2 - 1.0) * query_shared
+        row_weighted = _K2 * self._row_norm2 - (_K2 - 1.0) * row_shared
+        denom = np.sqrt(query_weighted * row_weighted)
+
+        sims = np.zeros(len(self.ids))
+        np.divide(dot, denom, out=sims, where=denom > 0)
+        return sims
@@ -4,83 +4,26 @@ from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.models import User
-
-from .models import Job, Resume, Score, Applicant
-
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-import io
-from PyPDF2 import PdfReader
-from docx import Document
-
-
-# =========================
-#   SIMPLE NLP UTILITIES
-# =========================
-
-SKILL_KEYWORDS = [
-    "python", "java", "c++", "c", "html", "css", "javascript", "react",
-    "angular", "node", "django", "flask", "spring", "sql", "mysql",
-    "postgresql", "mongodb", "oracle", "git", "github", "docker", "aws",
-    "azure", "gcp", "pandas", "numpy", "matplotlib", "tensorflow", "keras",
-    "pytorch", "machine learning", "deep learning", "nlp", "data analysis",
-    "data science", "excel", "power bi", "tableau", "linux"
-]
-
-
-def extract_text_from_resume(uploaded_file):
-    """
-    Read text from an uploaded resume file (PDF/DOCX/others).
-    Returns plain text.
-    """
-    filename = uploaded_file.name.lower()
-    file_bytes = uploaded_file.read()
-    uploaded_file.seek(0)  # reset pointer so Django can save the file
-
-    text = ""
-
-    if filename.endswith(".pdf"):
-        try:
-            reader = PdfReader(io.BytesIO(file_bytes))
-            for page in reader.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
-        except Exception:
-            text = ""
-
-    elif filename.endswith(".docx"):
-        try:
-            doc = Document(io.BytesIO(file_bytes))
-            text = "\n".join(p.text for p in doc.paragraphs)
-        except Exception:
-            text = ""
-
-    else:
-        # fallback for txt-like files
-        try:
-            text = file_bytes.decode(errors="ignore")
-        except Exception:
-            text = ""
-
-    return text
-
-
-def extract_skills_from_text(text: str) -> str:
-    """
-    Very simple NLP-style skill extraction:
-    Looks for known skill keywords in the resume text.
-    Returns comma-separated skills.
-    """
-    text_lower = text.lower()
-    found = []
-    for skill in SKILL_KEYWORDS:
-        if skill in text_lower:
-            found.append(skill)
-
-    unique_sorted = sorted(set(found))
-    return ", ".join(unique_sorted)
-
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views.decorators.http import require_POST
+
+import csv
+import json
+import math
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from . import job_catalog, metrics, resume_cache
+from .models import Job, Resume, ResumeAnalysis, Score, Applicant
+from .analysis import extract_text_from_resume  # noqa: F401
+from .cache import version
+from .scoring import SCORES_NAMESPACE
+from .skills import SKILL_KEYWORDS, extract_skills_from_text  # noqa: F401
+from .tasks import enqueue_analysis, run_inline
 
 # =========================
 #         PUBLIC PAGES
@@ -95,24 +38,15 @@ def home(request):
 from django.db.models import Q
 
 def job_list(request):
-    jobs = Job.objects.all()
-    applied_job_ids = []
-
-    if request.user.is_authenticated:
-        # Consider a job "applied" only if the score is SUBMITTED or later
-        applied_job_ids = (
-            Score.objects
-            .filter(
-                resume__user=request.user,
-                status__in=["SUBMITTED", "SHORTLISTED", "REJECTED"],
-            )
-            .values_list("job_id", flat=True)
-            .distinct()
-        )
-
+    # both come from the cache (see core.job_catalog); a job counts as
+    # "applied" only if the score is SUBMITTED or later. The job cards are one
+    # fragment shared by every visitor, so `jobs` is lazy and a cached
+    # fragment doesn't even look it up; the applied ids are rendered outside it.
     return render(request, "job_list.html", {
-        "jobs": jobs,
-        "applied_job_ids": applied_job_ids,
+        "jobs": SimpleLazyObject(job_catalog.get_jobs),
+        "applied_job_ids": job_catalog.get_applied_job_ids(request.user),
+        "fragment_version": job_catalog.fragment_version(),
+        "fragment_timeout": _fragment_timeout(),
     })
 
 # =========================
@@ -129,95 +63,38 @@ def upload_resume(request):
     if request.method == "POST" and request.FILES.get("resume"):
         file = request.FILES["resume"]
 
-        # 1) Extract text from resume
-        resume_text = extract_text_from_resume(file)
-        cleaned = (resume_text or "").strip()
+        # Extra skills typed by user (OPTIONAL, added on top)
+        extra_skills = request.POST.get("skills", "").strip()
 
-        # 2) Basic validation to ensure it looks like a resume
-        RESUME_KEYWORDS = [
-            "education", "experience", "skills", "project",
-            "b.tech", "btech", "bachelor", "masters", "internship",
-            "curriculum vitae", "resume"
-        ]
+        # 1) Save resume itself and queue the analysis
+        resume = Resume.objects.create(user=request.user, file=file)
+        task = enqueue_analysis(resume, extra_skills)
 
-        if len(cleaned) < 200 or not any(k in cleaned.lower() for k in RESUME_KEYWORDS):
-            messages.error(
+        if getattr(settings, "SKILLMATCH_ANALYSIS_ASYNC", True):
+            messages.info(
                 request,
-                "The uploaded file does not look like a valid resume. "
-                "Please upload a proper resume (PDF/DOCX) with your details."
+                "Resume uploaded. It is being analysed now – your draft "
+                "applications will appear here in a moment."
             )
-            return redirect("upload_resume")
+            return redirect("my_applications")
 
-        # 3) Auto-extract skills from resume text
-        extracted_skills = extract_skills_from_text(cleaned)
+        # 2) No worker configured: analyse within this request
+        task = run_inline(task)
 
-        if not extracted_skills:
-            messages.error(
-                request,
-                "No technical skills were detected in your resume. "
-                "Please clearly list your skills (e.g. 'Python, Django, SQL') "
-                "in your resume and upload again."
-            )
+        if task.status == "FAILED" and task.resume is None:
+            messages.error(request, task.error)
             return redirect("upload_resume")
 
-        # 4) Extra skills typed by user (OPTIONAL, added on top)
-        extra_skills = request.POST.get("skills", "").strip()
-
-        all_skills = [extracted_skills]
-        if extra_skills:
-            all_skills.append(extra_skills)
-
-        skills_text = ", ".join(all_skills)
-
-        # 5) Save resume itself
-        resume = Resume.objects.create(
-            user=request.user,
-            file=file,
-            skills=skills_text,
-        )
-
-        # 6) Create draft scores only for jobs not already applied by this user
-        jobs = Job.objects.all()
-        created_any = False
-
-        for job in jobs:
-            # stop duplicate applications for same job & user
-            already_exists = Score.objects.filter(
-                job=job,
-                resume__user=request.user,
-            ).exists()
-
-            if already_exists:
-                continue
-
-            job_text = job.required_skills or ""
-
-            # TF-IDF + cosine similarity
-            vectorizer = TfidfVectorizer(stop_words="english")
-            tfidf = vectorizer.fit_transform([skills_text, job_text])
-            sim = cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0]
-            score_value = round(float(sim) * 100, 2)
-
-            user_skills_set = {
-                s.strip().lower() for s in skills_text.split(",") if s.strip()
-            }
-            job_skills_set = {
-                s.strip().lower() for s in (job.required_skills or "").split(",") if s.strip()
-            }
-            missing_skills = ", ".join(sorted(job_skills_set - user_skills_set))
-
-            Score.objects.create(
-                resume=resume,
-                job=job,
-                value=score_value,
-                recommended_skills=missing_skills,
-                status="DRAFT",          # applicant still editing
-                is_shortlisted=False,
+        if task.status != "DONE":
+            # retried inline up to max_attempts already; there is no worker to try again later
+            messages.error(
+                request,
+                "Your resume could not be analysed right now. "
+                "Please try uploading it again in a few minutes."
             )
+            return redirect("my_applications")
 
-            created_any = True
-
-        if not created_any:
+        if not task.scores_created:
             messages.warning(
                 request,
                 "You have already created applications for all current jobs. "
@@ -246,16 +123,52 @@ def my_applications(request):
     """
     scores = (
         Score.objects
-        .filter(resume__user=request.user)
+        .filter(user=request.user)
         .select_related("job", "resume")
         .order_by("-id")   # ✅ FIX: we use -id instead of -created_at
     )
-    return render(request, "my_applications.html", {"scores": scores})
+    return render(request, "my_applications.html", {
+        "scores": scores,
+        "analyses": _recent_analyses(request.user),
+    })
+
+
+def _recent_analyses(user):
+    """Analyses still in the queue, plus failures from the last day."""
+    since = timezone.now() - timedelta(days=1)
+    return list(
+        ResumeAnalysis.objects
+        .filter(user=user)
+        .filter(Q(status__in=["QUEUED", "RUNNING"]) | Q(status="FAILED", finished_at__gte=since))
+        .order_by("-id")[:5]
+    )
+
+
+@login_required
+def analysis_status(request):
+    """
+    Polled by my_applications while an upload is being analysed.
+    """
+    analyses = _recent_analyses(request.user)
+    return JsonResponse({
+        "pending": any(a.status in ("QUEUED", "RUNNING") for a in analyses),
+        "analyses": [
+            {
+                "id": a.id,
+                "file": a.file_name,
+                "status": a.status,
+                "attempts": a.attempts,
+                "error": a.error,
+                "scores_created": a.scores_created,
+            }
+            for a in analyses
+        ],
+    })
 
 
 @login_required
 def submit_application(request, score_id):
-    score = get_object_or_404(Score, id=score_id, resume__user=request.user)
+    score = get_object_or_404(Score, id=score_id, user=request.user)
 
     if score.status != "DRAFT":
         messages.info(request, "This application is already submitted.")
@@ -272,20 +185,208 @@ def submit_application(request, score_id):
 #   RECRUITER / ADMIN
 # =========================
 
+def _fragment_timeout():
+    return getattr(settings, "SKILLMATCH_FRAGMENT_CACHE_TIMEOUT", 300)
+
+
 def score_list(request):
+    # lazy queryset: only evaluated when the cached fragment is stale
     scores = Score.objects.select_related('resume', 'job').order_by('-value')
-    return render(request, 'score_list.html', {'scores': scores})
+    return render(request, 'score_list.html', {
+        'scores': scores,
+        'fragment_version': f"{version(SCORES_NAMESPACE)}-{version(job_catalog.JOBS_NAMESPACE)}",
+        'fragment_timeout': _fragment_timeout(),
+    })
+
+
+DASHBOARD_PAGE_SIZE = 50
+DASHBOARD_STATUSES = ["SUBMITTED", "SHORTLISTED", "REJECTED"]
+MAX_TOP_CANDIDATES = 500
+
+
+MAX_DB_INT = 2**63 - 1   # bigint; larger ids overflow the database driver
+
+
+def _int_param(request, name, minimum=None, maximum=None):
+    """?name= as an int, None if missing, malformed or below `minimum`; capped at `maximum`."""
+    try:
+        value = int(request.GET.get(name, ""))
+    except ValueError:
+        return None
+    if abs(value) > MAX_DB_INT:
+        return None
+    if minimum is not None and value < minimum:
+        return None
+    if maximum is not None:
+        value = min(maximum, value)
+    return value
+
+
+def _parse_cursor(raw):
+    """'job_id:value:score_id' → (int, float, int), or None if malformed."""
+    try:
+        job_id, value, score_id = raw.split(":")
+        cursor = int(job_id), float(value), int(score_id)
+    except (AttributeError, ValueError):
+        return None
+    if abs(cursor[0]) > MAX_DB_INT or abs(cursor[2]) > MAX_DB_INT or not math.isfinite(cursor[1]):
+        return None
+    return cursor
+
+
+def _application_filters(request):
+    """?job= / ?status= / ?min_score= shared by the dashboard and the export."""
+    job_id = _int_param(request, "job")
+    status = request.GET.get("status", "")
+    if status not in DASHBOARD_STATUSES:
+        status = ""
+    try:
+        min_score = float(request.GET.get("min_score", ""))
+    except ValueError:
+        min_score = None
+    if min_score is not None and not math.isfinite(min_score):
+        min_score = None
+
+    scores = Score.objects.submitted()
+    if job_id:
+        scores = scores.filter(job_id=job_id)
+    if status:
+        scores = scores.filter(status=status)
+    if min_score is not None:
+        scores = scores.filter(value__gte=min_score)
+
+    filters = {
+        "job": job_id or "",
+        "status": status,
+        "min_score": "" if min_score is None else request.GET.get("min_score"),
+    }
+    return scores, filters
 
 
 @staff_member_required
 def recruiter_dashboard(request):
-    # Show all scores grouped by job, highest score first
-    scores = (
-        Score.objects
-        .select_related('resume', 'job', 'resume__user')
-        .order_by('job__title', '-value')
+    """
+    Submitted applications, filterable by job / status / minimum score.
+    Pages are keyset-paginated on (job, -value, id) via ?cursor=, so every
+    page costs the same however many applications exist. With ?top=K the
+    page instead shows the best K candidates of every job.
+    """
+    scores, filters = _application_filters(request)
+    top = _int_param(request, "top", minimum=1, maximum=MAX_TOP_CANDIDATES)
+    filters["top"] = top or ""
+    # the template shows resume.user.applicant for every row
+    scores = scores.select_related('job', 'resume__user__applicant')
+    next_cursor = None
+
+    if top:
+        page = list(scores.top_per_job(top).order_by('job__title', 'job_id', 'rank'))
+    else:
+        cursor = _parse_cursor(request.GET.get("cursor"))
+        if cursor:
+            scores = scores.after(*cursor)
+        page = list(scores.dashboard_order()[:DASHBOARD_PAGE_SIZE + 1])
+        if len(page) > DASHBOARD_PAGE_SIZE:
+            page = page[:DASHBOARD_PAGE_SIZE]
+            last = page[-1]
+            next_cursor = f"{last.job_id}:{last.value!r}:{last.id}"
+
+    next_query = None
+    if next_cursor:
+        params = {k: v for k, v in filters.items() if v != ""}
+        params["cursor"] = next_cursor
+        next_query = urlencode(params)
+
+    export_query = urlencode({k: v for k, v in filters.items() if v != "" and k != "top"})
+
+    return render(request, 'recruiter_dashboard.html', {
+        'scores': page,
+        'jobs': Job.objects.only('id', 'title').order_by('title'),
+        'statuses': DASHBOARD_STATUSES,
+        'filters': filters,
+        'is_first_page': 'cursor' not in request.GET,
+        'next_query': next_query,
+        'export_query': export_query,
+    })
+
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FIELDS = [
+    ("id", "id"),
+    ("job_id", "job_id"),
+    ("job_title", "job__title"),
+    ("applicant_name", "user__applicant__full_name"),
+    ("applicant_email", "user__email"),
+    ("username", "user__username"),
+    ("score", "value"),
+    ("status", "status"),
+    ("recommended_skills", "recommended_skills"),
+    ("resume_file", "resume__file"),
+]
+
+
+class _Echo:
+    """File-like object whose write() returns the line instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def _export_rows(scores):
+    """Plain value tuples, fetched from a server-side cursor in chunks."""
+    return (
+        scores
+        .dashboard_order()
+        .values_list(*[lookup for _, lookup in EXPORT_FIELDS])
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
     )
-    return render(request, 'recruiter_dashboard.html', {'scores': scores})
+
+
+# a spreadsheet evaluates a cell starting with one of these as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_cell(value):
+    """Applicant-typed text (names, extra skills) with a leading ' if it would be run as a formula."""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in EXPORT_FIELDS])
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def _jsonl_lines(rows):
+    names = [name for name, _ in EXPORT_FIELDS]
+    for row in rows:
+        yield json.dumps(dict(zip(names, row))) + "\n"
+
+
+@staff_member_required
+def export_applications(request):
+    """
+    Submitted applications (same ?job= / ?status= / ?min_score= filters as
+    the dashboard) as CSV, or JSON Lines with ?format=jsonl. Rows are
+    streamed as they are read, so memory use doesn't depend on the row
+    count and the download starts right away. CSV cells that a
+    spreadsheet would run as a formula are prefixed with ' (JSON Lines
+    keeps the raw values).
+    """
+    scores, _ = _application_filters(request)
+    rows = _export_rows(scores)
+    stamp = timezone.now().strftime("%Y%m%d-%H%M%S")
+
+    if request.GET.get("format") == "jsonl":
+        response = StreamingHttpResponse(_jsonl_lines(rows), content_type="application/x-ndjson")
+        filename = f"applications-{stamp}.jsonl"
+    else:
+        response = StreamingHttpResponse(_csv_lines(rows), content_type="text/csv")
+        filename = f"applications-{stamp}.csv"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
 
 @staff_member_required
@@ -294,10 +395,53 @@ def toggle_shortlist(request, score_id):
     # toggle shortlist & status
     score.is_shortlisted = not score.is_shortlisted
     score.status = "SHORTLISTED" if score.is_shortlisted else "REJECTED"
-    score.save()
+    score.save(update_fields=["is_shortlisted", "status"])
     return redirect('recruiter_dashboard')
 
 
+MAX_BULK_DECISIONS = 1000
+DECISIONS = {"shortlist": "SHORTLISTED", "reject": "REJECTED"}
+
+
+@staff_member_required
+@require_POST
+def decide_applications(request):
+    """
+    Shortlist or reject every selected application (?score_ids=…,
+    action=shortlist|reject) with a single UPDATE, then go back to the
+    dashboard page the recruiter came from.
+    """
+    status = DECISIONS.get(request.POST.get("action"))
+    # isdigit() would accept "²", which int() rejects
+    ids = [int(v) for v in request.POST.getlist("score_ids") if v.isdecimal()]
+    ids = [i for i in ids if i <= MAX_DB_INT][:MAX_BULK_DECISIONS]
+
+    if status is None:
+        messages.error(request, "Unknown decision.")
+    elif not ids:
+        messages.warning(request, "No applications selected.")
+    else:
+        updated = Score.objects.filter(id__in=ids).decide(status)
+        messages.success(request, f"{updated} application(s) marked {status.lower()}.")
+
+    next_url = request.POST.get("next", "")
+    if url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect('recruiter_dashboard')
+
+
+@staff_member_required
+def view_metrics(request):
+    """
+    Per-view latency / DB time / query-count histograms of this worker
+    process, plus the extraction cache counters.
+    """
+    return JsonResponse({
+        "views": metrics.snapshot(),
+        "extraction_cache": resume_cache.stats(),
+    })
+
+
 # =========================
 #     AUTH VIEWS
 # =========================
@@ -0,0 +1,58 @@
+"""
+Process warm-up for pre-forking servers.
+
+gunicorn.conf.py calls warm_up() in the master after the app is preloaded
+and before any worker is forked, so the skill extractor, the TF-IDF job
+index, the scipy / scikit-learn modules and the compiled templates are
+built once and shared copy-on-write by every worker instead of being
+rebuilt on each worker's first request.
+"""
+
+import gc
+import logging
+import time
+
+from django.db import DatabaseError, connections
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES = [
+    "base.html", "home.html", "job_list.html", "score_list.html", "upload_resume.html",
+    "my_applications.html", "recruiter_dashboard.html", "login.html", "register.html",
+]
+
+
+def warm_up():
+    """Build the shared matching state; returns {step: milliseconds}."""
+    from . import matching
+    from .skills import get_extractor
+
+    timings = {}
+
+    def step(name, fn):
+        start = time.perf_counter()
+        fn()
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+    step("skill_extractor", get_extractor)
+    step("tfidf_engine", lambda: matching.SkillIndex)
+    try:
+        step("job_index", matching.get_job_index)
+    except DatabaseError:
+        # no database yet (first deploy before migrate): workers build it lazily
+        logger.warning("Warm-up skipped the job index", exc_info=True)
+    step("templates", lambda: [get_template(name) for name in TEMPLATES])
+    return timings
+
+
+def prepare_fork():
+    """
+    Run just before forking: drop database connections (a socket / SQLite
+    handle must not be shared across processes) and move everything
+    allocated so far into the permanent GC generation, so the workers'
+    collections don't touch – and copy – those pages.
+    """
+    connections.close_all()
+    gc.collect()
+    gc.freeze()
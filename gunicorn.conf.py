@@ -0,0 +1,45 @@
+"""
+Gunicorn settings for SkillMatch (picked up automatically from the
+working directory: `gunicorn` with no arguments).
+
+The app is preloaded in the master and warmed up (skill automaton, job
+index, scikit-learn, templates; see core.warmup) before the workers are
+forked, so workers start ready to serve and share that memory.
+
+Environment:
+  PORT                   listen port (default 8000)
+  WEB_CONCURRENCY        worker processes (default 2)
+  GUNICORN_WORKER_CLASS  "sync" (default) or "gthread"
+  GUNICORN_THREADS       threads per gthread worker (default 4)
+  GUNICORN_PRELOAD       "0" to load the app in every worker instead
+  GUNICORN_MAX_REQUESTS  recycle a worker after this many requests (0 = never)
+"""
+
+import os
+
+wsgi_app = "skillmatch.wsgi:application"
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "sync")
+if worker_class == "gthread":
+    threads = int(os.environ.get("GUNICORN_THREADS", "4"))
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") == "1"
+
+# recycled workers are re-forked from the warm master, so they stay shared
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+timeout = 60          # uploads are analysed inline when no run_worker is deployed
+accesslog = "-"
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from core.warmup import prepare_fork, warm_up
+
+    timings = warm_up()
+    server.log.info("SkillMatch warm-up done: %s", timings)
+    prepare_fork()
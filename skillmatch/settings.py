@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -46,6 +47,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.ViewMetricsMiddleware',       # per-view timings, see /ops/metrics/
     'whitenoise.middleware.WhiteNoiseMiddleware',  # 👈 add this line
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -137,3 +139,84 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 LOGIN_URL = 'login'          # uses url name 'login' → /login/
 LOGIN_REDIRECT_URL = 'home'  # after login, go to home page
+
+
+# SkillMatch: rescoring of a job's applications after its skills change
+SKILLMATCH_RESCORE_ASYNC = True       # run in a background thread, off the request
+SKILLMATCH_RESCORE_BATCH_SIZE = 500   # resumes per batch / transaction
+SKILLMATCH_RESCORE_LEASE_SECONDS = 300  # RUNNING with no progress for longer → its thread died
+SKILLMATCH_RESCORE_MAX_ATTEMPTS = 3
+SKILLMATCH_RESCORE_RETRY_SECONDS = 60   # run_worker retries a FAILED run after this long
+
+# SkillMatch: background resume analysis (manage.py run_worker)
+# Set SKILLMATCH_ANALYSIS_ASYNC=0 to analyse inside the upload request when no worker runs.
+SKILLMATCH_ANALYSIS_ASYNC = os.environ.get("SKILLMATCH_ANALYSIS_ASYNC", "1") == "1"
+SKILLMATCH_ANALYSIS_MAX_ATTEMPTS = 3
+SKILLMATCH_ANALYSIS_BACKOFF_SECONDS = 10        # 10s, 20s, 40s, ... between retries
+SKILLMATCH_ANALYSIS_BACKOFF_MAX_SECONDS = 600
+SKILLMATCH_ANALYSIS_LEASE_SECONDS = 300         # RUNNING longer than this → worker died, requeue
+
+# SkillMatch: content-hash cache of extracted resume text (LRU, evicted above this size)
+SKILLMATCH_EXTRACTION_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# SkillMatch: PDF/DOCX parsing in a pool of child processes (0 workers = parse in-process)
+SKILLMATCH_EXTRACTION_WORKERS = 2
+SKILLMATCH_EXTRACTION_TIMEOUT = 20                         # seconds per document, then the child is killed
+SKILLMATCH_EXTRACTION_MAX_PAGES = 30
+SKILLMATCH_EXTRACTION_MAX_FILE_BYTES = 10 * 1024 * 1024
+SKILLMATCH_EXTRACTION_MEMORY_LIMIT = 512 * 1024 * 1024     # address space per child
+SKILLMATCH_EXTRACTION_MAX_TASKS_PER_CHILD = 100
+
+# SkillMatch: skill extraction engine: "automaton" (Aho-Corasick), "regex" (one compiled
+# alternation), "spacy" (PhraseMatcher), "substring" (the original loop) or a dotted path;
+# see core.skills.EXTRACTORS
+SKILLMATCH_SKILL_EXTRACTOR = os.environ.get("SKILLMATCH_SKILL_EXTRACTOR", "automaton")
+
+# SkillMatch: the "spacy" engine (PhraseMatcher): pipeline to take the tokenizer from
+# ("blank:en" needs no model download) and documents per nlp.pipe batch in bulk imports
+SKILLMATCH_SPACY_MODEL = os.environ.get("SKILLMATCH_SPACY_MODEL", "en_core_web_sm")
+SKILLMATCH_SPACY_BATCH_SIZE = int(os.environ.get("SKILLMATCH_SPACY_BATCH_SIZE", "64"))
+
+# Cache tier, chosen with SKILLMATCH_CACHE:
+#   "locmem" (default)    per-process LRU, nothing shared between gunicorn workers
+#   "file"                shared by every worker on one host (SKILLMATCH_CACHE_DIR)
+#   "redis://host:6379/0" shared by every host; any Redis-protocol server
+SKILLMATCH_CACHE = os.environ.get("SKILLMATCH_CACHE", "locmem")
+if SKILLMATCH_CACHE.startswith(("redis://", "rediss://", "unix://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": SKILLMATCH_CACHE,
+            "KEY_PREFIX": "skillmatch",
+        }
+    }
+elif SKILLMATCH_CACHE == "file":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ.get(
+                "SKILLMATCH_CACHE_DIR", os.path.join(tempfile.gettempdir(), "skillmatch-cache")
+            ),
+            "KEY_PREFIX": "skillmatch",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "skillmatch",
+            "KEY_PREFIX": "skillmatch",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
+    }
+
+# SkillMatch: {% cache %} lifetime of the job_list / score_list tables; the
+# fragments are keyed on cache namespace versions, so changes show up at once
+SKILLMATCH_FRAGMENT_CACHE_TIMEOUT = 300
+
+# SkillMatch: cached job catalog / per-user applied job ids for job_list (core.job_catalog)
+SKILLMATCH_JOB_CACHE_TIMEOUT = 600   # seconds; signals invalidate earlier on every change
+
+# SkillMatch: per-view wall/DB time and query-count histograms (core.middleware)
+SKILLMATCH_VIEW_METRICS = True
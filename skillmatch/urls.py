@@ -14,6 +14,7 @@ urlpatterns = [
     # applicant flow
     path("upload/", views.upload_resume, name="upload_resume"),
     path("my-applications/", views.my_applications, name="my_applications"),
+    path("my-applications/status/", views.analysis_status, name="analysis_status"),
     path("applications/<int:score_id>/submit/",views.submit_application,name="submit_application",),
 
     # scores (global view – mostly for demo)
@@ -35,6 +36,19 @@ urlpatterns = [
         views.toggle_shortlist,
         name="toggle_shortlist",
     ),
+    path(
+        "recruiter/decide/",
+        views.decide_applications,
+        name="decide_applications",
+    ),
+    path(
+        "recruiter/export/",
+        views.export_applications,
+        name="export_applications",
+    ),
+
+    # ops
+    path("ops/metrics/", views.view_metrics, name="view_metrics"),
 ]
 
 if settings.DEBUG: